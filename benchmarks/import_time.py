@@ -0,0 +1,132 @@
+"""Benchmark import time of the headless entry points.
+
+Each module is imported in a fresh interpreter with `-X importtime`. The cumulative import time is
+compared against a budget, and the modules loaded are checked for heavy optional dependencies that
+the headless core must not pull in.
+
+The budgets are only checked by the tests when CHECK_IMPORT_TIME is set, since wall-clock times
+depend on the machine. Otherwise the tests check several times looser budgets. The forbidden modules
+are always checked, also after solving a maze headless through main.
+
+Run from project root: python -m benchmarks.import_time
+"""
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+
+IMPORT_TIME_BUDGETS_US: dict[str, int] = {
+    "maze": 20_000,
+    "maze.maze": 100_000,
+    "maze.routefinder": 100_000,
+    "main": 150_000,
+}
+"""Max cumulative import time in microseconds of each headless module."""
+
+LOOSE_BUDGET_FACTOR: int = 5
+"""Factor of the budgets that the tests always check.
+
+Loose enough for slow or busy machines, but still catches e.g. a heavy import added to the core.
+"""
+
+FORBIDDEN_MODULES: tuple[str, ...] = (
+    "PySimpleGUI",
+    "tkinter",
+    "gui",
+    "sqlite3",
+    "multiprocessing",
+    "concurrent.futures",
+    "mmap",
+)
+"""Modules (and their submodules) that must not be loaded by the headless modules."""
+
+
+@dataclass
+class ImportTime:
+    """Class representing the result of importing a module in a fresh interpreter."""
+
+    module: str
+    cumulative_us: int
+    loaded_modules: set[str]
+
+    def forbidden_modules(self) -> list[str]:
+        """Get the loaded modules that are forbidden."""
+        return find_forbidden_modules(self.loaded_modules)
+
+
+def find_forbidden_modules(loaded_modules: set[str]) -> list[str]:
+    """Get the forbidden modules among the loaded modules."""
+    return sorted(
+        loaded for loaded in loaded_modules
+        if any(
+            loaded == forbidden or loaded.startswith(f"{forbidden}.")
+            for forbidden in FORBIDDEN_MODULES
+        )
+    )
+
+
+def measure_import_time(module: str) -> ImportTime:
+    """Import module in a fresh interpreter and measure its cumulative import time.
+
+    Raises:
+        subprocess.CalledProcessError: Importing the module failed.
+    """
+    completed_process = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sys, {module}; print('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    cumulative_us = 0
+    # Lines are formatted as "import time: self [us] | cumulative | imported package".
+    for line in completed_process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            cumulative_us = int(cumulative)
+    return ImportTime(module, cumulative_us, set(completed_process.stdout.split()))
+
+
+def headless_solve_modules(maze_name: str) -> set[str]:
+    """Solve a maze headless through main in a fresh interpreter and get the modules loaded.
+
+    The route is written to the null device, so only the module names are printed.
+
+    Raises:
+        subprocess.CalledProcessError: Solving the maze failed.
+    """
+    arguments = ["--solve", maze_name, "--output", os.devnull]
+    completed_process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, main; main.main({arguments!r}); print('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # The first line tells the route length.
+    return set(completed_process.stdout.splitlines()[1:])
+
+
+def main() -> None:
+    """Print import time and budget of each headless module."""
+    print(f"{'module':<20} {'ms':>8} {'budget':>8} {'forbidden'}")
+    for module, budget_us in IMPORT_TIME_BUDGETS_US.items():
+        import_time = measure_import_time(module)
+        print(
+            f"{module:<20} {import_time.cumulative_us / 1000:>8.1f} {budget_us / 1000:>8.1f} "
+            f"{', '.join(import_time.forbidden_modules()) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark scaling of the parallel breadth-first search.
+
+Run from project root: python -m benchmarks.parallel_bfs [size]
+"""
+import random
+import sys
+import time
+
+from maze.mazeblock import BLOCK_TYPE_CODES, BlockType
+from maze.mazegrid import MazeGrid
+from maze.parallelsearch import ParallelBFS
+
+WORKER_COUNTS: tuple[int, ...] = (1, 2, 4, 8)
+
+
+def create_random_grid(size: int, wall_ratio: float = 0.25, seed: int = 0) -> MazeGrid:
+    """Create a square grid with random walls, start at top left and exit at bottom right."""
+    rng = random.Random(seed)
+    solid = BLOCK_TYPE_CODES[BlockType.SOLID]
+    open_ = BLOCK_TYPE_CODES[BlockType.OPEN]
+    cell_codes = bytearray(
+        solid if rng.random() < wall_ratio else open_ for _ in range(size * size)
+    )
+    cell_codes[0] = BLOCK_TYPE_CODES[BlockType.START]
+    cell_codes[-1] = BLOCK_TYPE_CODES[BlockType.EXIT]
+    return MazeGrid.create(bytes(cell_codes), size, size)
+
+
+def main() -> None:
+    """Print search time and speedup for each worker count."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with create_random_grid(size) as grid:
+        print(f"Grid {size}x{size}")
+        print(f"{'workers':>8} {'seconds':>8} {'speedup':>8} {'route':>8}")
+        baseline: float | None = None
+        for workers in WORKER_COUNTS:
+            with ParallelBFS(grid, workers) as search:
+                started_at = time.perf_counter()
+                route = search.search()
+                seconds = time.perf_counter() - started_at
+            baseline = baseline if baseline is not None else seconds
+            route_length = "-" if route is None else str(len(route))
+            print(f"{workers:>8} {seconds:>8.3f} {baseline / seconds:>8.2f} {route_length:>8}")
+
+
+if __name__ == "__main__":
+    main()
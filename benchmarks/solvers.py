@@ -0,0 +1,124 @@
+"""Benchmark the registered solvers and store the results as calibration data of the auto solver.
+
+Each solver solves a set of generated mazes of different sizes, wall densities, exit counts, and
+shapes (random walls and corridors). The profile of each maze and the best solve times of the
+solvers are saved to maze/solver_calibration.json. Each timed solve is the first solve of a fresh
+solver, so the one-time work of solvers caching per maze state (e.g. the corridor graph) is
+included, the same way as when a maze is solved after loading it.
+
+Run from project root: python -m benchmarks.solvers [max size]
+"""
+import random
+import sys
+import time
+from typing import Callable
+
+from maze.maze import MazeFactory, SolvedRoute
+from maze.mazeblock import BlockFactory, BlockType, MazeBlock
+from maze.solvers import MazeProfile, SolverRegistry, create_default_registry, save_calibration
+
+REPEATS: int = 3
+_DATA_TO_BLOCK_TYPE_MAP = {
+    "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+}
+
+
+def create_random_rows(
+    size: int, wall_ratio: float, exit_count: int = 1, seed: int = 0
+) -> list[str]:
+    """Create a square maze with random walls, start at top left and exits in random cells."""
+    rng = random.Random(seed)
+    cells = [["#" if rng.random() < wall_ratio else " " for _ in range(size)] for _ in range(size)]
+    _place_start_and_exits(cells, exit_count, rng)
+    return ["".join(row) for row in cells]
+
+
+def create_corridor_rows(size: int, exit_count: int = 1, seed: int = 0) -> list[str]:
+    """Create a square maze of one cell wide corridors with a randomized depth-first search."""
+    rng = random.Random(seed)
+    cells = [["#"] * size for _ in range(size)]
+    cells[1][1] = " "
+    stack = [(1, 1)]
+    while stack:
+        row, column = stack[-1]
+        neighbours = [
+            (row + row_step, column + column_step)
+            for row_step, column_step in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < row + row_step < size - 1 and 0 < column + column_step < size - 1
+            and cells[row + row_step][column + column_step] == "#"
+        ]
+        if not neighbours:
+            stack.pop()
+            continue
+        next_row, next_column = rng.choice(neighbours)
+        cells[(row + next_row) // 2][(column + next_column) // 2] = " "
+        cells[next_row][next_column] = " "
+        stack.append((next_row, next_column))
+    _place_start_and_exits(cells, exit_count, rng)
+    return ["".join(row) for row in cells]
+
+
+def _place_start_and_exits(cells: list[list[str]], exit_count: int, rng: random.Random) -> None:
+    open_cells = [
+        (row, column)
+        for row, cell_row in enumerate(cells)
+        for column, cell in enumerate(cell_row)
+        if cell == " "
+    ]
+    start_row, start_column = open_cells[0]
+    cells[start_row][start_column] = "^"
+    for row, column in rng.sample(open_cells[1:], min(exit_count, len(open_cells) - 1)):
+        cells[row][column] = "E"
+
+
+def time_solvers(
+    create_registry: Callable[[], SolverRegistry], start_block: MazeBlock
+) -> dict[str, float]:
+    """Get the best first solve time in seconds of each registered solver.
+
+    Args:
+        create_registry: Function creating a registry with fresh solvers. Called for each solve,
+            so solvers caching state between solves are timed with the cache empty.
+        start_block: Start block of the maze to solve.
+    """
+    seconds: dict[str, float] = {}
+    for name in create_registry().names()[1:]:
+        best = float("inf")
+        for _ in range(REPEATS):
+            solver = create_registry().get(name)
+            start_block.epoch.advance()
+            started_at = time.perf_counter()
+            solver(start_block, SolvedRoute([]))
+            best = min(best, time.perf_counter() - started_at)
+        seconds[name] = best
+    return seconds
+
+
+def main() -> None:
+    """Benchmark solvers on generated mazes and save the calibration data."""
+    max_size = int(sys.argv[1]) if len(sys.argv) > 1 else 301
+    maze_factory = MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP))
+    mazes: list[list[str]] = []
+    for size in sorted({21, 101, max_size}):
+        for exit_count in (1, 16):
+            mazes.append(create_corridor_rows(size, exit_count))
+            for wall_ratio in (0.1, 0.3):
+                mazes.append(create_random_rows(size, wall_ratio, exit_count))
+
+    entries: list[tuple[MazeProfile, dict[str, float]]] = []
+    print(f"{'rows':>6} {'density':>8} {'exits':>6} {'corridor':>9}  seconds")
+    for rows in mazes:
+        blocks, start_block = maze_factory.create_maze_from_rows(rows)
+        profile = MazeProfile.from_blocks(blocks)
+        seconds = time_solvers(create_default_registry, start_block)
+        entries.append((profile, seconds))
+        print(
+            f"{profile.rows:>6} {profile.open_density:>8.2f} {profile.exit_count:>6} "
+            f"{profile.corridor_ratio:>9.2f}  "
+            + " ".join(f"{name}={value:.4f}" for name, value in seconds.items())
+        )
+    save_calibration(entries)
+
+
+if __name__ == "__main__":
+    main()
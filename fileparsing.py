@@ -1,4 +1,5 @@
 """File parsing related code."""
+import hashlib
 import os
 
 from types import TracebackType
@@ -6,10 +7,63 @@ from typing import Generator
 
 _DATA_DIR: str = "data"
 
+INVALID_CELL_CODE: int = 0xFF
+"""Code used in translation tables for bytes that do not represent any block type."""
+
+
+def get_data_dir() -> str:
+    """Get path of data dir."""
+    return _DATA_DIR
+
 
 def get_maze_file_names() -> list[str]:
-    """Get maze file names in data dir."""
-    return os.listdir(_DATA_DIR)
+    """Get maze file names in data dir in alphabetical order. Files starting with a dot are skipped.
+
+    Unlike MazeCatalogue (see mazecatalogue), the data dir is listed on every call.
+    """
+    return sorted(name for name in os.listdir(_DATA_DIR) if not name.startswith("."))
+
+
+def get_maze_file_path(file_name: str) -> str:
+    """Get path of a maze file in data dir.
+
+    Raises:
+        FileNotFoundError: Specified file not found.
+    """
+    file_path = os.path.join(_DATA_DIR, file_name)
+
+    if not os.path.isfile(file_path):
+        raise FileNotFoundError(f"File {file_name} not found!")
+
+    return file_path
+
+
+def hash_maze_file(file_name: str) -> str:
+    """Get SHA-256 hash of the content of a maze file in data dir.
+
+    Raises:
+        FileNotFoundError: Specified file not found.
+    """
+    with open(get_maze_file_path(file_name), "rb") as file_object:
+        return hashlib.file_digest(file_object, "sha256").hexdigest()
+
+
+def create_translation_table(data_to_code_map: dict[str, int]) -> bytes:
+    """Create a table for decoding maze file bytes into cell codes with bytes.translate.
+
+    Bytes not present in the map are translated to INVALID_CELL_CODE.
+
+    Raises:
+        ValueError: Map contains data that is not a single byte or a code that is not a byte.
+    """
+    table = bytearray([INVALID_CELL_CODE]) * 256
+    for data, code in data_to_code_map.items():
+        if not isinstance(data, str) or len(encoded_data := data.encode("utf-8")) != 1:
+            raise ValueError(f"Block data '{data}' can not be decoded byte by byte.")
+        if not 0 <= code < INVALID_CELL_CODE:
+            raise ValueError(f"Invalid cell code '{code}'.")
+        table[encoded_data[0]] = code
+    return bytes(table)
 
 
 class MazeFileContext:
@@ -28,10 +82,7 @@ class MazeFileContext:
         Raises:
             FileNotFoundError: Specified file not found.
         """
-        file_path = os.path.join(_DATA_DIR, file_name)
-
-        if not os.path.isfile(file_path):
-            raise FileNotFoundError(f"File {file_name} not found!")
+        file_path = get_maze_file_path(file_name)
 
         # pylint: disable=consider-using-with
         self.file_object = open(file_path, "r", encoding="utf-8")
@@ -1,17 +1,27 @@
 """Interface between GUI and backend."""
+import functools
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from enum import StrEnum
-from threading import Lock
-from typing import Callable, Self
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Callable, Self, overload
 
 from maze.maze import Maze as BackendMaze
-from maze.mazeblock import MazeBlock as BackendMazeBlock
-from maze.mazeblock import BlockIndex, BlockType
+from maze.mazeblock import BLOCK_TYPE_CODES, BlockIndex, BlockType
+from maze.routeencoding import EncodedRoute
+from maze.solvers import AUTO_SOLVER, MazeProfile, SolverRegistry
+
+if TYPE_CHECKING:
+    from maze.mazegrid import MazeGrid
+    from maze.processsolver import ProcessSolve
+
+PROCESS_SOLVER_NAME: str = "bfs (separate process)"
+"""Name of the solver used when solving in a separate process."""
 
 
 @dataclass
 class GUIMazeBlockIndex:
-    """Class representing the position of GUIMazeBlock."""
+    """Class representing the position of a maze cell on GUI."""
 
     row: int
     column: int
@@ -25,6 +35,17 @@ class GUIMazeBlockIndex:
         )
 
 
+class GUIBackendEvent(StrEnum):
+    """Class representing an event sent from backend to GUI."""
+
+    PROGRESS = "backend_progress"
+    """New visited blocks are available."""
+    SOLVED = "backend_solved"
+    """Solver has finished."""
+    ROUTES_COUNTED = "backend_routes_counted"
+    """Shortest routes have been counted."""
+
+
 class GUIMazeBlockType(StrEnum):
     """Class representing a gui maze bock type."""
 
@@ -36,35 +57,81 @@ class GUIMazeBlockType(StrEnum):
     @classmethod
     def from_backend_maze_block_type(cls, backend_block_type: BlockType) -> "GUIMazeBlockType":
         """Get GUIMazeBlockType from backend maze block type."""
-        if backend_block_type == BlockType.OPEN:
-            return cls.OPEN
-        if backend_block_type == BlockType.START:
-            return cls.START
-        if backend_block_type == BlockType.EXIT:
-            return cls.EXIT
-        if backend_block_type == BlockType.SOLID:
-            return cls.SOLID
+        if backend_block_type not in _BACKEND_BLOCK_TYPES:
+            raise ValueError(f"Invalid backend block type '{backend_block_type}'.")
+        return _BACKEND_BLOCK_TYPES[backend_block_type]
 
-        raise ValueError(f"Invalid backend block type '{backend_block_type}'.")
 
+_BACKEND_BLOCK_TYPES: dict[BlockType, GUIMazeBlockType] = {
+    BlockType.OPEN: GUIMazeBlockType.OPEN,
+    BlockType.START: GUIMazeBlockType.START,
+    BlockType.EXIT: GUIMazeBlockType.EXIT,
+    BlockType.SOLID: GUIMazeBlockType.SOLID,
+}
 
-@dataclass
-class GUIMazeBlock:
-    """Class representing a maze block on GUI."""
+CELL_CODES: dict[GUIMazeBlockType, int] = {
+    _BACKEND_BLOCK_TYPES[block_type]: code for block_type, code in BLOCK_TYPE_CODES.items()
+}
+"""Single byte codes of the cells in the rows of GUIMazeView."""
 
-    type_: GUIMazeBlockType
-    index: GUIMazeBlockIndex
-    visited: bool = False
+_CODE_CELL_TYPES: dict[int, GUIMazeBlockType] = {code: type_ for type_, code in CELL_CODES.items()}
 
-    @classmethod
-    def from_backend_maze_block(cls, backend_maze_block: BackendMazeBlock) -> Self:
-        """Get GUIMazeBlock from backend maze block."""
-        return cls(
-            # pylint: disable=simplifiable-if-expression
-            type_=GUIMazeBlockType.from_backend_maze_block_type(backend_maze_block.type_),
-            # pylint: enable=simplifiable-if-expression
-            index=GUIMazeBlockIndex.from_backend_block_index(backend_maze_block.index),
-        )
+
+class GUIMazeView(Sequence[bytes]):
+    """Class representing a read-only view of the cells of a maze.
+
+    The view is a sequence of rows, each row containing the cell codes (see CELL_CODES) of the
+    cells padded to equal length with solid cells. The rows are shared with the backend maze, so
+    no cells are copied when the view is created. The backend creates each row on its first
+    access, so only the rows drawn are ever created.
+    """
+
+    def __init__(self, cell_rows: Sequence[bytes]) -> None:
+        """Initialize view over the cell rows of a maze."""
+        self._cell_rows = cell_rows
+        self._columns = len(cell_rows[0]) if cell_rows else 0
+
+    @property
+    def rows(self) -> int:
+        """Amount of rows in maze."""
+        return len(self._cell_rows)
+
+    @property
+    def columns(self) -> int:
+        """Amount of columns in maze."""
+        return self._columns
+
+    def cell_type(self, row: int, column: int) -> GUIMazeBlockType:
+        """Get type of the cell at row and column.
+
+        Raises:
+            IndexError: Cell is outside of maze.
+            ValueError: Cell code is not one of CELL_CODES.
+        """
+        cell_code = self._cell_rows[row][column]
+        if cell_code not in _CODE_CELL_TYPES:
+            raise ValueError(f"Invalid cell code '{cell_code}'.")
+        return _CODE_CELL_TYPES[cell_code]
+
+    @overload
+    def __getitem__(self, index: int) -> bytes:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[bytes]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> bytes | Sequence[bytes]:
+        """Get cell codes of a row (or rows)."""
+        return self._cell_rows[index]
+
+    def __len__(self) -> int:
+        """Get amount of rows in maze."""
+        return len(self._cell_rows)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate cell codes of the rows."""
+        return iter(self._cell_rows)
 
 
 class GUIBackendInterface:
@@ -74,59 +141,259 @@ class GUIBackendInterface:
         self,
         available_mazes: Callable[[], list[str]],
         maze: BackendMaze,
+        solver_registry: SolverRegistry | None = None,
+        out_of_process: bool = False,
     ) -> None:
-        """Initialize MazeDataInterface."""
+        """Initialize MazeDataInterface.
+
+        Args:
+            available_mazes: Function returning the names of the available mazes.
+            maze: Backend maze.
+            solver_registry: Solvers to choose from. If None, the solver of the maze is used.
+            out_of_process: Whether mazes without block costs are solved breadth-first in a
+                separate process instead of a thread. The progress must then be polled (see
+                poll_progress).
+        """
         self._available_mazes = available_mazes
         self._backend_maze = maze
+        self._solver_registry = solver_registry
+        self._solver_name = AUTO_SOLVER
+        self._active_solver_name: str | None = None
+        self._maze_profile: MazeProfile | None = None
         self._threading_lock: Lock = Lock()
         self._new_visited_blocks_buffer: list[GUIMazeBlockIndex] = []
+        self._event_listener: Callable[[GUIBackendEvent], None] | None = None
+        self._progress_event_pending = False
+        self._solved = False
+        self._out_of_process = out_of_process
+        self._grid: "MazeGrid | None" = None
+        self._process_solve: "ProcessSolve | None" = None
+        self._process_solve_finished = False
+        self._shortest_route_count: int | None = None
+        self._shortest_route_cost: int | None = None
+        self._route_counting_id = 0
+
+    def close(self) -> None:
+        """Stop solving in a separate process and release the shared memory."""
+        self._close_process_solve()
+        if self._grid is not None:
+            self._grid.close()
+            self._grid = None
+
+    def set_event_listener(self, event_listener: Callable[[GUIBackendEvent], None] | None) -> None:
+        """Set a listener the backend wakes up GUI with. None removes the listener.
+
+        The listener is called from the solver thread.
+        """
+        with self._threading_lock:
+            self._event_listener = event_listener
+            self._progress_event_pending = False
 
     def get_available_mazes_names(self) -> list[str]:
         """Get available mazes names from backend."""
         return self._available_mazes()
 
-    def get_maze(self, name: str) -> list[list[GUIMazeBlock]]:
-        """Get maze representation from backend."""
+    def get_maze(self, name: str) -> GUIMazeView:
+        """Create maze in backend and get a read-only view of its cells."""
+        self.close()
         self._backend_maze.create_maze(name)
-        backend_maze_data = self._backend_maze.get_maze()
-        gui_maze: list[list[GUIMazeBlock]] = []
-        for row in backend_maze_data:
-            gui_maze_row: list[GUIMazeBlock] = []
-            for block in row:
-                gui_maze_row.append(GUIMazeBlock.from_backend_maze_block(block))
-            gui_maze.append(gui_maze_row)
+        self._solved = False
+        self._reset_shortest_route_count()
+        self._maze_profile = None
+        return GUIMazeView(self._backend_maze.get_cell_rows())
+
+    def get_solver_names(self) -> list[str]:
+        """Get names of the solvers to choose from. Empty list indicates there is no choice."""
+        return [] if self._solver_registry is None else self._solver_registry.names()
 
-        return gui_maze
+    def set_solver(self, name: str) -> None:
+        """Set the solver used for solving the maze. Auto picks the solver for each maze.
+
+        Raises:
+            ValueError: No solver registry.
+            KeyError: Solver is not registered.
+        """
+        if self._solver_registry is None:
+            raise ValueError("Could not set solver. No solver registry.")
+        if name != AUTO_SOLVER:
+            self._solver_registry.get(name)
+        self._solver_name = name
+
+    def get_active_solver_name(self) -> str | None:
+        """Get name of the solver that solved (or is solving) the maze. None if not known."""
+        return self._active_solver_name
 
     def solve_maze(self, max_route_length: int = 0, slow_down: bool = False) -> None:
-        """Solve maze."""
-        self._backend_maze.solve_maze(max_route_length, slow_down)
+        """Solve maze. Listener is informed with GUIBackendEvent.SOLVED when solver has finished."""
+        self._close_process_solve()
+        self._solved = False
+        self._reset_shortest_route_count()
+        if self._out_of_process and not self._get_maze_profile().weighted:
+            self._solve_maze_in_process(max_route_length)
+            return
+        if self._solver_registry is not None:
+            self._active_solver_name = self._solver_registry.resolve(
+                self._solver_name, self._get_maze_profile()
+            )
+            self._backend_maze.solver = functools.partial(
+                self._solver_registry.get(self._active_solver_name),
+                gui_hook_visited_block_index=self.set_new_visited_blocks,
+            )
+        self._backend_maze.solve_maze(max_route_length, slow_down, self._inform_solved)
+
+    def is_polling_progress(self) -> bool:
+        """Get whether the maze is being solved in a separate process, i.e. progress is polled."""
+        return self._process_solve is not None and not self._process_solve_finished
 
-    def get_solved_route(self) -> list[GUIMazeBlockIndex] | None:
-        """Get solved route in maze.
+    def poll_progress(self) -> None:
+        """Read progress of the solve running in a separate process (call e.g. at frame rate).
 
-        None indicates there is no solution. Empty list indicates the solution has not been
-        found yet.
+        Listener is informed with GUIBackendEvent.PROGRESS if new blocks have been visited and
+        with GUIBackendEvent.SOLVED when the solver process has finished.
         """
+        # Imported here since multiprocessing is not needed unless solving in a process.
+        # pylint: disable=import-outside-toplevel
+        from maze.processsolver import STATUS_RUNNING
+        # pylint: enable=import-outside-toplevel
+
+        if (process_solve := self._process_solve) is None or self._process_solve_finished:
+            return
+        # Status is read first, so all the visited blocks are read when the solver has finished.
+        finished = process_solve.status() != STATUS_RUNNING
+        if new_visited_blocks := process_solve.new_visited_cells():
+            self.set_new_visited_blocks(new_visited_blocks)
+        if finished:
+            self._process_solve_finished = True
+            self._inform_solved()
+
+    def count_shortest_routes(self, max_route_length: int = 0) -> None:
+        """Count the distinct shortest (with block costs, cheapest) routes in a background thread.
+
+        Listener is informed with GUIBackendEvent.ROUTES_COUNTED when the routes have been counted
+        (see get_shortest_route_count). Counting again or loading another maze discards the result
+        of the previous counting.
+        """
+        route_counting_id = self._reset_shortest_route_count()
+        Thread(
+            target=self._count_shortest_routes,
+            args=(route_counting_id, max_route_length),
+            daemon=True,
+        ).start()
+
+    def get_shortest_route_count(self) -> int | None:
+        """Get the amount of distinct shortest routes in maze. Zero indicates there is no route.
+
+        None indicates the routes have not been counted yet.
+        """
+        with self._threading_lock:
+            return self._shortest_route_count
+
+    def get_shortest_route_cost(self) -> int | None:
+        """Get the cost of the counted cheapest routes, i.e. the sum of the costs of the blocks.
+
+        None indicates there is no route or the routes have not been counted yet.
+        """
+        with self._threading_lock:
+            return self._shortest_route_cost
+
+    def has_block_costs(self) -> bool:
+        """Get whether any block of the maze costs more than one to move to."""
+        return self._get_maze_profile().weighted
+
+    def is_solved(self) -> bool:
+        """Get whether the solver has finished, i.e. whether the solved route can be read."""
+        with self._threading_lock:
+            return self._solved
+
+    def get_solved_route(self) -> EncodedRoute | None:
+        """Get solved route in maze encoded as the start block and the moves.
+
+        None indicates there is no solution.
+
+        Raises:
+            ValueError: Maze has not been solved (see is_solved).
+            RuntimeError: Solver process failed.
+        """
+        if not self.is_solved():
+            raise ValueError("Could not get solved route. Maze has not been solved.")
+        if self._process_solve is not None:
+            return self._process_solve.route()
         solved_route = self._backend_maze.shortest_route
-        if solved_route.blocks is None:
+        if not solved_route.blocks:
             return None
-        if not solved_route:
-            return []
-        return [
-            GUIMazeBlockIndex(block.index.row, block.index.column) for block in solved_route.blocks
-        ]
+        return EncodedRoute.from_route(block.index for block in solved_route.blocks)
 
     def get_new_visited_blocks(self) -> list[GUIMazeBlockIndex]:
         """Get new visited blocks from buffer."""
         with self._threading_lock:
             new_visited_blocks = self._new_visited_blocks_buffer.copy()
             self._new_visited_blocks_buffer.clear()
+            self._progress_event_pending = False
         return new_visited_blocks
 
     def set_new_visited_blocks(self, new_visited_blocks: list[BlockIndex]) -> None:
-        """Set new visited blocks to buffer."""
+        """Set new visited blocks to buffer.
+
+        Listener is informed with GUIBackendEvent.PROGRESS only if the previous progress event has
+        been handled (i.e. the buffer has been read), so GUI is woken up at most once per redraw.
+        """
         with self._threading_lock:
             self._new_visited_blocks_buffer += [
                 GUIMazeBlockIndex(block.row, block.column) for block in new_visited_blocks
             ]
+            if self._progress_event_pending or self._event_listener is None:
+                return
+            self._progress_event_pending = True
+            event_listener = self._event_listener
+        event_listener(GUIBackendEvent.PROGRESS)
+
+    def _inform_solved(self) -> None:
+        with self._threading_lock:
+            self._solved = True
+            event_listener = self._event_listener
+        if event_listener is not None:
+            event_listener(GUIBackendEvent.SOLVED)
+
+    def _reset_shortest_route_count(self) -> int:
+        """Discard the result of the previous counting. Returns id of the next counting."""
+        with self._threading_lock:
+            self._route_counting_id += 1
+            self._shortest_route_count = None
+            self._shortest_route_cost = None
+            return self._route_counting_id
+
+    def _count_shortest_routes(self, route_counting_id: int, max_route_length: int) -> None:
+        shortest_routes = self._backend_maze.count_shortest_routes(max_route_length)
+        with self._threading_lock:
+            if route_counting_id != self._route_counting_id:
+                return
+            if shortest_routes is None:
+                self._shortest_route_count = 0
+            else:
+                self._shortest_route_count = shortest_routes.count
+                self._shortest_route_cost = shortest_routes.length
+            event_listener = self._event_listener
+        if event_listener is not None:
+            event_listener(GUIBackendEvent.ROUTES_COUNTED)
+
+    def _get_maze_profile(self) -> MazeProfile:
+        if self._maze_profile is None:
+            self._maze_profile = MazeProfile.from_blocks(self._backend_maze.get_maze())
+        return self._maze_profile
+
+    def _solve_maze_in_process(self, max_route_length: int) -> None:
+        # Imported here since multiprocessing is not needed unless solving in a process.
+        from maze.processsolver import ProcessSolve  # pylint: disable=import-outside-toplevel
+
+        if self._grid is None:
+            self._grid = self._backend_maze.create_grid()
+        with self._threading_lock:
+            self._new_visited_blocks_buffer.clear()
+        self._process_solve = ProcessSolve(self._grid, max_route_length)
+        self._process_solve_finished = False
+        self._active_solver_name = PROCESS_SOLVER_NAME
+
+    def _close_process_solve(self) -> None:
+        if self._process_solve is not None:
+            self._process_solve.close()
+            self._process_solve = None
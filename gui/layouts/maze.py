@@ -1,12 +1,30 @@
 """Maze layout."""
+import math
+import time
 from enum import StrEnum
-from typing import Any
+from typing import Any, Iterable
 
 import PySimpleGUI as sg
 
-from gui.gui_backend_interface import GUIMazeBlock, GUIMazeBlockIndex, GUIMazeBlockType
+from gui.gui_backend_interface import GUIBackendEvent, GUIMazeBlockIndex, GUIMazeView
 from gui.layouts.general import BaseLayout, LayoutParam, LayoutReturnValue
 from gui.layouts.layoutoptions import GUILayout
+from gui.viewport import (
+    CELL_COLORS,
+    OVERLAY_COLORS,
+    OVERLAY_NONE,
+    OVERLAY_ROUTE,
+    OVERLAY_VISITED,
+    Viewport,
+    color_to_hex,
+    render_overview,
+)
+
+_MAX_CANVAS_SIZE: tuple[int, int] = (800, 600)
+_OVERVIEW_REFRESH_INTERVAL: float = 0.25
+"""Min interval in seconds between redraws of the overview image while solving."""
+_PROGRESS_POLL_INTERVAL: float = 1 / 30
+"""Interval in seconds between reads of the progress of a solver running in another process."""
 
 
 class _Event(StrEnum):
@@ -15,6 +33,12 @@ class _Event(StrEnum):
     BACK_TO_MENU = "Menu"
     SOLVE_MAZE = "Find Shortest Route"
     EXIT = "Exit"
+    ZOOM_IN = "Zoom In"
+    ZOOM_OUT = "Zoom Out"
+    SCROLL_UP = "Up"
+    SCROLL_DOWN = "Down"
+    SCROLL_LEFT = "Left"
+    SCROLL_RIGHT = "Right"
 
 
 class _Keys(StrEnum):
@@ -27,18 +51,38 @@ class _Keys(StrEnum):
     DROP_DOWN_TITLE = "drop_down_title"
     DROP_DOWN = "drop_down"
     SLOW_DOWN = "slow_down"
+    SOLVER = "solver"
+
+
+_VIEWPORT_EVENTS: tuple[_Event, ...] = (
+    _Event.ZOOM_IN,
+    _Event.ZOOM_OUT,
+    _Event.SCROLL_UP,
+    _Event.SCROLL_DOWN,
+    _Event.SCROLL_LEFT,
+    _Event.SCROLL_RIGHT,
+)
 
 
 class Maze(BaseLayout):  # pylint: disable=too-few-public-methods
-    """Maze layout."""
+    """Maze layout.
+
+    Only the cells inside the viewport are drawn. When zoomed out, the visible area is drawn as a
+    downsampled image instead of cell by cell.
+    """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize maze layout."""
         super().__init__(*args, **kwargs)
-        self._maze: list[list[GUIMazeBlock]] = []
-        self._block_size: int = 20
+        self._maze_view = GUIMazeView([])
+        self._overlay = bytearray()
+        self._viewport = Viewport(0, 0, *_MAX_CANVAS_SIZE)
         self._graph: sg.Graph | None = None
         self._solver_has_been_running = False
+        self._step_limit: int = 0
+        self._route_length: int = 0
+        self._overview_outdated = False
+        self._overview_drawn_at: float = 0
 
     def run(self, param: LayoutParam[str] | None) -> LayoutReturnValue[None]:
         """Run menu."""
@@ -46,93 +90,176 @@ class Maze(BaseLayout):  # pylint: disable=too-few-public-methods
         if param is None or (maze_selection := param.value) is None:
             raise ValueError("Invalid maze selection.")
 
-        self._maze = self._gui_backend_interface.get_maze(maze_selection)
+        self._set_maze(self._gui_backend_interface.get_maze(maze_selection))
         layout = self._create_layout()
         window = sg.Window("Pena Stuck In a Maze - Maze", layout, grab_anywhere=True, finalize=True)
-        self._draw_blocks()
+        self._draw_viewport()
 
+        # Backend wakes up the window from solver thread, so the window can block until there is
+        # something to do.
+        self._gui_backend_interface.set_event_listener(
+            lambda backend_event: window.write_event_value(backend_event, None)
+        )
         solving_maze = False
         while True:
-            event, values = window.read(timeout=0)
+            # Wake up later to redraw the outdated overview if no other events come.
+            timeout = int(_OVERVIEW_REFRESH_INTERVAL * 1000) if self._overview_outdated else None
+            # Solver running in another process does not wake up the window, so poll its progress.
+            polling_progress = self._gui_backend_interface.is_polling_progress()
+            if polling_progress:
+                timeout = int(_PROGRESS_POLL_INTERVAL * 1000)
+            event, values = window.read(timeout=timeout)
+            if polling_progress:
+                self._gui_backend_interface.poll_progress()
             if event in (sg.WIN_CLOSED, _Event.EXIT):
+                self._gui_backend_interface.set_event_listener(None)
                 window.close()
                 return LayoutReturnValue(GUILayout.CLOSE)
             if event == _Event.BACK_TO_MENU:
+                self._gui_backend_interface.set_event_listener(None)
                 window.close()
                 return LayoutReturnValue(GUILayout.MENU)
             if event == _Event.SOLVE_MAZE and not solving_maze:
                 # Clear maze if solver has been running before.
                 if self._solver_has_been_running:
-                    self._draw_blocks()
+                    self._overlay[:] = bytes(len(self._overlay))
+                    self._draw_viewport()
                 self._solver_has_been_running = True
-                if (step_limit := values[_Keys.DROP_DOWN]):
-                    self._gui_backend_interface.solve_maze(step_limit, values[_Keys.SLOW_DOWN])
-                else:
-                    self._gui_backend_interface.solve_maze(slow_down=values[_Keys.SLOW_DOWN])
+                self._step_limit = values[_Keys.DROP_DOWN] or 0
+                if values.get(_Keys.SOLVER):
+                    self._gui_backend_interface.set_solver(values[_Keys.SOLVER])
+                self._gui_backend_interface.solve_maze(self._step_limit, values[_Keys.SLOW_DOWN])
                 solving_maze = True
-            elif solving_maze:
-                solved_route = self._gui_backend_interface.get_solved_route()
-                # No solution to maze found.
-                if solved_route is None:
-                    solving_maze = False
-                    window[_Keys.INFO_TEXT].update("Solution to maze not found.")
-                # Maze not yet solved if solved route empty.
-                elif solved_route:
-                    solving_maze = False
-                    self._draw_solved_route(solved_route)
-                    window[_Keys.INFO_TEXT].update(
-                        f"Maze solved! Shortest route length: {len(solved_route)}"
-                    )
-
-            self._update_visited_blocks(self._gui_backend_interface.get_new_visited_blocks())
-
-    def _draw_solved_route(self, solved_route: list[GUIMazeBlockIndex]) -> None:
-        if self._graph is None:
-            raise ValueError("Graph does not exist. Could not draw solved route.")
-
-        for index in solved_route:
-            self._graph.draw_rectangle(
-                (self._block_size * index.column, self._block_size * index.row),
-                (
-                    self._block_size * index.column + self._block_size,
-                    self._block_size * index.row + self._block_size
-                ),
-                fill_color="blue",
+            elif event == GUIBackendEvent.PROGRESS:
+                self._update_visited_blocks(self._gui_backend_interface.get_new_visited_blocks())
+            elif event == GUIBackendEvent.SOLVED:
+                solving_maze = False
+                self._update_visited_blocks(self._gui_backend_interface.get_new_visited_blocks())
+                self._show_solved_route(window)
+            elif event == GUIBackendEvent.ROUTES_COUNTED:
+                self._show_route_info(window)
+            elif event in _VIEWPORT_EVENTS:
+                self._move_viewport(event)
+                self._draw_viewport()
+
+            if (
+                self._overview_outdated
+                and time.monotonic() - self._overview_drawn_at >= _OVERVIEW_REFRESH_INTERVAL
+            ):
+                self._draw_viewport()
+
+    def _set_maze(self, maze_view: GUIMazeView) -> None:
+        """Store view of the maze, which the cells are drawn from without copying them."""
+        self._maze_view = maze_view
+        self._overlay = bytearray(maze_view.rows * maze_view.columns)
+        # Shrink the canvas for mazes smaller than the max canvas size.
+        self._viewport = Viewport(maze_view.rows, maze_view.columns, *_MAX_CANVAS_SIZE)
+        self._viewport.width = min(
+            _MAX_CANVAS_SIZE[0], math.ceil(maze_view.columns * self._viewport.cell_size)
+        )
+        self._viewport.height = min(
+            _MAX_CANVAS_SIZE[1], math.ceil(maze_view.rows * self._viewport.cell_size)
+        )
+
+    def _move_viewport(self, event: str) -> None:
+        page_rows, page_columns = self._viewport.page_size()
+        if event == _Event.ZOOM_IN:
+            self._viewport.zoom_in()
+        elif event == _Event.ZOOM_OUT:
+            self._viewport.zoom_out()
+        elif event == _Event.SCROLL_UP:
+            self._viewport.scroll(-page_rows, 0)
+        elif event == _Event.SCROLL_DOWN:
+            self._viewport.scroll(page_rows, 0)
+        elif event == _Event.SCROLL_LEFT:
+            self._viewport.scroll(0, -page_columns)
+        elif event == _Event.SCROLL_RIGHT:
+            self._viewport.scroll(0, page_columns)
+
+    def _show_solved_route(self, window: sg.Window) -> None:
+        if not self._gui_backend_interface.is_solved():
+            return
+        solved_route = self._gui_backend_interface.get_solved_route()
+        # No solution to maze found.
+        if solved_route is None:
+            window[_Keys.INFO_TEXT].update("Solution to maze not found.")
+            return
+
+        # Route is drawn from the overlay, so its cells are streamed without storing them.
+        self._set_overlay(
+            ((index.row, index.column) for index in solved_route.blocks()), OVERLAY_ROUTE
+        )
+        self._route_length = len(solved_route)
+        # Counting may take as long as solving, so it is done in the background.
+        self._gui_backend_interface.count_shortest_routes(self._step_limit)
+        self._show_route_info(window)
+
+    def _show_route_info(self, window: sg.Window) -> None:
+        route_count = self._gui_backend_interface.get_shortest_route_count()
+        counted = "counting..." if route_count is None else route_count
+        if self._gui_backend_interface.has_block_costs():
+            # The cheapest routes may differ in length, so the cost is what they share.
+            route_cost = self._gui_backend_interface.get_shortest_route_cost()
+            route_info = (
+                f"Route length: {self._route_length}, "
+                f"route cost: {'counting...' if route_cost is None else route_cost}, "
+                f"cheapest routes: {counted}"
             )
+        else:
+            route_info = f"Shortest route length: {self._route_length}, shortest routes: {counted}"
+        solver_name = self._gui_backend_interface.get_active_solver_name()
+        window[_Keys.INFO_TEXT].update(
+            f"Maze solved! {route_info}"
+            + (f", solver: {solver_name}" if solver_name is not None else "")
+        )
 
     def _update_visited_blocks(self, block_indices: list[GUIMazeBlockIndex]) -> None:
+        self._set_overlay([(index.row, index.column) for index in block_indices], OVERLAY_VISITED)
+
+    def _set_overlay(self, cells: Iterable[tuple[int, int]], overlay_code: int) -> None:
+        """Store overlay code of cells (row and column) and draw the visible ones."""
+        columns = self._viewport.columns
+        if not self._viewport.is_detailed:
+            for row, column in cells:
+                self._overlay[row * columns + column] = overlay_code
+            self._overview_outdated = True
+            return
+
+        visible_rows = self._viewport.visible_rows
+        visible_columns = self._viewport.visible_columns
+        for row, column in cells:
+            self._overlay[row * columns + column] = overlay_code
+            if row in visible_rows and column in visible_columns:
+                self._draw_cell(row, column)
+
+    def _draw_viewport(self) -> None:
         if self._graph is None:
-            raise ValueError("Graph does not exist. Could not draw visited blocks.")
-        for index in block_indices:
-            self._graph.draw_rectangle(
-                (self._block_size * index.column, self._block_size * index.row),
-                (
-                    self._block_size * index.column + self._block_size,
-                    self._block_size * index.row + self._block_size
-                ),
-                fill_color="yellow",
+            raise ValueError("Graph does not exist. Could not draw maze.")
+
+        self._graph.erase()
+        if self._viewport.is_detailed:
+            for row in self._viewport.visible_rows:
+                for column in self._viewport.visible_columns:
+                    self._draw_cell(row, column)
+        else:
+            self._graph.draw_image(
+                data=render_overview(self._viewport, self._maze_view, self._overlay),
+                location=(0, 0),
             )
+            self._overview_outdated = False
+            self._overview_drawn_at = time.monotonic()
 
-    def _draw_blocks(self) -> None:
+    def _draw_cell(self, row: int, column: int) -> None:
         if self._graph is None:
-            raise ValueError("Graph does not exist. Could not draw blocks.")
-        for row in self._maze:
-            for block in row:
-                color = "black"
-                if block.type_ == GUIMazeBlockType.START:
-                    color = "red"
-                elif block.type_ == GUIMazeBlockType.EXIT:
-                    color = "green"
-                elif block.type_ == GUIMazeBlockType.OPEN:
-                    color = "white"
-                self._graph.draw_rectangle(
-                    (self._block_size * block.index.column, self._block_size * block.index.row),
-                    (
-                        self._block_size * block.index.column + self._block_size,
-                        self._block_size * block.index.row + self._block_size
-                    ),
-                    fill_color=color
-                )
+            raise ValueError("Graph does not exist. Could not draw block.")
+
+        overlay_code = self._overlay[row * self._viewport.columns + column]
+        if overlay_code == OVERLAY_NONE:
+            color = CELL_COLORS[self._maze_view[row][column]]
+        else:
+            color = OVERLAY_COLORS[overlay_code]
+        top_left, bottom_right = self._viewport.cell_rectangle(row, column)
+        self._graph.draw_rectangle(top_left, bottom_right, fill_color=color_to_hex(color))
 
     def _create_layout(self) -> list[Any]:
         """Create maze layout.
@@ -140,7 +267,7 @@ class Maze(BaseLayout):  # pylint: disable=too-few-public-methods
         Because of PySimpleGUI typing, the return list parameters are difficult to annotate better.
         However, the list contains PySimpleGUI elements and other lists.
         """
-        canvas_size = (len(self._maze[0])*self._block_size, len(self._maze)*self._block_size)
+        canvas_size = (self._viewport.width, self._viewport.height)
         graph_top_right = (canvas_size[0], 0)
         graph_bottom_left = (0, canvas_size[1])
         self._graph = sg.Graph(
@@ -149,9 +276,18 @@ class Maze(BaseLayout):  # pylint: disable=too-few-public-methods
             graph_top_right=graph_top_right,
             key=_Keys.GRAPH,
         )
+        solver_names = self._gui_backend_interface.get_solver_names()
+        solver_selection: list[Any] = []
+        if solver_names:
+            solver_selection = [
+                sg.Text("Solver: "),
+                sg.DropDown(solver_names, default_value=solver_names[0], key=_Keys.SOLVER),
+            ]
         return [
             [self._graph],
+            [sg.Button(event) for event in _VIEWPORT_EVENTS],
             [
+                *solver_selection,
                 sg.Text("Step Limit: ", key=_Keys.DROP_DOWN_TITLE),
                 sg.DropDown([20, 150, 200], key=_Keys.DROP_DOWN),
                 sg.Checkbox("Slow Down Solver For Animation", key=_Keys.SLOW_DOWN),
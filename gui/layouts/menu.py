@@ -27,7 +27,9 @@ class Menu(BaseLayout):  # pylint: disable=too-few-public-methods
 
     def run(self, _: LayoutParam[None] | None) -> LayoutReturnValue[str]:
         """Run menu."""
-        layout = self._create_layout()
+        # Mazes are listed once per menu instead of on every selection.
+        maze_names = self._gui_backend_interface.get_available_mazes_names()
+        layout = self._create_layout(maze_names)
         window = sg.Window("Pena Stuck In a Maze - Menu", layout)
         while True:
             event, values = window.read()
@@ -35,10 +37,7 @@ class Menu(BaseLayout):  # pylint: disable=too-few-public-methods
                 window.close()
                 return LayoutReturnValue(GUILayout.CLOSE)
             if event == _Event.OPEN_MAZE:
-                if (
-                    (selection := values[_Keys.MAZE_SELECTION])
-                    not in self._gui_backend_interface.get_available_mazes_names()
-                ):
+                if (selection := values[_Keys.MAZE_SELECTION]) not in maze_names:
                     continue
                 window.close()
                 return LayoutReturnValue(
@@ -46,7 +45,7 @@ class Menu(BaseLayout):  # pylint: disable=too-few-public-methods
                     str(selection),
                 )
 
-    def _create_layout(self) -> list[Any]:
+    def _create_layout(self, maze_names: list[str]) -> list[Any]:
         """Create menu layout.
 
         Because of PySimpleGUI typing, the return list parameters are difficult to annotate better.
@@ -54,9 +53,7 @@ class Menu(BaseLayout):  # pylint: disable=too-few-public-methods
         """
         return [
             [sg.Text("Select Maze", key=_Keys.MENU_TEXT)],
-            [sg.DropDown(
-                self._gui_backend_interface.get_available_mazes_names(), key=_Keys.MAZE_SELECTION
-            )],
+            [sg.DropDown(maze_names, key=_Keys.MAZE_SELECTION)],
             [sg.Button(_Event.OPEN_MAZE)],
             [sg.Button(_Event.EXIT)],
         ]
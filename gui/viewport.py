@@ -0,0 +1,264 @@
+"""Viewport of a maze drawn on GUI.
+
+Only the cells inside the viewport are drawn. When zoomed out so much that the cells would be too
+small to draw one by one, the visible area is drawn as a single downsampled image instead.
+
+The maze is read as one bytes object of cell codes per row (see GUIMazeView) and the visited
+blocks and the solved route are stored as a single bytearray of overlay codes, so no objects are
+created per cell.
+"""
+import base64
+import math
+import struct
+import zlib
+from typing import Iterable, Sequence
+
+from gui.gui_backend_interface import CELL_CODES, GUIMazeBlockType
+
+_SOLID = CELL_CODES[GUIMazeBlockType.SOLID]
+_OPEN = CELL_CODES[GUIMazeBlockType.OPEN]
+_START = CELL_CODES[GUIMazeBlockType.START]
+_EXIT = CELL_CODES[GUIMazeBlockType.EXIT]
+
+OVERLAY_NONE = 0
+OVERLAY_VISITED = 1
+OVERLAY_ROUTE = 2
+
+Color = tuple[int, int, int]
+
+CELL_COLORS: dict[int, Color] = {
+    _SOLID: (0, 0, 0),
+    _OPEN: (255, 255, 255),
+    _START: (255, 0, 0),
+    _EXIT: (0, 128, 0),
+}
+OVERLAY_COLORS: dict[int, Color] = {
+    OVERLAY_VISITED: (255, 255, 0),
+    OVERLAY_ROUTE: (0, 0, 255),
+}
+
+_OPEN_TABLE = bytes(1 if code == _OPEN else 0 for code in range(256))
+_START_TABLE = bytes(1 if code == _START else 0 for code in range(256))
+_EXIT_TABLE = bytes(1 if code == _EXIT else 0 for code in range(256))
+_VISITED_TABLE = bytes(1 if code == OVERLAY_VISITED else 0 for code in range(256))
+_ROUTE_TABLE = bytes(1 if code == OVERLAY_ROUTE else 0 for code in range(256))
+
+ZOOM_LEVELS: tuple[float, ...] = (40, 20, 10, 5, 2, 1) + tuple(2 ** -i for i in range(1, 8))
+"""Available cell sizes in pixels from the most zoomed in to the most zoomed out."""
+
+DETAILED_MIN_CELL_SIZE: float = 10
+"""Smallest cell size in pixels for drawing cells one by one."""
+
+
+def color_to_hex(color: Color) -> str:
+    """Get color as a hex string understood by GUI library."""
+    return "#{:02x}{:02x}{:02x}".format(*color)  # pylint: disable=consider-using-f-string
+
+
+class Viewport:
+    """Class representing the visible area of a maze."""
+
+    def __init__(self, rows: int, columns: int, width: int, height: int) -> None:
+        """Initialize viewport.
+
+        Args:
+            rows: Row count of the maze.
+            columns: Column count of the maze.
+            width: Width of the viewport in pixels.
+            height: Height of the viewport in pixels.
+        """
+        self.rows = rows
+        self.columns = columns
+        self.width = width
+        self.height = height
+        self.top_row = 0
+        self.left_column = 0
+        self._zoom_level = 0
+        self.fit()
+
+    @property
+    def cell_size(self) -> float:
+        """Get cell size in pixels."""
+        return ZOOM_LEVELS[self._zoom_level]
+
+    @property
+    def is_detailed(self) -> bool:
+        """Get whether cells are large enough to be drawn one by one."""
+        return self.cell_size >= DETAILED_MIN_CELL_SIZE
+
+    @property
+    def visible_rows(self) -> range:
+        """Get rows inside the viewport."""
+        return range(
+            self.top_row, min(self.rows, self.top_row + math.ceil(self.height / self.cell_size))
+        )
+
+    @property
+    def visible_columns(self) -> range:
+        """Get columns inside the viewport."""
+        return range(
+            self.left_column,
+            min(self.columns, self.left_column + math.ceil(self.width / self.cell_size)),
+        )
+
+    def fit(self, max_cell_size: float = 20) -> None:
+        """Zoom to the largest cell size not exceeding max cell size showing the whole maze."""
+        self._zoom_level = len(ZOOM_LEVELS) - 1
+        for zoom_level, cell_size in enumerate(ZOOM_LEVELS):
+            if (
+                cell_size <= max_cell_size
+                and self.columns * cell_size <= self.width
+                and self.rows * cell_size <= self.height
+            ):
+                self._zoom_level = zoom_level
+                break
+        self.top_row = 0
+        self.left_column = 0
+
+    def zoom_in(self) -> None:
+        """Zoom in keeping the center of the viewport in place."""
+        self._zoom(max(self._zoom_level - 1, 0))
+
+    def zoom_out(self) -> None:
+        """Zoom out keeping the center of the viewport in place."""
+        self._zoom(min(self._zoom_level + 1, len(ZOOM_LEVELS) - 1))
+
+    def scroll(self, rows: int, columns: int) -> None:
+        """Scroll viewport by rows and columns without going outside the maze."""
+        self.top_row = self._clamp(self.top_row + rows, self.rows, self.height)
+        self.left_column = self._clamp(self.left_column + columns, self.columns, self.width)
+
+    def page_size(self) -> tuple[int, int]:
+        """Get half of the visible rows and columns, i.e. the amount scrolled at a time."""
+        return (
+            max(1, int(self.height / self.cell_size) // 2),
+            max(1, int(self.width / self.cell_size) // 2),
+        )
+
+    def cell_rectangle(
+        self, row: int, column: int
+    ) -> tuple[tuple[float, float], tuple[float, float]]:
+        """Get top left and bottom right pixel coordinates of a cell inside the viewport."""
+        top = (row - self.top_row) * self.cell_size
+        left = (column - self.left_column) * self.cell_size
+        return (left, top), (left + self.cell_size, top + self.cell_size)
+
+    def _zoom(self, zoom_level: int) -> None:
+        center_row = self.top_row + self.height / self.cell_size / 2
+        center_column = self.left_column + self.width / self.cell_size / 2
+        self._zoom_level = zoom_level
+        self.top_row = 0
+        self.left_column = 0
+        self.scroll(
+            int(center_row - self.height / self.cell_size / 2),
+            int(center_column - self.width / self.cell_size / 2),
+        )
+
+    def _clamp(self, first_cell: int, cell_count: int, pixels: int) -> int:
+        return max(0, min(first_cell, cell_count - int(pixels / self.cell_size)))
+
+
+def render_overview(viewport: Viewport, cell_rows: Sequence[bytes], overlay: bytearray) -> bytes:
+    """Render the visible area of the maze as a base64 encoded PNG image.
+
+    When the cells are smaller than a pixel, each pixel shows the average color of the open,
+    visited, and solid cells it covers. When the cells are larger than a pixel, each cell is drawn
+    as a square of pixels. Pixels covering start, exit, or route cells are drawn in the color of
+    those cells (in that order of priority) instead of the average, since they would disappear
+    otherwise. Only the visible rows are read.
+
+    Args:
+        viewport: Viewport to render.
+        cell_rows: Cell codes of the maze row by row.
+        overlay: Overlay codes of the maze cells.
+    """
+    cells_per_pixel = max(1, round(1 / viewport.cell_size))
+    pixels_per_cell = max(1, int(viewport.cell_size))
+    rows = viewport.visible_rows
+    columns = viewport.visible_columns
+    colors: dict[tuple[int, int, int], bytes] = {}
+
+    image_rows: list[bytearray] = []
+    for first_row in range(rows.start, rows.stop, cells_per_pixel):
+        block_rows = range(first_row, min(first_row + cells_per_pixel, rows.stop))
+        # Amount of open, start, exit, visited, and route cells in each column of the block rows.
+        block_cell_rows = [cell_rows[row][columns.start:columns.stop] for row in block_rows]
+        open_counts = _column_counts(block_cell_rows, _OPEN_TABLE, len(columns))
+        start_counts = _column_counts(block_cell_rows, _START_TABLE, len(columns))
+        exit_counts = _column_counts(block_cell_rows, _EXIT_TABLE, len(columns))
+        overlay_rows = [
+            overlay[row * viewport.columns + columns.start:row * viewport.columns + columns.stop]
+            for row in block_rows
+        ]
+        visited_counts = _column_counts(overlay_rows, _VISITED_TABLE, len(columns))
+        route_counts = _column_counts(overlay_rows, _ROUTE_TABLE, len(columns))
+        image_row = bytearray()
+        for first_column in range(0, len(columns), cells_per_pixel):
+            last_column = min(first_column + cells_per_pixel, len(columns))
+            if any(start_counts[first_column:last_column]):
+                image_row += bytes(CELL_COLORS[_START]) * pixels_per_cell
+                continue
+            if any(exit_counts[first_column:last_column]):
+                image_row += bytes(CELL_COLORS[_EXIT]) * pixels_per_cell
+                continue
+            if any(route_counts[first_column:last_column]):
+                image_row += bytes(OVERLAY_COLORS[OVERLAY_ROUTE]) * pixels_per_cell
+                continue
+            counts = (
+                sum(open_counts[first_column:last_column]),
+                sum(visited_counts[first_column:last_column]),
+                len(block_rows) * (last_column - first_column),
+            )
+            if (color := colors.get(counts)) is None:
+                color = colors[counts] = bytes(_average_color(*counts))
+            image_row += color * pixels_per_cell
+        image_rows += [image_row] + [image_row.copy() for _ in range(pixels_per_cell - 1)]
+
+    width = len(image_rows[0]) // 3 if image_rows else 0
+    return base64.b64encode(encode_png(width, len(image_rows), [bytes(row) for row in image_rows]))
+
+
+def _column_counts(rows: Iterable[bytes | bytearray], table: bytes, width: int) -> bytes:
+    """Count the cells translated to one by table in each column of the rows.
+
+    Rows are translated to zeros and ones and summed as big integers, i.e. all the columns are
+    summed at once in byte wide lanes. This is exact, since there are never more than 255 rows.
+    """
+    total = sum(int.from_bytes(row.translate(table), "little") for row in rows)
+    return total.to_bytes(width, "little")
+
+
+def _average_color(open_count: int, visited_count: int, cell_count: int) -> Color:
+    """Get the average color of unvisited open, visited, and solid cells."""
+    unvisited_open_count = max(0, open_count - visited_count)
+    solid_count = cell_count - unvisited_open_count - visited_count
+    return tuple(  # type: ignore[return-value]
+        (
+            unvisited_open_count * open_channel
+            + visited_count * visited_channel
+            + solid_count * solid_channel
+        ) // cell_count
+        for open_channel, visited_channel, solid_channel in zip(
+            CELL_COLORS[_OPEN], OVERLAY_COLORS[OVERLAY_VISITED], CELL_COLORS[_SOLID]
+        )
+    )
+
+
+def encode_png(width: int, height: int, rgb_rows: list[bytes]) -> bytes:
+    """Encode rows of 8-bit RGB pixels as a PNG image."""
+    def chunk(chunk_type: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + chunk_type
+            + data
+            + struct.pack(">I", zlib.crc32(chunk_type + data))
+        )
+
+    # Each row starts with filter type 0 (no filtering).
+    raw_data = b"".join(b"\x00" + row for row in rgb_rows)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw_data))
+        + chunk(b"IEND", b"")
+    )
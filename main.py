@@ -1,43 +1,191 @@
-"""Main program module."""
-import functools
+"""Main program module.
+
+Only the maze core is imported at module level. The GUI and the solution cache are imported when
+they are used, so solving mazes headless never loads the GUI library (nor SQLite unless the cache
+is enabled with --cache).
+"""
+import argparse
+import os
+import sys
+import threading
+from typing import TYPE_CHECKING
 
-from fileparsing import get_maze_file_names
-from gui.gui_backend_interface import GUIBackendInterface
-from gui.guiapplication import GUIApplication
 from maze.maze import Maze, MazeFactory
-from maze.mazeblock import BlockFactory, BlockType
-from maze.routefinder import bfs_search
+from maze.mazeblock import BlockFactory, BlockSpec, BlockType
+from maze.routeencoding import write_route
+from maze.solvers import AUTO_SOLVER, MazeProfile, SolverRegistry, create_default_registry
+
+if TYPE_CHECKING:
+    from maze.solutioncache import SolutionCache
+    from mazecatalogue import MazeCatalogue
+
+_SOLUTION_CACHE_PATH: str = os.path.join(".cache", "solutions.sqlite3")
+_SORT_KEYS: tuple[str, ...] = ("name", "rows", "columns", "exit_count", "size", "mtime_ns")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run program.
+
+    Args:
+        argv: Command line arguments. If None (default), sys.argv is used.
+    """
+    arguments = _parse_arguments(argv)
+    block_factory = _create_block_factory()
+    if arguments.list:
+        _list_mazes(block_factory, arguments)
+        return
+
+    solution_cache: "SolutionCache | None" = None
+    if arguments.cache:
+        # Imported here since the cache (and SQLite) is not needed unless it is used.
+        from maze.solutioncache import SolutionCache  # pylint: disable=import-outside-toplevel
+
+        solution_cache = SolutionCache(_SOLUTION_CACHE_PATH)
+    try:
+        maze = Maze(MazeFactory(block_factory), solution_cache=solution_cache)
+        solver_registry = create_default_registry()
+        if arguments.solve is not None:
+            _solve_headless(maze, solver_registry, arguments)
+        else:
+            _run_gui(maze, block_factory, solver_registry, arguments.solve_in_process)
+    finally:
+        if solution_cache is not None:
+            solution_cache.close()
+
+
+def _parse_arguments(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Find the shortest route out of a maze.")
+    parser.add_argument(
+        "--list", action="store_true", help="list the mazes in data folder without GUI"
+    )
+    parser.add_argument(
+        "--sort",
+        choices=_SORT_KEYS,
+        default="name",
+        help="order of the listed mazes (default: name)",
+    )
+    parser.add_argument(
+        "--name", default="", help="list only the mazes whose file name contains this"
+    )
+    parser.add_argument(
+        "--min-size", type=int, default=0, help="list only the mazes of at least this many bytes"
+    )
+    parser.add_argument(
+        "--max-size", type=int, help="list only the mazes of at most this many bytes"
+    )
+    parser.add_argument(
+        "--solve",
+        metavar="MAZE",
+        help="solve a maze file in data folder without GUI and print the shortest route",
+    )
+    parser.add_argument(
+        "--step-limit",
+        type=int,
+        default=0,
+        help="max length of the route when solving without GUI (default: no limit)",
+    )
+    parser.add_argument(
+        "--solver",
+        default=AUTO_SOLVER,
+        help=f"solver used when solving without GUI (default: {AUTO_SOLVER})",
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="write the route to a file instead of stdout when solving without GUI",
+    )
+    parser.add_argument(
+        "--solve-in-process",
+        action="store_true",
+        help="solve mazes without block costs breadth-first in a separate process on GUI",
+    )
+    parser.add_argument(
+        "--cache", action="store_true", help="reuse solved routes stored in the solution cache"
+    )
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    """Run program."""
-    data_to_block_type_map = {
-        "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+def _create_block_factory() -> BlockFactory[str]:
+    data_to_block_type_map: dict[str, BlockSpec] = {
+        "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN,
+        # Terrain that is slower to move through.
+        "%": (BlockType.OPEN, 3), "~": (BlockType.OPEN, 5),
     }
+    return BlockFactory[str](data_to_block_type_map)
+
+
+def _create_maze_catalogue(block_factory: BlockFactory[str]) -> "MazeCatalogue":
+    # Imported here since the catalogue is not needed for solving.
+    from mazecatalogue import MazeCatalogue  # pylint: disable=import-outside-toplevel
+
+    return MazeCatalogue(block_factory.block_type_codes())
+
+
+def _list_mazes(block_factory: BlockFactory[str], arguments: argparse.Namespace) -> None:
+    """Print the catalogued information of the mazes matching the filters."""
+    catalogue = _create_maze_catalogue(block_factory)
+    catalogue.refresh()
+    entries = catalogue.entries(arguments.name, arguments.min_size, arguments.max_size)
+    print(f"{'name':<30} {'rows':>6} {'columns':>8} {'starts':>7} {'exits':>6} {'bytes':>10}")
+    for maze_info in sorted(entries, key=lambda entry: getattr(entry, arguments.sort)):
+        print(
+            f"{maze_info.name:<30} {maze_info.rows:>6} {maze_info.columns:>8} "
+            f"{maze_info.start_count:>7} {maze_info.exit_count:>6} {maze_info.size:>10}"
+        )
 
-    # Create factories and maze object.
-    block_factory = BlockFactory[str](data_to_block_type_map)
-    maze_factory = MazeFactory(block_factory)
-    maze = Maze(maze_factory)
+
+def _solve_headless(
+    maze: Maze, solver_registry: SolverRegistry, arguments: argparse.Namespace
+) -> None:
+    """Solve maze in this thread and write the route as run-length encoded moves."""
+    maze.create_maze(arguments.solve)
+    solver_name = solver_registry.resolve(
+        arguments.solver, MazeProfile.from_blocks(maze.get_maze())
+    )
+    maze.solver = solver_registry.get(solver_name)
+    solved = threading.Event()
+    maze.solve_maze(arguments.step_limit, on_finished=solved.set)
+    solved.wait()
+
+    route = maze.shortest_route.blocks
+    if route is None:
+        print("Solution to maze not found.")
+        return
+    print(f"Shortest route length: {len(route)} (solver: {solver_name})")
+    if arguments.output is None:
+        write_route((block.index for block in route), sys.stdout)
+        return
+    with open(arguments.output, "w", encoding="utf-8") as output_file:
+        write_route((block.index for block in route), output_file)
+
+
+def _run_gui(
+    maze: Maze,
+    block_factory: BlockFactory[str],
+    solver_registry: SolverRegistry,
+    solve_in_process: bool,
+) -> None:
+    # Imported here since the GUI library is heavy and not needed when solving headless.
+    # pylint: disable=import-outside-toplevel
+    from gui.gui_backend_interface import GUIBackendInterface
+    from gui.guiapplication import GUIApplication
+    # pylint: enable=import-outside-toplevel
 
     # Create gui backend interface.
+    # Solver is chosen from the registry for each solve.
     gui_backend_interface = GUIBackendInterface(
-        get_maze_file_names,
+        _create_maze_catalogue(block_factory).names,
         maze,
+        solver_registry,
+        solve_in_process,
     )
 
-    # Create solver for maze.
-    maze_solver = functools.partial(
-        bfs_search,
-        gui_hook_visited_block_index=gui_backend_interface.set_new_visited_blocks
-    )
-
-    # Add solver to maze.
-    maze.solver = maze_solver
-
     # Create application and run.
     gui = GUIApplication(gui_backend_interface)
-    gui.run()
+    try:
+        gui.run()
+    finally:
+        gui_backend_interface.close()
 
 
 if __name__ == "__main__":
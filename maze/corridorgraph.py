@@ -0,0 +1,159 @@
+"""Solver searching a graph of junctions connected by corridors instead of single blocks.
+
+Blocks with exactly two open neighbours form corridors, where the search has no choices to make.
+The maze is contracted into a graph whose nodes are the other blocks (junctions, dead ends, start,
+and exits) and whose edges are the corridors between them, weighted by the sum of the costs of the
+blocks moved to. The shortest route is searched on the graph with Dijkstra's algorithm and then
+expanded back to blocks.
+"""
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from maze.maze import SolvedRoute
+from maze.mazeblock import BlockIndex, BlockType, MazeBlock
+
+
+@dataclass
+class _Edge:
+    """Class representing a corridor from a node to another node."""
+
+    target: MazeBlock
+    cost: int
+    blocks: list[MazeBlock]
+    """Blocks moved to from the source node, target node included."""
+
+
+class CorridorGraph:  # pylint: disable=too-few-public-methods
+    """Class representing the junctions and corridors reachable from a start block."""
+
+    def __init__(self, start: MazeBlock) -> None:
+        """Contract the blocks reachable from start block into a graph."""
+        self.start = start
+        self.edges: dict[tuple[int, int], list[_Edge]] = {}
+        nodes_to_check = [start]
+        while nodes_to_check:
+            node = nodes_to_check.pop()
+            key = (node.index.row, node.index.column)
+            if key in self.edges:
+                continue
+            self.edges[key] = node_edges = [
+                edge for first_block in node.adjacent_blocks()
+                if (edge := self._follow_corridor(node, first_block)).target is not node
+            ]
+            nodes_to_check += [edge.target for edge in node_edges]
+
+    @staticmethod
+    def is_node(block: MazeBlock) -> bool:
+        """Get whether a block is a node, i.e. not an open block in the middle of a corridor."""
+        return block.type_ != BlockType.OPEN or len(block.adjacent_blocks()) != 2
+
+    @classmethod
+    def _follow_corridor(cls, node: MazeBlock, first_block: MazeBlock) -> _Edge:
+        """Move from node through the corridor starting at first block until the next node."""
+        blocks = [first_block]
+        cost = first_block.cost
+        previous_block, block = node, first_block
+        while not cls.is_node(block):
+            previous_block, block = block, next(
+                adjacent_block for adjacent_block in block.adjacent_blocks()
+                if adjacent_block is not previous_block
+            )
+            blocks.append(block)
+            cost += block.cost
+        return _Edge(block, cost, blocks)
+
+
+class CorridorGraphSolver:  # pylint: disable=too-few-public-methods
+    """Solver searching the corridor graph of a maze for the cheapest route to exit.
+
+    The graph is built on the first solve and reused for as long as the solver is called with the
+    same start block, i.e. until another maze is loaded. Without block costs, the routes and the
+    step limit are the same as with bfs_search. With block costs, the max length is a cost budget
+    as with dial_search.
+    """
+
+    def __init__(self) -> None:
+        """Initialize solver without a graph."""
+        self._graph: CorridorGraph | None = None
+
+    def __call__(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        start: MazeBlock,
+        solved_route: SolvedRoute,
+        max_length: int = 0,
+        slow_down: bool = False,
+        gui_hook_visited_block_index: Callable[[list[BlockIndex]], None] | None = None,
+    ) -> None:
+        """Find cheapest route from start to exit.
+
+        Args:
+            start: Block to start from.
+            max_length: Max cost of the route to find, i.e. the sum of the costs of the blocks
+                moved to. If 0 (default), find any cost.
+        """
+        graph = self.graph(start)
+        start_key = (start.index.row, start.index.column)
+        route_costs = {start_key: 0}
+        parents: dict[tuple[int, int], tuple[MazeBlock, _Edge]] = {}
+        # Counter keeps the order of nodes with equal costs stable and blocks uncompared.
+        counter = itertools.count()
+        nodes_to_check: list[tuple[int, int, MazeBlock]] = [(0, next(counter), start)]
+        while nodes_to_check:
+            route_cost, _, node = heapq.heappop(nodes_to_check)
+            key = (node.index.row, node.index.column)
+            # Skip nodes already checked with a lower cost.
+            if route_cost > route_costs[key]:
+                continue
+
+            # Slow down for visualization of solving process if slow_down is set.
+            if slow_down:
+                time.sleep(0.01)
+
+            if node.type_ == BlockType.EXIT:
+                solved_route.blocks = self._expand_route(start, node, parents)
+                return
+
+            for edge in graph.edges[key]:
+                target_key = (edge.target.index.row, edge.target.index.column)
+                target_route_cost = route_cost + edge.cost
+                if target_route_cost < route_costs.get(target_key, target_route_cost + 1) and (
+                    max_length == 0 or target_route_cost <= max_length
+                ):
+                    route_costs[target_key] = target_route_cost
+                    parents[target_key] = (node, edge)
+                    heapq.heappush(nodes_to_check, (target_route_cost, next(counter), edge.target))
+                    if gui_hook_visited_block_index is not None:
+                        gui_hook_visited_block_index([
+                            block.index for block in edge.blocks if block.type_ == BlockType.OPEN
+                        ])
+
+        # No solution within cost limits found.
+        solved_route.blocks = None
+
+    def graph(self, start: MazeBlock) -> CorridorGraph:
+        """Get graph of the maze of start block, building it if the maze has changed."""
+        if self._graph is None or self._graph.start is not start:
+            self._graph = CorridorGraph(start)
+        return self._graph
+
+    @staticmethod
+    def _expand_route(
+        start: MazeBlock,
+        exit_block: MazeBlock,
+        parents: dict[tuple[int, int], tuple[MazeBlock, _Edge]],
+    ) -> list[MazeBlock]:
+        """Get route from start block to the block before exit through the corridor blocks."""
+        edges: list[_Edge] = []
+        node = exit_block
+        while node is not start:
+            node, edge = parents[(node.index.row, node.index.column)]
+            edges.append(edge)
+        route = [start]
+        for edge in reversed(edges):
+            route += edge.blocks
+        # Exit block is not part of the route.
+        route.pop()
+        return route
@@ -1,10 +1,22 @@
 """Maze representation."""
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from threading import Thread
-from typing import Callable, Iterable
+from typing import TYPE_CHECKING, Any, Callable, Iterable, overload
 
-from fileparsing import MazeFileContext
-from maze.mazeblock import BlockFactory, BlockDataT, BlockIndex, BlockType, MazeBlock
+from maze.mazeblock import (
+    BLOCK_TYPE_CODES,
+    BlockFactory,
+    BlockDataT,
+    BlockIndex,
+    BlockType,
+    MazeBlock,
+)
+
+if TYPE_CHECKING:
+    from maze.mazegrid import MazeGrid
+    from maze.routefinder import ShortestRoutes
+    from maze.solutioncache import SolutionCache, SolutionKey
 
 
 class MazeFactory:  # pylint: disable=too-few-public-methods
@@ -15,10 +27,16 @@ class MazeFactory:  # pylint: disable=too-few-public-methods
         block_factory: BlockFactory[BlockDataT],
     ) -> None:
         """Initialize maze factory."""
-        self._block_factory = block_factory
+        # Factory is not generic, so the block data of the blocks it creates is not known.
+        self._block_factory: BlockFactory[Any] = block_factory
         self._blocks: list[list[MazeBlock]] = []
         self._start_block: MazeBlock | None = None
 
+    @property
+    def block_factory(self) -> BlockFactory[Any]:
+        """Get the factory the blocks are created with."""
+        return self._block_factory
+
     def create_maze(self, maze_name: str) -> tuple[list[list[MazeBlock]], MazeBlock]:
         """Create maze data.
 
@@ -28,8 +46,23 @@ class MazeFactory:  # pylint: disable=too-few-public-methods
             A tuple containing a list of lists of MazeBlocks (the maze)
             and the start block for the maze.
         """
+        # Imported here to keep importing the maze package free of file handling.
+        from fileparsing import MazeFileContext  # pylint: disable=import-outside-toplevel
+
         with MazeFileContext(maze_name) as maze_file:
-            self._create_rows(maze_file)
+            return self.create_maze_from_rows(maze_file)
+
+    def create_maze_from_rows(
+        self, maze_data: Iterable[Iterable[BlockDataT]]
+    ) -> tuple[list[list[MazeBlock]], MazeBlock]:
+        """Create maze data from rows of block data instead of a maze file.
+
+        Returns:
+            A tuple containing a list of lists of MazeBlocks (the maze)
+            and the start block for the maze.
+        """
+        self._start_block = None
+        self._create_rows(maze_data)
         maze = self._blocks.copy()
         self._blocks.clear()
 
@@ -38,6 +71,26 @@ class MazeFactory:  # pylint: disable=too-few-public-methods
 
         return maze, self._start_block
 
+    def create_grid(self, maze_name: str, workers: int = 1) -> "MazeGrid":
+        """Create maze grid in shared memory parsing the maze file in parallel.
+
+        Unlike create_maze, no MazeBlocks are created. The maze is stored only as cell codes in
+        shared memory, which the worker processes decode the file straight into. Block costs are
+        not stored in the grid.
+
+        Args:
+            maze_name: Name of the maze file in data folder. Block data must be single characters.
+            workers: Amount of worker processes. If 1 (default), the file is parsed in this process.
+        """
+        # Imported here since multiprocessing is not needed unless grids are used.
+        # pylint: disable=import-outside-toplevel
+        from fileparsing import create_translation_table, get_maze_file_path
+        from maze.mazegrid import parse_maze_grid
+        # pylint: enable=import-outside-toplevel
+
+        translation_table = create_translation_table(self._block_factory.block_type_codes())
+        return parse_maze_grid(get_maze_file_path(maze_name), translation_table, workers)
+
     def _create_rows(self, maze_data: Iterable[Iterable[BlockDataT]]) -> None:
         """Create rows one by one."""
         for row_data in maze_data:
@@ -85,6 +138,54 @@ class MazeFactory:  # pylint: disable=too-few-public-methods
             left.right = block
 
 
+class CellRows(Sequence[bytes]):
+    """Class representing the cell codes (see BLOCK_TYPE_CODES) of a maze row by row.
+
+    Rows are padded to equal length with solid cells. Each row is created from the blocks on the
+    first access and kept, so rows that are never read are never created.
+    """
+
+    _SOLID_CODE = bytes([BLOCK_TYPE_CODES[BlockType.SOLID]])
+
+    def __init__(self, blocks: list[list[MazeBlock]]) -> None:
+        """Initialize cell rows of the blocks. The blocks must not change afterwards."""
+        self._blocks = blocks
+        self._rows: list[bytes | None] = [None] * len(blocks)
+        self.columns = max((len(row) for row in blocks), default=0)
+        """Amount of columns (i.e. the length of each row)."""
+
+    @overload
+    def __getitem__(self, index: int) -> bytes:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[bytes]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> bytes | Sequence[bytes]:
+        """Get cell codes of a row (or rows)."""
+        if isinstance(index, slice):
+            return [self._row(row) for row in range(len(self._rows))[index]]
+        return self._row(range(len(self._rows))[index])
+
+    def __len__(self) -> int:
+        """Get amount of rows."""
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate cell codes of the rows."""
+        return (self._row(row) for row in range(len(self._rows)))
+
+    def _row(self, row: int) -> bytes:
+        if (cell_row := self._rows[row]) is None:
+            blocks = self._blocks[row]
+            cell_row = self._rows[row] = (
+                bytes(BLOCK_TYPE_CODES[block.type_] for block in blocks)
+                + self._SOLID_CODE * (self.columns - len(blocks))
+            )
+        return cell_row
+
+
 @dataclass
 class SolvedRoute:
     """Class representing a solved route in maze.
@@ -102,29 +203,95 @@ class Maze:  # pylint: disable=too-few-public-methods
     def __init__(
         self,
         maze_factory: MazeFactory,
-        solver: Callable[[MazeBlock, int], list[MazeBlock] | None] | None = None,
+        solver: Callable[[MazeBlock, SolvedRoute, int, bool], None] | None = None,
+        solution_cache: "SolutionCache | None" = None,
     ) -> None:
-        """Create maze."""
+        """Create maze.
+
+        Args:
+            maze_factory: Factory used for creating the maze structure.
+            solver: Solver used for solving the maze.
+            solution_cache: Cache checked before solving and updated after solving the maze.
+        """
         self._maze_factory = maze_factory
         self._blocks: list[list[MazeBlock]] = []
-        self._start_block: MazeBlock | None
+        self._start_block: MazeBlock | None = None
+        self._cell_rows: CellRows | None = None
+        self._maze_name: str | None = None
+        self._maze_hash: str | None = None
         self.solver = solver
+        self.solution_cache = solution_cache
         self.shortest_route = SolvedRoute([])
         self._solver_has_been_running = False
 
     def create_maze(self, maze_name: str) -> None:
         """Create maze from data."""
         self._blocks, self._start_block = self._maze_factory.create_maze(maze_name)
+        self._cell_rows = None
+        self._maze_name = maze_name
+        self._maze_hash = None
+        # Hash is taken right away (if needed) so it matches the content the maze was created from.
+        if self.solution_cache is not None:
+            self._maze_hash = self._hash_maze_file(maze_name)
 
     def get_maze(self) -> list[list[MazeBlock]]:
         """Get created maze data structure."""
         return self._blocks
 
-    def solve_maze(self, max_route_length: int = 0, slow_down: bool = False) -> None:
+    def get_cell_rows(self) -> CellRows:
+        """Get cell codes (see BLOCK_TYPE_CODES) of the created maze row by row.
+
+        The same rows are shared by all the callers until another maze is created. Each row is
+        created on its first access, so getting the rows does not go through the blocks.
+        """
+        if self._cell_rows is None:
+            self._cell_rows = CellRows(self._blocks)
+        return self._cell_rows
+
+    def create_grid(self) -> "MazeGrid":
+        """Create maze grid in shared memory from the created maze. Block costs are not stored.
+
+        The caller owns the grid and must close it.
+        """
+        # Imported here since multiprocessing is not needed unless grids are used.
+        from maze.mazegrid import MazeGrid  # pylint: disable=import-outside-toplevel
+
+        if not self._blocks:
+            raise ValueError("Could not create grid. Empty maze is not valid.")
+        cell_rows = self.get_cell_rows()
+        return MazeGrid.create(b"".join(cell_rows), len(cell_rows), cell_rows.columns)
+
+    def count_shortest_routes(self, max_route_length: int = 0) -> "ShortestRoutes | None":
+        """Count (and allow enumerating) all the cheapest routes from start to the nearest exits.
+
+        Without block costs, the cheapest routes are the shortest routes.
+
+        Args:
+            max_route_length: Max cost of the routes to count (the length without block costs).
+                If 0 (default), count any cost.
+        Returns:
+            Shortest routes or None if no route was found.
+        """
+        # Imported here since routefinder depends on this module.
+        # pylint: disable=import-outside-toplevel
+        from maze.routefinder import count_shortest_routes
+        # pylint: enable=import-outside-toplevel
+
+        if not self._blocks or self._start_block is None:
+            raise ValueError("Could not count routes. Empty maze is not valid.")
+        return count_shortest_routes(self._start_block, max_route_length)
+
+    def solve_maze(
+        self,
+        max_route_length: int = 0,
+        slow_down: bool = False,
+        on_finished: Callable[[], None] | None = None,
+    ) -> None:
         """Solve maze finding shortest route from start to exit.
 
         Args:
             max_length: Max length of the route to find. If 0 (default), find any length.
+            on_finished: Called from the solver thread when the solver has finished.
         Returns:
             List of MazeBlocks or None if no route was found.
         """
@@ -138,15 +305,79 @@ class Maze:  # pylint: disable=too-few-public-methods
             raise ValueError("Start block type 'None' invalid.")
 
         self._solver_has_been_running = True
+
+        solution_key: "SolutionKey | None" = None
+        if self.solution_cache is not None:
+            solution_key = self._solution_key(max_route_length)
+            if (cached_solution := self.solution_cache.get(solution_key)) is not None:
+                self.shortest_route.blocks = (
+                    None if cached_solution.route is None
+                    else [self._blocks[index.row][index.column] for index in cached_solution.route]
+                )
+                if on_finished is not None:
+                    on_finished()
+                return
+
         solver_thread = Thread(
-            target=self.solver,
-            args=(self._start_block, self.shortest_route, max_route_length, slow_down)
+            target=self._run_solver,
+            args=(
+                self.solver,
+                self._start_block,
+                max_route_length,
+                slow_down,
+                on_finished,
+                solution_key,
+            ),
         )
         solver_thread.start()
 
+    def _run_solver(  # pylint: disable=too-many-arguments
+        self,
+        solver: Callable[[MazeBlock, SolvedRoute, int, bool], None],
+        start_block: MazeBlock,
+        max_route_length: int,
+        slow_down: bool,
+        on_finished: Callable[[], None] | None,
+        solution_key: "SolutionKey | None",
+    ) -> None:
+        try:
+            solver(start_block, self.shortest_route, max_route_length, slow_down)
+            route = self.shortest_route.blocks
+            if self.solution_cache is not None and solution_key is not None and route != []:
+                self.solution_cache.put(
+                    solution_key, None if route is None else [block.index for block in route]
+                )
+        finally:
+            if on_finished is not None:
+                on_finished()
+
+    def _solution_key(self, max_route_length: int) -> "SolutionKey":
+        # Imported here since the cache is optional.
+        # pylint: disable=import-outside-toplevel
+        from maze.solutioncache import SolutionKey, block_map_digest, solver_identity
+        # pylint: enable=import-outside-toplevel
+
+        if self._maze_name is None or self._start_block is None:
+            raise ValueError("Could not create solution key. Maze has not been created.")
+        if self._maze_hash is None:
+            self._maze_hash = self._hash_maze_file(self._maze_name)
+        return SolutionKey(
+            self._maze_hash,
+            block_map_digest(self._maze_factory.block_factory.block_specs()),
+            self._start_block.index,
+            max_route_length,
+            solver_identity(self.solver),
+        )
+
+    @staticmethod
+    def _hash_maze_file(maze_name: str) -> str:
+        from fileparsing import hash_maze_file  # pylint: disable=import-outside-toplevel
+
+        return hash_maze_file(maze_name)
+
     def _clear(self) -> None:
         self.shortest_route.blocks = []
-        for row in self._blocks:
-            for block in row:
-                block.clear()
+        # Advancing the search epoch marks every block unvisited without touching the blocks.
+        if self._start_block is not None:
+            self._start_block.epoch.advance()
         self._solver_has_been_running = False
@@ -26,50 +26,77 @@ class BlockType(StrEnum):
     SOLID = "Solid"
 
 
+BLOCK_TYPE_CODES: dict[BlockType, int] = {
+    BlockType.SOLID: 0,
+    BlockType.OPEN: 1,
+    BlockType.START: 2,
+    BlockType.EXIT: 3,
+}
+"""Compact single byte codes of block types used by array based maze storages."""
+
+CODE_BLOCK_TYPES: dict[int, BlockType] = {code: type_ for type_, code in BLOCK_TYPE_CODES.items()}
+
+BlockSpec = BlockType | tuple[BlockType, int]
+"""Block type, optionally with the integer cost of moving to the block (e.g. for mud or water)."""
+
+
+class SearchEpoch:  # pylint: disable=too-few-public-methods
+    """Class representing the search that is currently running.
+
+    A block is visited only if it has been stamped with the current epoch, so the visited state of
+    all the blocks sharing the epoch can be cleared in constant time by advancing the epoch.
+    """
+
+    def __init__(self) -> None:
+        """Initialize search epoch."""
+        self.value = 1
+
+    def advance(self) -> None:
+        """Start a new search, i.e. mark all the blocks sharing this epoch unvisited."""
+        self.value += 1
+
+
 @dataclass
 class MazeBlock:  # pylint: disable=too-many-instance-attributes
     """Class representing a single block of maze."""
 
     type_: BlockType
     index: BlockIndex
-    visited: bool = False
     left: Self | None = None
     right: Self | None = None
     above: Self | None = None
     below: Self | None = None
-    route_to_start: list["MazeBlock"] = field(default_factory=list)
-    """Used for storing route to starting block when solving the maze."""
+    cost: int = 1
+    """Cost of moving to the block."""
+    epoch: SearchEpoch = field(default_factory=SearchEpoch, compare=False, repr=False)
+    """Search epoch shared by the blocks of the same maze."""
+    visited_epoch: int = field(default=0, compare=False)
+    """Epoch of the search that visited the block last."""
+
+    @property
+    def visited(self) -> bool:
+        """Get whether block has been visited in the current search."""
+        return self.visited_epoch == self.epoch.value
+
+    @visited.setter
+    def visited(self, visited: bool) -> None:
+        """Mark block visited or unvisited in the current search."""
+        self.visited_epoch = self.epoch.value if visited else 0
 
     def clear(self) -> None:
         """Clear block data."""
         self.visited = False
-        self.route_to_start = []
+
+    def adjacent_blocks(self) -> list["MazeBlock"]:
+        """Get adjacent non-solid blocks whether they have been visited or not."""
+        return [
+            block for block in (self.left, self.right, self.above, self.below)
+            if block is not None and block.type_ != BlockType.SOLID
+        ]
 
     def next_available_blocks(self) -> list["MazeBlock"]:
         """Get next adjacent unvisited non-solid blocks."""
-        available_blocks: list["MazeBlock"] = []
-        if self.left is not None and self.left.type_ != BlockType.SOLID and not self.left.visited:
-            available_blocks.append(self.left)
-        if (
-            self.right is not None
-            and self.right.type_ != BlockType.SOLID
-            and not self.right.visited
-        ):
-            available_blocks.append(self.right)
-        if (
-            self.above is not None
-            and self.above.type_ != BlockType.SOLID
-            and not self.above.visited
-        ):
-            available_blocks.append(self.above)
-        if (
-            self.below is not None
-            and self.below.type_ != BlockType.SOLID
-            and not self.below.visited
-        ):
-            available_blocks.append(self.below)
-
-        return available_blocks
+        return [block for block in self.adjacent_blocks() if not block.visited]
 
     def __str__(self) -> str:
         """Get string representation of MazeBlock.
@@ -97,16 +124,45 @@ class MazeBlock:  # pylint: disable=too-many-instance-attributes
 class BlockFactory(Generic[BlockDataT]):  # pylint: disable=too-few-public-methods
     """Class for creating blocks."""
 
-    def __init__(self, data_to_block_type_map: dict[BlockDataT, BlockType]) -> None:
-        """Initialize block factory."""
-        self._data_to_block_type_map = data_to_block_type_map
+    def __init__(self, data_to_block_type_map: dict[BlockDataT, BlockSpec]) -> None:
+        """Initialize block factory.
+
+        Args:
+            data_to_block_type_map: Map from block data to block type or to a tuple of block type
+                and the cost of moving to the block. Blocks without a cost have cost 1.
+
+        Raises:
+            ValueError: Block cost is not a positive integer.
+        """
+        self._data_to_block_type_map: dict[BlockDataT, tuple[BlockType, int]] = {}
+        for data, block_spec in data_to_block_type_map.items():
+            type_, cost = block_spec if isinstance(block_spec, tuple) else (block_spec, 1)
+            if not isinstance(cost, int) or cost < 1:
+                raise ValueError(f"Invalid cost '{cost}' for block data '{data}'.")
+            self._data_to_block_type_map[data] = (type_, cost)
+        self.search_epoch = SearchEpoch()
+        """Search epoch shared by all the blocks created by this factory."""
+
+    def block_type_codes(self) -> dict[BlockDataT, int]:
+        """Get map from block data to block type codes (see BLOCK_TYPE_CODES)."""
+        return {
+            data: BLOCK_TYPE_CODES[type_]
+            for data, (type_, _) in self._data_to_block_type_map.items()
+        }
+
+    def block_specs(self) -> dict[BlockDataT, tuple[BlockType, int]]:
+        """Get map from block data to block type and the cost of moving to the block."""
+        return self._data_to_block_type_map.copy()
 
     def create_block(self, data: BlockDataT, index: BlockIndex) -> MazeBlock:
         """Create a maze block from data."""
         if data not in self._data_to_block_type_map:
             raise KeyError(f"Invalid block data '{data}'. Block could not be created.")
 
+        type_, cost = self._data_to_block_type_map[data]
         return MazeBlock(
-            type_=self._data_to_block_type_map[data],
+            type_=type_,
             index=index,
+            cost=cost,
+            epoch=self.search_epoch,
         )
@@ -0,0 +1,280 @@
+"""Array based maze representation in shared memory.
+
+MazeGrid stores the maze as single byte cell codes (see BLOCK_TYPE_CODES) row by row in one
+multiprocessing.shared_memory buffer, so other processes can use the maze without copying it.
+
+Maze files are parsed in parallel: the file is split into byte ranges at newline boundaries and
+each worker process decodes its range straight into the shared buffer.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any, Callable, Generator, Self, TypeVar
+
+from fileparsing import INVALID_CELL_CODE
+from maze.mazeblock import BLOCK_TYPE_CODES, CODE_BLOCK_TYPES, BlockIndex, BlockType
+
+_SOLID = BLOCK_TYPE_CODES[BlockType.SOLID]
+_START = BLOCK_TYPE_CODES[BlockType.START]
+_EXIT = BLOCK_TYPE_CODES[BlockType.EXIT]
+
+_READ_CHUNK_SIZE: int = 16 * 1024 * 1024
+
+_T = TypeVar("_T")
+
+
+class MazeGrid:
+    """Class representing a maze as a grid of cell codes in shared memory."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        shared_memory: SharedMemory,
+        rows: int,
+        columns: int,
+        start: BlockIndex,
+        exits: list[BlockIndex],
+        owner: bool = True,
+    ) -> None:
+        """Initialize maze grid over shared memory.
+
+        Args:
+            shared_memory: Shared memory containing rows * columns cell codes.
+            rows: Row count.
+            columns: Column count.
+            start: Index of the start block.
+            exits: Indices of the exit blocks.
+            owner: Whether the shared memory is released (unlinked) when the grid is closed.
+        """
+        self.shared_memory = shared_memory
+        self.rows = rows
+        self.columns = columns
+        self.start = start
+        self.exits = exits
+        self._owner = owner
+        self.cells = shared_memory.buf[:rows * columns]
+        """Zero-copy view of the cell codes row by row."""
+
+    @classmethod
+    def create(cls, cell_codes: bytes, rows: int, columns: int) -> Self:
+        """Create grid in new shared memory from cell codes of rows * columns cells.
+
+        Raises:
+            ValueError: Invalid cell code count, empty maze, or maze without a start block.
+        """
+        if len(cell_codes) != rows * columns or not cell_codes:
+            raise ValueError("Could not create the grid. Invalid amount of cells.")
+        starts = list(_find_all(cell_codes, _START))
+        if not starts:
+            raise ValueError("Invalid start block type 'None'.")
+
+        shared_memory = SharedMemory(create=True, size=len(cell_codes))
+        shared_memory.buf[:len(cell_codes)] = cell_codes
+        return cls(
+            shared_memory,
+            rows,
+            columns,
+            BlockIndex(*divmod(starts[-1], columns)),
+            [BlockIndex(*divmod(position, columns)) for position in _find_all(cell_codes, _EXIT)],
+        )
+
+    @classmethod
+    def attach(
+        cls, name: str, rows: int, columns: int, start: BlockIndex, exits: list[BlockIndex]
+    ) -> Self:
+        """Attach to a grid created by another process without taking ownership of it."""
+        return cls(attach_shared_memory(name), rows, columns, start, exits, owner=False)
+
+    def __enter__(self) -> Self:
+        """Enter the context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context and close the grid."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the grid and release the shared memory if the grid owns it."""
+        self.cells.release()
+        self.shared_memory.close()
+        if self._owner:
+            self.shared_memory.unlink()
+
+    def cell(self, row: int, column: int) -> int:
+        """Get cell code of a cell. Cells outside of the maze are solid."""
+        if not (0 <= row < self.rows and 0 <= column < self.columns):
+            return _SOLID
+        return self.cells[row * self.columns + column]
+
+    def block_type(self, row: int, column: int) -> BlockType:
+        """Get block type of a cell. Cells outside of the maze are solid."""
+        return CODE_BLOCK_TYPES[self.cell(row, column)]
+
+    def row_codes(self, row: int) -> bytes:
+        """Get cell codes of a row."""
+        return bytes(self.cells[row * self.columns:(row + 1) * self.columns])
+
+
+def attach_shared_memory(name: str) -> SharedMemory:
+    """Attach to shared memory created by this process or a process it was started from.
+
+    Worker processes share the resource tracker of the process that started them, so attaching
+    does not change when the memory is released.
+    """
+    return SharedMemory(name)
+
+
+def parse_maze_grid(file_path: str, translation_table: bytes, workers: int = 1) -> MazeGrid:
+    """Parse a text maze file into a maze grid in shared memory.
+
+    Trailing whitespace of the rows is ignored and rows shorter than the longest row are padded
+    with solid cells, i.e. the same way as MazeFactory reads the files.
+
+    Args:
+        file_path: Path of the maze file.
+        translation_table: Table translating file bytes to cell codes (see
+            fileparsing.create_translation_table).
+        workers: Amount of worker processes. If 1, the file is parsed in this process.
+
+    Raises:
+        KeyError: File contains invalid block data.
+        ValueError: Empty maze or maze without a start block.
+    """
+    ranges = _split_at_newlines(file_path, workers)
+    scan_results = _map(workers, _scan_rows, [(file_path, *range_) for range_ in ranges])
+    rows = sum(row_count for row_count, _ in scan_results)
+    columns = max((width for _, width in scan_results), default=0)
+    if rows == 0 or columns == 0:
+        raise ValueError("Could not parse the maze. Empty maze is not valid.")
+
+    shared_memory = SharedMemory(create=True, size=rows * columns)
+    try:
+        first_rows = accumulate((row_count for row_count, _ in scan_results[:-1]), initial=0)
+        decode_results = _map(
+            workers,
+            _decode_rows,
+            [
+                (file_path, *range_, shared_memory.name, first_row, columns, translation_table)
+                for range_, first_row in zip(ranges, first_rows)
+            ],
+        )
+        starts: list[BlockIndex] = []
+        exits: list[BlockIndex] = []
+        for range_starts, range_exits, error in decode_results:
+            if error is not None:
+                raise KeyError(error)
+            starts += [BlockIndex(row, column) for row, column in range_starts]
+            exits += [BlockIndex(row, column) for row, column in range_exits]
+        if not starts:
+            raise ValueError("Invalid start block type 'None'.")
+    except BaseException:
+        shared_memory.close()
+        shared_memory.unlink()
+        raise
+
+    # The last start block is used, same as in MazeFactory.
+    return MazeGrid(shared_memory, rows, columns, starts[-1], exits)
+
+
+def _map(workers: int, function: Callable[..., _T], arguments: list[tuple[Any, ...]]) -> list[_T]:
+    """Call function with each argument tuple in worker processes (or in this process)."""
+    if workers == 1:
+        return [function(*args) for args in arguments]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, *zip(*arguments)))
+
+
+def _split_at_newlines(file_path: str, parts: int) -> list[tuple[int, int]]:
+    """Split file into byte ranges each starting at the beginning of a line."""
+    file_size = os.path.getsize(file_path)
+    boundaries = [0]
+    with open(file_path, "rb") as file_object:
+        for part in range(1, parts):
+            position = max(file_size * part // parts, boundaries[-1])
+            if position > 0:
+                # Move boundary to the beginning of the next line.
+                file_object.seek(position - 1)
+                file_object.readline()
+            boundaries.append(min(file_object.tell(), file_size))
+    boundaries.append(file_size)
+    return [
+        (start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end
+    ]
+
+
+def _read_lines(file_path: str, start: int, end: int) -> Generator[bytes, None, None]:
+    """Read lines between byte offsets without trailing whitespace chunk by chunk."""
+    with open(file_path, "rb") as file_object:
+        file_object.seek(start)
+        remainder = b""
+        position = start
+        while position < end:
+            chunk = file_object.read(min(_READ_CHUNK_SIZE, end - position))
+            position += len(chunk)
+            lines = (remainder + chunk).split(b"\n")
+            remainder = lines.pop()
+            for line in lines:
+                yield line.rstrip()
+        if remainder:
+            yield remainder.rstrip()
+
+
+def _scan_rows(file_path: str, start: int, end: int) -> tuple[int, int]:
+    """Get row count and max row width of a byte range."""
+    row_count = 0
+    width = 0
+    for line in _read_lines(file_path, start, end):
+        row_count += 1
+        width = max(width, len(line))
+    return row_count, width
+
+
+def _decode_rows(  # pylint: disable=too-many-arguments,too-many-locals
+    file_path: str,
+    start: int,
+    end: int,
+    shared_memory_name: str,
+    first_row: int,
+    columns: int,
+    translation_table: bytes,
+) -> tuple[list[tuple[int, int]], list[tuple[int, int]], str | None]:
+    """Decode rows of a byte range into shared memory.
+
+    Returns:
+        Start and exit positions found and an error message if the range contains invalid data.
+    """
+    shared_memory = attach_shared_memory(shared_memory_name)
+    starts: list[tuple[int, int]] = []
+    exits: list[tuple[int, int]] = []
+    error: str | None = None
+    try:
+        for row, line in enumerate(_read_lines(file_path, start, end), first_row):
+            codes = line.translate(translation_table)
+            if (invalid_column := codes.find(INVALID_CELL_CODE)) != -1:
+                error = (
+                    f"Invalid block data '{chr(line[invalid_column])}' at row {row} column "
+                    f"{invalid_column}. Block could not be created."
+                )
+                break
+            position = row * columns
+            shared_memory.buf[position:position + columns] = (
+                codes + bytes([_SOLID]) * (columns - len(codes))
+            )
+            starts += [(row, column) for column in _find_all(codes, _START)]
+            exits += [(row, column) for column in _find_all(codes, _EXIT)]
+    finally:
+        shared_memory.close()
+    return starts, exits, error
+
+
+def _find_all(codes: bytes, code: int) -> Generator[int, None, None]:
+    position = codes.find(code)
+    while position != -1:
+        yield position
+        position = codes.find(code, position + 1)
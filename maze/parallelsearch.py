@@ -0,0 +1,273 @@
+"""Level-synchronous parallel breadth-first search on a maze grid.
+
+The rows of the grid are split into horizontal bands, each owned by one worker process. Distances
+from the start block are stored in one shared memory array. The search advances one BFS layer at a
+time: each worker expands its part of the current layer, and after all the workers have finished
+the layer (barrier), the cells the workers found on the neighbouring bands are passed to the
+owners of those bands. Only the owner of a band writes distances of its cells.
+"""
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Self
+
+from maze.mazegrid import MazeGrid, attach_shared_memory
+from maze.mazeblock import BLOCK_TYPE_CODES, BlockIndex, BlockType
+
+_SOLID = BLOCK_TYPE_CODES[BlockType.SOLID]
+_EXIT = BLOCK_TYPE_CODES[BlockType.EXIT]
+_UNVISITED = -1
+
+_LayerResult = tuple[list[int], list[int], list[int], int]
+"""Exit cells found, cells found on the band above, cells found on the band below, and the size
+of the next layer of the band."""
+
+
+class _Band:  # pylint: disable=too-few-public-methods
+    """Class representing the rows of a grid owned by a single worker."""
+
+    def __init__(
+        self, grid: MazeGrid, distances: memoryview, first_row: int, last_row: int
+    ) -> None:
+        self._cells = grid.cells
+        self._rows = grid.rows
+        self._columns = grid.columns
+        self._distances = distances
+        self._first_cell = first_row * grid.columns
+        self._last_cell = last_row * grid.columns
+        self._layer: list[int] = []
+
+    def expand(self, distance: int, incoming_cells: list[int]) -> _LayerResult:
+        """Expand the current layer of the band.
+
+        Args:
+            distance: Distance of the current layer from the start block.
+            incoming_cells: Cells of the band found by the neighbouring bands on previous layer.
+        """
+        # Layer zero starts a new search.
+        if distance == 0:
+            self._layer = []
+        cells = self._cells
+        columns = self._columns
+        distances = self._distances
+        layer = self._layer
+        for cell in incoming_cells:
+            if distances[cell] == _UNVISITED:
+                distances[cell] = distance
+                layer.append(cell)
+
+        exits = [cell for cell in layer if cells[cell] == _EXIT]
+        if exits:
+            return exits, [], [], 0
+
+        next_layer: list[int] = []
+        cells_above: set[int] = set()
+        cells_below: set[int] = set()
+        for cell in layer:
+            row, column = divmod(cell, columns)
+            # Same order as in MazeBlock: left, right, above, below.
+            neighbours = (
+                cell - 1 if column > 0 else -1,
+                cell + 1 if column < columns - 1 else -1,
+                cell - columns if row > 0 else -1,
+                cell + columns if row < self._rows - 1 else -1,
+            )
+            for neighbour in neighbours:
+                if neighbour == -1 or cells[neighbour] == _SOLID:
+                    continue
+                if neighbour < self._first_cell:
+                    cells_above.add(neighbour)
+                elif neighbour >= self._last_cell:
+                    cells_below.add(neighbour)
+                elif distances[neighbour] == _UNVISITED:
+                    distances[neighbour] = distance + 1
+                    next_layer.append(neighbour)
+
+        self._layer = next_layer
+        return [], sorted(cells_above), sorted(cells_below), len(next_layer)
+
+
+def _run_worker(  # pylint: disable=too-many-arguments
+    connection: Connection,
+    grid_name: str,
+    rows: int,
+    columns: int,
+    start: BlockIndex,
+    distances_name: str,
+    first_row: int,
+    last_row: int,
+) -> None:
+    """Expand layers of a band until None is received."""
+    grid = MazeGrid.attach(grid_name, rows, columns, start, [])
+    distances_memory = attach_shared_memory(distances_name)
+    distances = distances_memory.buf[:rows * columns * 4].cast("i")
+    try:
+        band = _Band(grid, distances, first_row, last_row)
+        while (message := connection.recv()) is not None:
+            connection.send(band.expand(*message))
+    finally:
+        distances.release()
+        distances_memory.close()
+        grid.close()
+        connection.close()
+
+
+class ParallelBFS:
+    """Class for breadth-first searching a maze grid with worker processes.
+
+    Worker processes are started when the search is created and kept running between the searches
+    until the search is closed. The search can be used as a context manager that closes it.
+    """
+
+    def __init__(self, grid: MazeGrid, workers: int = 2) -> None:
+        """Start worker processes each owning a band of rows of the grid.
+
+        Args:
+            grid: Grid to search.
+            workers: Amount of worker processes (bands). If 1, the search runs in this process.
+        """
+        self._grid = grid
+        self._distances_size = grid.rows * grid.columns * 4
+        self._distances_memory = SharedMemory(create=True, size=self._distances_size)
+        self._distances = self._distances_memory.buf[:self._distances_size].cast("i")
+        band_count = max(1, min(workers, grid.rows))
+        self._band_first_rows = [grid.rows * band // band_count for band in range(band_count + 1)]
+        self._connections: list[Connection] = []
+        self._processes: list[multiprocessing.Process] = []
+        self._local_band: _Band | None = None
+        if band_count == 1:
+            self._local_band = _Band(grid, self._distances, 0, grid.rows)
+            return
+
+        for band in range(band_count):
+            parent_connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_run_worker,
+                args=(
+                    child_connection,
+                    grid.shared_memory.name,
+                    grid.rows,
+                    grid.columns,
+                    grid.start,
+                    self._distances_memory.name,
+                    self._band_first_rows[band],
+                    self._band_first_rows[band + 1],
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_connection.close()
+            self._connections.append(parent_connection)
+            self._processes.append(process)
+
+    def __enter__(self) -> Self:
+        """Enter the context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context and close the search."""
+        self.close()
+
+    def close(self) -> None:
+        """Stop worker processes and release the distances."""
+        for connection, process in zip(self._connections, self._processes):
+            connection.send(None)
+            process.join()
+            connection.close()
+        self._distances.release()
+        self._distances_memory.close()
+        self._distances_memory.unlink()
+
+    def search(self, max_length: int = 0) -> list[BlockIndex] | None:
+        """Find shortest route to exit.
+
+        Args:
+            max_length: Max length of the route to find. If 0 (default), find any length.
+        Returns:
+            Indices of the route blocks from start block to the block before the exit (same as
+            bfs_search) or None if no route was found.
+        """
+        band_count = len(self._band_first_rows) - 1
+        # All bits set is -1, i.e. unvisited.
+        self._distances_memory.buf[:self._distances_size] = b"\xff" * self._distances_size
+        start = self._grid.start
+        incoming: list[list[int]] = [[] for _ in range(band_count)]
+        incoming[self._band_of_row(start.row)].append(
+            start.row * self._grid.columns + start.column
+        )
+        distance = 0
+        while max_length == 0 or distance <= max_length:
+            results = self._expand_layer(distance, incoming)
+            exits = [cell for result in results for cell in result[0]]
+            if exits:
+                return self._route_to_start(min(exits), distance)
+
+            incoming = [[] for _ in range(band_count)]
+            for band, (_, cells_above, cells_below, _) in enumerate(results):
+                if band > 0:
+                    incoming[band - 1] += cells_above
+                if band < band_count - 1:
+                    incoming[band + 1] += cells_below
+            if not any(incoming) and all(result[3] == 0 for result in results):
+                break
+            distance += 1
+
+        # No solution within step limits found.
+        return None
+
+    def _expand_layer(self, distance: int, incoming: list[list[int]]) -> list[_LayerResult]:
+        """Expand a layer in all the bands and wait for all of them to finish."""
+        if self._local_band is not None:
+            return [self._local_band.expand(distance, incoming[0])]
+        for connection, band_incoming in zip(self._connections, incoming):
+            connection.send((distance, band_incoming))
+        return [connection.recv() for connection in self._connections]
+
+    def _band_of_row(self, row: int) -> int:
+        return next(
+            band for band in range(len(self._band_first_rows) - 1)
+            if row < self._band_first_rows[band + 1]
+        )
+
+    def _route_to_start(self, cell: int, distance: int) -> list[BlockIndex]:
+        """Walk from cell to start block through cells with decreasing distances."""
+        columns = self._grid.columns
+        route: list[BlockIndex] = []
+        while distance > 0:
+            distance -= 1
+            row, column = divmod(cell, columns)
+            for neighbour in (cell - 1, cell + 1, cell - columns, cell + columns):
+                neighbour_row, neighbour_column = divmod(neighbour, columns)
+                if (
+                    0 <= neighbour < len(self._distances)
+                    and abs(neighbour_row - row) + abs(neighbour_column - column) == 1
+                    and self._distances[neighbour] == distance
+                ):
+                    cell = neighbour
+                    break
+            route.append(BlockIndex(*divmod(cell, columns)))
+        route.reverse()
+        return route
+
+
+def parallel_bfs_search(
+    grid: MazeGrid, max_length: int = 0, workers: int = 2
+) -> list[BlockIndex] | None:
+    """Find shortest route to exit with a parallel breadth-first search.
+
+    Args:
+        grid: Grid to search.
+        max_length: Max length of the route to find. If 0 (default), find any length.
+        workers: Amount of worker processes.
+    Returns:
+        Indices of the route blocks from start block to the block before the exit (same as
+        bfs_search) or None if no route was found.
+    """
+    with ParallelBFS(grid, workers) as search:
+        return search.search(max_length)
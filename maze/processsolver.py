@@ -0,0 +1,334 @@
+"""Solving a maze grid in a separate process.
+
+The solver process searches a MazeGrid in shared memory breadth-first, so the solving process
+never competes with the GUI for the GIL. The progress and the result are shared through two more
+shared memory buffers:
+
+- Visited cells: a bitmap with one bit per cell (row * columns + column) preceded by a ring of
+  dirty chunk indices and the count of the indices ever written to the ring. The solver sets the
+  bits of the visited open cells and publishes the chunks of the bitmap it has changed in batches.
+  The count is written after the indices, so the indices up to the count are always complete.
+- Result: status and move count header followed by the moves of the route packed with
+  routeencoding.pack_moves.
+
+The process that started the solve polls the visited cells and the result whenever it wants to,
+e.g. at the frame rate of the GUI. Each poll compares only the chunks published since the previous
+poll with its own copy of the bitmap. If the solver has published more chunks than the ring holds
+since the previous poll, the whole bitmap is compared instead, so no cells are lost.
+"""
+import multiprocessing
+import struct
+from multiprocessing.shared_memory import SharedMemory
+
+from maze.mazeblock import BLOCK_TYPE_CODES, BlockIndex, BlockType
+from maze.mazegrid import MazeGrid, attach_shared_memory
+from maze.routeencoding import (
+    MOVE_DOWN,
+    MOVE_LEFT,
+    MOVE_OFFSETS,
+    MOVE_RIGHT,
+    MOVE_UP,
+    EncodedRoute,
+    pack_moves,
+)
+
+STATUS_RUNNING = 0
+STATUS_SOLVED = 1
+STATUS_NO_ROUTE = 2
+STATUS_FAILED = 3
+
+_RESULT_HEADER = struct.Struct("<IQ")
+"""Status and move count of the route."""
+_DIRTY_COUNT_SIZE = 8
+"""Size of the count of the dirty chunk indices written (native unsigned 64-bit integer)."""
+_DIRTY_INDEX_FORMAT = "Q"
+DIRTY_RING_SIZE: int = 4096
+"""Amount of dirty chunk indices the ring holds. Must be larger than _FLUSH_CHUNK_COUNT."""
+_CHUNK_SIZE = 64
+"""Size of a bitmap chunk in bytes, i.e. 512 cells."""
+_FLUSH_CHUNK_COUNT = 64
+"""Amount of dirty chunks after which the solver publishes them without waiting for the layer."""
+_NO_PARENT = 0xFF
+_OPEN = BLOCK_TYPE_CODES[BlockType.OPEN]
+_SOLID = BLOCK_TYPE_CODES[BlockType.SOLID]
+_EXIT = BLOCK_TYPE_CODES[BlockType.EXIT]
+
+
+class ProcessSolve:
+    """Class representing a breadth-first search of a maze grid running in a separate process."""
+
+    def __init__(self, grid: MazeGrid, max_length: int = 0) -> None:
+        """Start solving the grid in a new process.
+
+        The grid must stay open until the solve is closed.
+
+        Args:
+            grid: Grid to solve.
+            max_length: Max length of the route to find. If 0 (default), find any length. The
+                routes and the step limit are the same as with bfs_search.
+        """
+        self._grid = grid
+        cell_count = grid.rows * grid.columns
+        self._ring_size = DIRTY_RING_SIZE
+        self._visited_memory = SharedMemory(
+            create=True, size=_visited_memory_size(cell_count, self._ring_size)
+        )
+        self._dirty_count, self._dirty_ring, self._bitmap = _visited_views(
+            self._visited_memory, cell_count, self._ring_size
+        )
+        self._dirty_count[0] = 0
+        # Shared memory is not guaranteed to be zeroed on all platforms.
+        self._bitmap[:] = bytes(len(self._bitmap))
+        self._seen_dirty_count = 0
+        self._seen_bitmap = bytearray(len(self._bitmap))
+        self._result_size = _RESULT_HEADER.size + (cell_count + 3) // 4
+        self._result_memory = SharedMemory(create=True, size=self._result_size)
+        self._result_memory.buf[:_RESULT_HEADER.size] = _RESULT_HEADER.pack(STATUS_RUNNING, 0)
+        self._process = multiprocessing.Process(
+            target=_run_solve,
+            args=(
+                grid.shared_memory.name,
+                grid.rows,
+                grid.columns,
+                grid.start,
+                self._visited_memory.name,
+                self._ring_size,
+                self._result_memory.name,
+                max_length,
+            ),
+            daemon=True,
+        )
+        self._process.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the solver process to finish. Returns whether the process has finished."""
+        self._process.join(timeout)
+        return not self._process.is_alive()
+
+    def status(self) -> int:
+        """Get status of the solve (see STATUS_* constants)."""
+        status, _ = _RESULT_HEADER.unpack(self._result_memory.buf[:_RESULT_HEADER.size])
+        if status == STATUS_RUNNING and not self._process.is_alive():
+            return STATUS_FAILED
+        return int(status)
+
+    def route(self) -> EncodedRoute | None:
+        """Get route from start block to the block before exit, or None if there is no route yet.
+
+        Raises:
+            RuntimeError: Solver process failed.
+        """
+        status = self.status()
+        if status == STATUS_FAILED:
+            raise RuntimeError("Solver process failed.")
+        if status != STATUS_SOLVED:
+            return None
+        _, move_count = _RESULT_HEADER.unpack(self._result_memory.buf[:_RESULT_HEADER.size])
+        packed_moves_size = (move_count + 3) // 4
+        packed_moves = bytes(
+            self._result_memory.buf[_RESULT_HEADER.size:_RESULT_HEADER.size + packed_moves_size]
+        )
+        return EncodedRoute(self._grid.start, move_count, packed_moves)
+
+    def new_visited_cells(self) -> list[BlockIndex]:
+        """Get cells visited since the previous call.
+
+        Only the chunks of the bitmap published since the previous call are read, so polling is
+        cheap even when the maze is large. If the ring has been overwritten since the previous
+        call, the whole bitmap is read instead.
+        """
+        dirty_count = self._dirty_count[0]
+        chunk_indices = set(
+            self._dirty_ring[index % self._ring_size]
+            for index in range(self._seen_dirty_count, dirty_count)
+        )
+        # Ring may have been overwritten while it was read, so the count is checked afterwards.
+        # Solver may be writing a batch of indices past the count, too.
+        if self._dirty_count[0] - self._seen_dirty_count > self._ring_size - _FLUSH_CHUNK_COUNT:
+            chunk_indices = set(range(_ceil_div(len(self._bitmap), _CHUNK_SIZE)))
+        self._seen_dirty_count = dirty_count
+
+        columns = self._grid.columns
+        cells: list[BlockIndex] = []
+        for chunk_index in sorted(chunk_indices):
+            chunk = slice(chunk_index * _CHUNK_SIZE, (chunk_index + 1) * _CHUNK_SIZE)
+            # Solver may set more bits meanwhile, so the chunk is read only once.
+            visited = bytes(self._bitmap[chunk])
+            new_visited = int.from_bytes(visited, "little") & ~int.from_bytes(
+                self._seen_bitmap[chunk], "little"
+            )
+            if not new_visited:
+                continue
+            self._seen_bitmap[chunk] = visited
+            first_cell = chunk_index * _CHUNK_SIZE * 8
+            while new_visited:
+                lowest_bit = new_visited & -new_visited
+                cells.append(BlockIndex(*divmod(first_cell + lowest_bit.bit_length() - 1, columns)))
+                new_visited ^= lowest_bit
+        return cells
+
+    def close(self) -> None:
+        """Stop the solver process if it is still running and release the shared memory."""
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process.join()
+        self._process.close()
+        # Views into shared memory must be released before the memory can be closed.
+        for view in (self._dirty_count, self._dirty_ring, self._bitmap):
+            view.release()
+        for shared_memory in (self._visited_memory, self._result_memory):
+            shared_memory.close()
+            shared_memory.unlink()
+
+
+def _run_solve(  # pylint: disable=too-many-arguments
+    grid_name: str,
+    rows: int,
+    columns: int,
+    start: BlockIndex,
+    visited_name: str,
+    ring_size: int,
+    result_name: str,
+    max_length: int,
+) -> None:
+    """Solve grid and store the result."""
+    grid = MazeGrid.attach(grid_name, rows, columns, start, [])
+    visited_memory = attach_shared_memory(visited_name)
+    result_memory = attach_shared_memory(result_name)
+    views = _visited_views(visited_memory, rows * columns, ring_size)
+    try:
+        moves = _search(grid, _VisitedPublisher(*views), max_length)
+        if moves is None:
+            result_memory.buf[:_RESULT_HEADER.size] = _RESULT_HEADER.pack(STATUS_NO_ROUTE, 0)
+            return
+        packed_moves = pack_moves(moves)
+        result_memory.buf[_RESULT_HEADER.size:_RESULT_HEADER.size + len(packed_moves)] = (
+            packed_moves
+        )
+        # Status is written last, so the route is complete when it is seen as solved.
+        result_memory.buf[:_RESULT_HEADER.size] = _RESULT_HEADER.pack(STATUS_SOLVED, len(moves))
+    finally:
+        for view in views:
+            view.release()
+        visited_memory.close()
+        result_memory.close()
+        grid.close()
+
+
+class _VisitedPublisher:
+    """Class marking visited cells in the shared bitmap and publishing the changed chunks."""
+
+    def __init__(self, dirty_count: memoryview, dirty_ring: memoryview, bitmap: memoryview) -> None:
+        """Initialize publisher with views of the visited cells shared memory."""
+        self._dirty_count = dirty_count
+        self._dirty_ring = dirty_ring
+        self._bitmap = bitmap
+        self._written_count = 0
+        self._is_dirty = bytearray(_ceil_div(len(bitmap), _CHUNK_SIZE))
+        self._dirty_chunks: list[int] = []
+
+    def mark(self, cell: int) -> None:
+        """Mark cell visited. The change is seen by the polling process after the next flush."""
+        self._bitmap[cell >> 3] |= 1 << (cell & 7)
+        chunk_index = (cell >> 3) // _CHUNK_SIZE
+        if not self._is_dirty[chunk_index]:
+            self._is_dirty[chunk_index] = 1
+            self._dirty_chunks.append(chunk_index)
+            if len(self._dirty_chunks) >= _FLUSH_CHUNK_COUNT:
+                self.flush()
+
+    def flush(self) -> None:
+        """Publish the chunks changed since the previous flush."""
+        ring_size = len(self._dirty_ring)
+        for chunk_index in self._dirty_chunks:
+            self._dirty_ring[self._written_count % ring_size] = chunk_index
+            self._written_count += 1
+            self._is_dirty[chunk_index] = 0
+        self._dirty_chunks.clear()
+        # Count is written after the indices, so the indices up to the count are complete.
+        self._dirty_count[0] = self._written_count
+
+
+def _ceil_div(dividend: int, divisor: int) -> int:
+    return -(-dividend // divisor)
+
+
+def _visited_memory_size(cell_count: int, ring_size: int) -> int:
+    bitmap_size = _ceil_div(_ceil_div(cell_count, 8), _CHUNK_SIZE) * _CHUNK_SIZE
+    return _DIRTY_COUNT_SIZE + ring_size * struct.calcsize(_DIRTY_INDEX_FORMAT) + bitmap_size
+
+
+def _visited_views(
+    visited_memory: SharedMemory, cell_count: int, ring_size: int
+) -> tuple[memoryview, memoryview, memoryview]:
+    """Get views of the count of the dirty chunk indices, the ring of them, and the bitmap."""
+    ring_end = _DIRTY_COUNT_SIZE + ring_size * struct.calcsize(_DIRTY_INDEX_FORMAT)
+    # Shared memory may be larger than requested, so the bitmap end is computed, too.
+    bitmap_end = _visited_memory_size(cell_count, ring_size)
+    return (
+        visited_memory.buf[:_DIRTY_COUNT_SIZE].cast("Q"),
+        visited_memory.buf[_DIRTY_COUNT_SIZE:ring_end].cast(_DIRTY_INDEX_FORMAT),
+        visited_memory.buf[ring_end:bitmap_end],
+    )
+
+
+def _search(grid: MazeGrid, visited: _VisitedPublisher, max_length: int) -> list[int] | None:
+    """Breadth-first search layer by layer, the same way as bfs_search.
+
+    Returns:
+        Moves from start block to the block before exit or None if no route was found.
+    """
+    cells = grid.cells
+    columns = grid.columns
+    # Move from the parent of each found cell.
+    parent_moves = bytearray([_NO_PARENT]) * (grid.rows * columns)
+    start_cell = grid.start.row * columns + grid.start.column
+    # Start is found without a parent move, mark it with any move.
+    parent_moves[start_cell] = 0
+    # Same order as in MazeBlock: left, right, above, below.
+    neighbour_moves = [
+        (move, *MOVE_OFFSETS[move]) for move in (MOVE_LEFT, MOVE_RIGHT, MOVE_UP, MOVE_DOWN)
+    ]
+    cells_to_check = [start_cell]
+    route_length = 0
+    while cells_to_check and (max_length == 0 or route_length <= max_length):
+        next_cells: list[int] = []
+        for cell in cells_to_check:
+            cell_code = cells[cell]
+            if cell_code == _OPEN:
+                visited.mark(cell)
+            if cell_code == _EXIT:
+                visited.flush()
+                return _moves_to_cell(grid, cell, parent_moves, start_cell)[:-1]
+
+            row, column = divmod(cell, columns)
+            for move, row_offset, column_offset in neighbour_moves:
+                neighbour_row = row + row_offset
+                neighbour_column = column + column_offset
+                if not (0 <= neighbour_row < grid.rows and 0 <= neighbour_column < columns):
+                    continue
+                neighbour = neighbour_row * columns + neighbour_column
+                if cells[neighbour] != _SOLID and parent_moves[neighbour] == _NO_PARENT:
+                    parent_moves[neighbour] = move
+                    next_cells.append(neighbour)
+
+        visited.flush()
+        cells_to_check = next_cells
+        route_length += 1
+
+    # No solution within step limits found.
+    return None
+
+
+def _moves_to_cell(
+    grid: MazeGrid, cell: int, parent_moves: bytearray, start_cell: int
+) -> list[int]:
+    """Follow the parent moves from cell back to start block."""
+    moves: list[int] = []
+    while cell != start_cell:
+        move = parent_moves[cell]
+        moves.append(move)
+        row_offset, column_offset = MOVE_OFFSETS[move]
+        cell -= row_offset * grid.columns + column_offset
+    moves.reverse()
+    return moves
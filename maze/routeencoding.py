@@ -0,0 +1,228 @@
+"""Compact encoding of routes.
+
+A route is encoded as its first block and the moves between the blocks. Each move takes 2 bits, so
+four moves are packed into a byte.
+
+As text, the moves are run-length encoded with letters U, D, L, and R, e.g. "U3R2" for three moves
+up followed by two moves right (count 1 is left out). A route is written as the row and column of
+the first block followed by the moves, e.g. "4,2 U3R2". Routes are written and read as streams, so
+no list of the route blocks is needed.
+"""
+import itertools
+from dataclasses import dataclass
+from typing import Generator, Iterable, Self, Sequence, TextIO
+
+from maze.mazeblock import BlockIndex
+
+MOVE_UP = 0
+MOVE_DOWN = 1
+MOVE_LEFT = 2
+MOVE_RIGHT = 3
+
+MOVE_OFFSETS: dict[int, tuple[int, int]] = {
+    MOVE_UP: (-1, 0),
+    MOVE_DOWN: (1, 0),
+    MOVE_LEFT: (0, -1),
+    MOVE_RIGHT: (0, 1),
+}
+_OFFSET_MOVES: dict[tuple[int, int], int] = {offset: move for move, offset in MOVE_OFFSETS.items()}
+
+MOVE_LETTERS: str = "UDLR"
+"""Letter of each move, indexed by move."""
+_LETTER_MOVES: dict[str, int] = {letter: move for move, letter in enumerate(MOVE_LETTERS)}
+
+_READ_CHUNK_SIZE: int = 64 * 1024
+_WRITE_BATCH_SIZE: int = 4096
+"""Amount of runs written to a stream at a time."""
+
+
+def route_to_moves(route: Iterable[BlockIndex]) -> list[int]:
+    """Get moves between consecutive blocks of a route.
+
+    Raises:
+        ValueError: Consecutive blocks are not adjacent.
+    """
+    return list(iter_moves(route))
+
+
+def iter_moves(route: Iterable[BlockIndex]) -> Generator[int, None, None]:
+    """Generate moves between consecutive blocks of a route.
+
+    Raises:
+        ValueError: Consecutive blocks are not adjacent.
+    """
+    previous: BlockIndex | None = None
+    for index in route:
+        if previous is not None:
+            offset = (index.row - previous.row, index.column - previous.column)
+            if offset not in _OFFSET_MOVES:
+                raise ValueError(f"Blocks {previous} and {index} are not adjacent.")
+            yield _OFFSET_MOVES[offset]
+        previous = index
+
+
+def moves_to_route(start: BlockIndex, moves: Iterable[int]) -> list[BlockIndex]:
+    """Get route blocks from start block and moves."""
+    return list(iter_route(start, moves))
+
+
+def iter_route(start: BlockIndex, moves: Iterable[int]) -> Generator[BlockIndex, None, None]:
+    """Generate route blocks from start block and moves."""
+    yield start
+    row, column = start.row, start.column
+    for move in moves:
+        row_offset, column_offset = MOVE_OFFSETS[move]
+        row += row_offset
+        column += column_offset
+        yield BlockIndex(row, column)
+
+
+def pack_moves(moves: Sequence[int]) -> bytes:
+    """Pack moves four moves per byte, first move in the lowest bits."""
+    packed = bytearray((len(moves) + 3) // 4)
+    for position, move in enumerate(moves):
+        packed[position >> 2] |= move << ((position & 3) * 2)
+    return bytes(packed)
+
+
+def unpack_moves(packed: bytes, move_count: int) -> list[int]:
+    """Unpack move_count moves packed with pack_moves."""
+    return [(packed[position >> 2] >> ((position & 3) * 2)) & 3 for position in range(move_count)]
+
+
+@dataclass(frozen=True)
+class EncodedRoute:
+    """Class representing a route as its first block and packed moves."""
+
+    start: BlockIndex
+    move_count: int
+    packed_moves: bytes
+    """Moves packed with pack_moves."""
+
+    @classmethod
+    def from_route(cls, route: Iterable[BlockIndex]) -> Self:
+        """Encode route blocks one by one without storing them.
+
+        Raises:
+            ValueError: Route is empty or consecutive blocks are not adjacent.
+        """
+        route_iterator = iter(route)
+        if (start := next(route_iterator, None)) is None:
+            raise ValueError("Could not encode the route. Empty route is not valid.")
+        packed_moves = bytearray()
+        move_count = 0
+        for move in iter_moves(itertools.chain([start], route_iterator)):
+            if move_count & 3 == 0:
+                packed_moves.append(0)
+            packed_moves[-1] |= move << ((move_count & 3) * 2)
+            move_count += 1
+        return cls(start, move_count, bytes(packed_moves))
+
+    @classmethod
+    def from_rle(cls, start: BlockIndex, text: str) -> Self:
+        """Decode route from first block and run-length encoded moves.
+
+        Raises:
+            ValueError: Invalid run-length encoded moves.
+        """
+        moves = list(decode_rle(text))
+        return cls(start, len(moves), pack_moves(moves))
+
+    def __len__(self) -> int:
+        """Get amount of blocks in the route, i.e. the length of the route as a block list."""
+        return self.move_count + 1
+
+    def moves(self) -> Generator[int, None, None]:
+        """Generate moves of the route."""
+        packed_moves = self.packed_moves
+        for position in range(self.move_count):
+            yield (packed_moves[position >> 2] >> ((position & 3) * 2)) & 3
+
+    def blocks(self) -> Generator[BlockIndex, None, None]:
+        """Generate blocks of the route."""
+        return iter_route(self.start, self.moves())
+
+    def to_rle(self) -> str:
+        """Get moves run-length encoded."""
+        return "".join(encode_rle(self.moves()))
+
+
+def encode_rle(moves: Iterable[int]) -> Generator[str, None, None]:
+    """Generate runs of moves as text, e.g. "U3" for three moves up and "R" for one move right."""
+    for move, run in itertools.groupby(moves):
+        count = sum(1 for _ in run)
+        yield MOVE_LETTERS[move] if count == 1 else f"{MOVE_LETTERS[move]}{count}"
+
+
+def decode_rle(characters: Iterable[str]) -> Generator[int, None, None]:
+    """Generate moves from run-length encoded moves read character by character.
+
+    Raises:
+        ValueError: Invalid run-length encoded moves.
+    """
+    move: int | None = None
+    count = ""
+    for character in characters:
+        if character.isdigit():
+            if move is None:
+                raise ValueError("Invalid run-length encoded moves. Count must follow a move.")
+            count += character
+            continue
+        if character not in _LETTER_MOVES:
+            raise ValueError(f"Invalid move '{character}'.")
+        if move is not None:
+            yield from itertools.repeat(move, int(count or 1))
+        move = _LETTER_MOVES[character]
+        count = ""
+    if move is not None:
+        yield from itertools.repeat(move, int(count or 1))
+
+
+def write_route(route: Iterable[BlockIndex], stream: TextIO) -> int:
+    """Write route as a line of text, e.g. "4,2 U3R2", while reading the route blocks.
+
+    Returns:
+        Amount of moves written.
+    Raises:
+        ValueError: Route is empty or consecutive blocks are not adjacent.
+    """
+    route_iterator = iter(route)
+    if (start := next(route_iterator, None)) is None:
+        raise ValueError("Could not write the route. Empty route is not valid.")
+    stream.write(f"{start.row},{start.column} ")
+    move_count = 0
+
+    def counted_moves() -> Generator[int, None, None]:
+        nonlocal move_count
+        for move in iter_moves(itertools.chain([start], route_iterator)):
+            move_count += 1
+            yield move
+
+    runs = encode_rle(counted_moves())
+    while batch := list(itertools.islice(runs, _WRITE_BATCH_SIZE)):
+        stream.write("".join(batch))
+    stream.write("\n")
+    return move_count
+
+
+def read_route(stream: TextIO) -> Generator[BlockIndex, None, None]:
+    """Generate blocks of a route written with write_route while reading the stream.
+
+    Raises:
+        ValueError: Invalid route.
+    """
+    characters = _read_line_characters(stream)
+    start_text = "".join(itertools.takewhile(lambda character: character != " ", characters))
+    try:
+        row, column = (int(value) for value in start_text.split(","))
+    except ValueError as error:
+        raise ValueError(f"Invalid route start '{start_text}'.") from error
+    yield from iter_route(BlockIndex(row, column), decode_rle(characters))
+
+
+def _read_line_characters(stream: TextIO) -> Generator[str, None, None]:
+    """Generate characters of a line chunk by chunk. The stream is left at the next line."""
+    while chunk := stream.readline(_READ_CHUNK_SIZE):
+        yield from chunk.rstrip("\n")
+        if chunk.endswith("\n"):
+            return
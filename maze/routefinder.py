@@ -1,6 +1,7 @@
 """Route finder related code."""
+import random
 import time
-from typing import Callable
+from typing import Callable, Generator
 from maze.mazeblock import MazeBlock, BlockIndex, BlockType
 from maze.maze import SolvedRoute
 
@@ -14,35 +15,250 @@ def bfs_search(
 ) -> None:
     """Breadth-first search for finding shortest route to exit.
 
+    The blocks are marked visited in the current search epoch and the parents of the blocks are
+    stored in a side table owned by the search, so the search costs only what it explores.
+
     Args:
         start: Block to start from.
         max_length: Max length of the route to find. If 0 (default), find any length.
     """
-    next_blocks = [start]
-    current_block = start
-    current_block.visited = True
-    while next_blocks and (max_length == 0 or len(current_block.route_to_start) <= max_length):
-        # Slow down for visualization of solving process if slow_down is set.
-        if slow_down:
-            time.sleep(0.01)
-
-        current_block = next_blocks.pop(0)
+    start.visited = True
+    parents: dict[tuple[int, int], MazeBlock] = {}
+    blocks_to_check = [start]
+    route_length = 0
+    while blocks_to_check and (max_length == 0 or route_length <= max_length):
+        next_blocks: list[MazeBlock] = []
+        for current_block in blocks_to_check:
+            # Slow down for visualization of solving process if slow_down is set.
+            if slow_down:
+                time.sleep(0.01)
 
-        if gui_hook_visited_block_index is not None:
-            if current_block.type_ == BlockType.OPEN:
-                gui_hook_visited_block_index([current_block.index])
+            if gui_hook_visited_block_index is not None:
+                if current_block.type_ == BlockType.OPEN:
+                    gui_hook_visited_block_index([current_block.index])
 
-        next_available_blocks = current_block.next_available_blocks()
-        # Add route to start info to next blocks and mark visited.
-        for block in next_available_blocks:
-            block.route_to_start += current_block.route_to_start + [current_block]
-            block.visited = True
+            if current_block.type_ == BlockType.EXIT:
+                solved_route.blocks = route_to_start(current_block, parents)
+                return
 
-        next_blocks += next_available_blocks
+            # Add parent info of next blocks to side table and mark visited.
+            for block in current_block.next_available_blocks():
+                parents[(block.index.row, block.index.column)] = current_block
+                block.visited = True
+                next_blocks.append(block)
 
-        if current_block.type_ == BlockType.EXIT:
-            solved_route.blocks = current_block.route_to_start
-            return
+        blocks_to_check = next_blocks
+        route_length += 1
 
     # No solution within step limits found.
     solved_route.blocks = None
+
+
+def route_to_start(
+    block: MazeBlock, parents: dict[tuple[int, int], MazeBlock]
+) -> list[MazeBlock]:
+    """Get route from start block to the block before the given block using parent side table."""
+    route: list[MazeBlock] = []
+    while (parent := parents.get((block.index.row, block.index.column))) is not None:
+        route.append(parent)
+        block = parent
+    route.reverse()
+    return route
+
+
+def dial_search(
+    start: MazeBlock,
+    solved_route: SolvedRoute,
+    max_length: int = 0,
+    slow_down: bool = False,
+    gui_hook_visited_block_index: Callable[[list[BlockIndex]], None] | None = None,
+) -> None:
+    """Dijkstra's search with a bucket queue (Dial's algorithm) for finding cheapest route to exit.
+
+    Blocks waiting to be checked are stored in buckets by their route cost. Since the costs are
+    small integers, the next block to check is found by advancing to the next non-empty bucket
+    instead of maintaining a binary heap.
+
+    Args:
+        start: Block to start from.
+        max_length: Max cost of the route to find, i.e. the sum of the costs of the blocks moved
+            to. If 0 (default), find any cost.
+    """
+    route_costs = {(start.index.row, start.index.column): 0}
+    parents: dict[tuple[int, int], MazeBlock] = {}
+    buckets: dict[int, list[MazeBlock]] = {0: [start]}
+    route_cost = 0
+    while buckets and (max_length == 0 or route_cost <= max_length):
+        for current_block in buckets.pop(route_cost, []):
+            # Skip blocks already checked with a lower cost.
+            if current_block.visited:
+                continue
+            current_block.visited = True
+
+            # Slow down for visualization of solving process if slow_down is set.
+            if slow_down:
+                time.sleep(0.01)
+
+            if gui_hook_visited_block_index is not None:
+                if current_block.type_ == BlockType.OPEN:
+                    gui_hook_visited_block_index([current_block.index])
+
+            if current_block.type_ == BlockType.EXIT:
+                solved_route.blocks = route_to_start(current_block, parents)
+                return
+
+            for block in current_block.next_available_blocks():
+                key = (block.index.row, block.index.column)
+                block_route_cost = route_cost + block.cost
+                if block_route_cost < route_costs.get(key, block_route_cost + 1) and (
+                    max_length == 0 or block_route_cost <= max_length
+                ):
+                    route_costs[key] = block_route_cost
+                    parents[key] = current_block
+                    buckets.setdefault(block_route_cost, []).append(block)
+
+        route_cost += 1
+
+    # No solution within cost limits found.
+    solved_route.blocks = None
+
+
+class ShortestRoutes:
+    """Class representing all the cheapest routes from start block to the nearest exits.
+
+    Without block costs, the cheapest routes are the shortest routes. Routes are lists of
+    MazeBlocks from the start block to the exit block (both included). Unlike the routes of
+    SolvedRoute, the exit block is included so that routes ending to different exits are distinct.
+    """
+
+    def __init__(
+        self,
+        start: MazeBlock,
+        exits: list[MazeBlock],
+        route_costs: dict[tuple[int, int], int],
+        route_counts: dict[tuple[int, int], int],
+    ) -> None:
+        """Initialize shortest routes from the results of count_shortest_routes."""
+        self.start = start
+        self.exits = exits
+        self._route_costs = route_costs
+        self._route_counts = route_counts
+
+    @property
+    def length(self) -> int:
+        """Get the cost of the cheapest routes, i.e. the sum of the costs of the blocks moved to.
+
+        Without block costs, this is the length (amount of moves) of the shortest routes.
+        """
+        return self._route_cost(self.exits[0])
+
+    @property
+    def count(self) -> int:
+        """Get the amount of distinct shortest routes."""
+        return sum(self._route_count(exit_block) for exit_block in self.exits)
+
+    def routes(self) -> Generator[list[MazeBlock], None, None]:
+        """Yield distinct shortest routes one by one without enumerating them all beforehand."""
+        for exit_block in self.exits:
+            reversed_route = [exit_block]
+            predecessors = [iter(self._predecessors(exit_block))]
+            while predecessors:
+                block = next(predecessors[-1], None)
+                if block is None:
+                    predecessors.pop()
+                    reversed_route.pop()
+                    continue
+                reversed_route.append(block)
+                if block is self.start:
+                    yield reversed_route[::-1]
+                    reversed_route.pop()
+                else:
+                    predecessors.append(iter(self._predecessors(block)))
+
+    def random_routes(
+        self, amount: int, rng: random.Random | None = None
+    ) -> list[list[MazeBlock]]:
+        """Get shortest routes picked uniformly at random (with replacement).
+
+        Each route is picked by walking from an exit to the start block choosing the previous block
+        with a probability proportional to its route count, so the routes are never enumerated.
+        """
+        rng = rng if rng is not None else random.Random()
+        return [self._random_route(rng) for _ in range(amount)]
+
+    def _random_route(self, rng: random.Random) -> list[MazeBlock]:
+        block = self._pick_weighted(self.exits, rng)
+        reversed_route = [block]
+        while block is not self.start:
+            block = self._pick_weighted(self._predecessors(block), rng)
+            reversed_route.append(block)
+        return reversed_route[::-1]
+
+    def _pick_weighted(self, blocks: list[MazeBlock], rng: random.Random) -> MazeBlock:
+        """Pick a block with probability proportional to its route count."""
+        pick = rng.randrange(sum(self._route_count(block) for block in blocks))
+        for block in blocks:
+            pick -= self._route_count(block)
+            if pick < 0:
+                return block
+        raise ValueError("Could not pick a block from empty list.")
+
+    def _predecessors(self, block: MazeBlock) -> list[MazeBlock]:
+        """Get adjacent blocks one move back on a cheapest route to the block."""
+        route_cost = self._route_cost(block) - block.cost
+        return [
+            adjacent_block for adjacent_block in block.adjacent_blocks()
+            if self._route_costs.get(
+                (adjacent_block.index.row, adjacent_block.index.column)
+            ) == route_cost
+        ]
+
+    def _route_cost(self, block: MazeBlock) -> int:
+        return self._route_costs[(block.index.row, block.index.column)]
+
+    def _route_count(self, block: MazeBlock) -> int:
+        return self._route_counts[(block.index.row, block.index.column)]
+
+
+def count_shortest_routes(start: MazeBlock, max_length: int = 0) -> ShortestRoutes | None:
+    """Count the cheapest routes to the nearest exits with a single bucket queue search.
+
+    Blocks are checked in the order of their route costs as in dial_search. The amount of cheapest
+    routes to each block is the sum of the amounts of cheapest routes to its predecessors, i.e. the
+    adjacent blocks whose route cost plus the cost of the block is the route cost of the block.
+    Without block costs, this is a breadth-first search counting the shortest routes. Python
+    integers do not overflow, so the counts are exact even when they grow exponentially.
+
+    Args:
+        start: Block to start from.
+        max_length: Max cost of the routes to count, i.e. the sum of the costs of the blocks moved
+            to (the length of the routes without block costs). If 0 (default), count any cost.
+    Returns:
+        Shortest routes or None if no route was found.
+    """
+    route_costs = {(start.index.row, start.index.column): 0}
+    route_counts = {(start.index.row, start.index.column): 1}
+    buckets: dict[int, list[MazeBlock]] = {0: [start]}
+    route_cost = 0
+    while buckets and (max_length == 0 or route_cost <= max_length):
+        blocks_to_check = buckets.pop(route_cost, [])
+        exits = [block for block in blocks_to_check if block.type_ == BlockType.EXIT]
+        if exits:
+            return ShortestRoutes(start, exits, route_costs, route_counts)
+
+        for current_block in blocks_to_check:
+            route_count = route_counts[(current_block.index.row, current_block.index.column)]
+            for block in current_block.adjacent_blocks():
+                key = (block.index.row, block.index.column)
+                block_route_cost = route_cost + block.cost
+                if key not in route_costs:
+                    route_costs[key] = block_route_cost
+                    route_counts[key] = route_count
+                    buckets.setdefault(block_route_cost, []).append(block)
+                elif route_costs[key] == block_route_cost:
+                    route_counts[key] += route_count
+
+        route_cost += 1
+
+    # No route within cost limits found.
+    return None
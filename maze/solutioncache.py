@@ -0,0 +1,197 @@
+"""Persistent on-disk cache of solved routes.
+
+Routes are stored in a SQLite database keyed by the content hash of the maze file, a digest of the
+map from block data to block types and costs, the start block, the step limit, and the solver. The
+routes are stored as packed moves (see routeencoding). The total size of the stored routes is capped
+by evicting the least recently used solutions.
+"""
+import functools
+import hashlib
+import os
+import sqlite3
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Mapping
+
+from maze.mazeblock import BlockIndex, BlockType
+from maze.routeencoding import moves_to_route, pack_moves, route_to_moves, unpack_moves
+
+_SCHEMA_VERSION: int = 2
+"""Version of the schema. Caches of other versions are cleared when opened."""
+_SCHEMA = """
+DROP TABLE IF EXISTS solutions;
+CREATE TABLE solutions (
+    maze_hash TEXT NOT NULL,
+    block_map_digest TEXT NOT NULL,
+    start_row INTEGER NOT NULL,
+    start_column INTEGER NOT NULL,
+    max_length INTEGER NOT NULL,
+    solver TEXT NOT NULL,
+    move_count INTEGER,
+    moves BLOB,
+    size INTEGER NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (maze_hash, block_map_digest, start_row, start_column, max_length, solver)
+);
+CREATE INDEX solutions_last_used ON solutions (last_used);
+"""
+_ENTRY_OVERHEAD: int = 64
+"""Approximate size of a stored solution in bytes excluding the moves."""
+_KEY_CONDITION = (
+    "maze_hash = ? AND block_map_digest = ? AND start_row = ? AND start_column = ?"
+    " AND max_length = ? AND solver = ?"
+)
+
+
+@dataclass(frozen=True)
+class SolutionKey:
+    """Class representing everything a solution depends on."""
+
+    maze_hash: str
+    block_map_digest: str
+    """Digest of the map from block data to block types and costs (see block_map_digest)."""
+    start: BlockIndex
+    max_length: int
+    solver: str
+
+    def as_parameters(self) -> tuple[str, str, int, int, int, str]:
+        """Get key as SQL query parameters."""
+        return (
+            self.maze_hash,
+            self.block_map_digest,
+            self.start.row,
+            self.start.column,
+            self.max_length,
+            self.solver,
+        )
+
+
+@dataclass
+class CachedSolution:
+    """Class representing a cached solution.
+
+    None route indicates that there is no solution.
+    """
+
+    route: list[BlockIndex] | None
+
+
+def block_map_digest(block_specs: Mapping[Any, tuple[BlockType, int]]) -> str:
+    """Get a digest identifying a map from block data to block type and cost.
+
+    The same maze file is a different maze if its characters are read as other blocks.
+    """
+    lines = sorted(f"{data!r} {type_.name} {cost}" for data, (type_, cost) in block_specs.items())
+    return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+
+def solver_identity(solver: Any) -> str:
+    """Get a name identifying a solver function (or a partial of it, or a solver object)."""
+    while isinstance(solver, functools.partial):
+        solver = solver.func
+    if not hasattr(solver, "__qualname__"):
+        solver = type(solver)
+    return f"{solver.__module__}.{solver.__qualname__}"
+
+
+class SolutionCache:
+    """Class representing a persistent cache of solved routes.
+
+    The total size and the use counter of the solutions are kept in memory, so the database must
+    not be written by others while the cache is open.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Path of the database file. Parent folders are created if needed.
+            max_bytes: Max total size of the stored solutions in bytes.
+        """
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = Lock()
+        # Solutions are stored from the solver thread.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        (schema_version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if schema_version != _SCHEMA_VERSION:
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        total_size, last_used = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0), COALESCE(MAX(last_used), 0) FROM solutions"
+        ).fetchone()
+        self._total_size: int = total_size
+        self._last_used: int = last_used
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def get(self, key: SolutionKey) -> CachedSolution | None:
+        """Get cached solution or None if the solution is not cached."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                f"SELECT move_count, moves FROM solutions WHERE {_KEY_CONDITION}",
+                key.as_parameters(),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                f"UPDATE solutions SET last_used = ? WHERE {_KEY_CONDITION}",
+                (self._next_use(), *key.as_parameters()),
+            )
+
+        move_count, moves = row
+        if move_count is None:
+            return CachedSolution(None)
+        return CachedSolution(moves_to_route(key.start, unpack_moves(moves, move_count)))
+
+    def put(self, key: SolutionKey, route: list[BlockIndex] | None) -> None:
+        """Store solution (None if there is no solution) evicting least recently used solutions.
+
+        Raises:
+            ValueError: Route does not start from the start block of the key.
+        """
+        if route is not None and (not route or route[0] != key.start):
+            raise ValueError("Route must start from the start block.")
+
+        move_count: int | None = None
+        moves: bytes | None = None
+        if route is not None:
+            route_moves = route_to_moves(route)
+            move_count = len(route_moves)
+            moves = pack_moves(route_moves)
+        size = _ENTRY_OVERHEAD + (len(moves) if moves is not None else 0)
+
+        with self._lock, self._connection:
+            replaced_row = self._connection.execute(
+                f"SELECT size FROM solutions WHERE {_KEY_CONDITION}", key.as_parameters()
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key.as_parameters(), move_count, moves, size, self._next_use()),
+            )
+            self._total_size += size - (replaced_row[0] if replaced_row is not None else 0)
+            if self._total_size > self._max_bytes:
+                self._evict()
+
+    def _next_use(self) -> int:
+        self._last_used += 1
+        return self._last_used
+
+    def _evict(self) -> None:
+        """Delete least recently used solutions until the routes fit in the max size."""
+        rows = self._connection.execute(
+            "SELECT rowid, size FROM solutions ORDER BY last_used"
+        )
+        evicted_rowids: list[int] = []
+        for rowid, size in rows:
+            if self._total_size <= self._max_bytes:
+                break
+            self._total_size -= size
+            evicted_rowids.append(rowid)
+        self._connection.executemany(
+            "DELETE FROM solutions WHERE rowid = ?", [(rowid,) for rowid in evicted_rowids]
+        )
@@ -0,0 +1,220 @@
+"""Registry of named maze solvers.
+
+Besides the registered solvers, the registry offers an "auto" solver, which profiles the maze and
+picks the solver that was fastest on the most similar maze in the calibration data. The calibration
+data is created with the solver benchmark (see benchmarks/solvers.py).
+"""
+import json
+import math
+import os
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Protocol
+
+from maze.corridorgraph import CorridorGraphSolver
+from maze.maze import SolvedRoute
+from maze.mazeblock import BlockIndex, BlockType, MazeBlock
+from maze.routefinder import bfs_search, dial_search
+
+AUTO_SOLVER: str = "auto"
+"""Name of the solver selecting one of the registered solvers for the maze."""
+
+CALIBRATION_PATH: str = os.path.join(os.path.dirname(__file__), "solver_calibration.json")
+"""Default path of the calibration data."""
+
+
+class MazeSolver(Protocol):  # pylint: disable=too-few-public-methods
+    """Protocol of a function (or a callable object) solving a maze."""
+
+    def __call__(  # pylint: disable=too-many-arguments
+        self,
+        start: MazeBlock,
+        solved_route: SolvedRoute,
+        max_length: int = 0,
+        slow_down: bool = False,
+        gui_hook_visited_block_index: Callable[[list[BlockIndex]], None] | None = None,
+    ) -> None:
+        """Find shortest route from start to exit and store it to solved route.
+
+        Args:
+            start: Block to start from.
+            solved_route: Solved route to store the route (or None if no route was found) to.
+            max_length: Max length of the route to find. If 0 (default), find any length.
+            slow_down: Whether to slow down the solver for animation.
+            gui_hook_visited_block_index: Called with the indices of the newly visited blocks.
+        """
+
+
+@dataclass(frozen=True)
+class MazeProfile:
+    """Class representing the features of a maze solver performance depends on."""
+
+    rows: int
+    columns: int
+    open_density: float
+    """Share of the cells that are not solid."""
+    exit_count: int
+    corridor_ratio: float
+    """Share of the open cells with exactly two open neighbours."""
+    weighted: bool
+    """Whether any block costs more than one to move to."""
+
+    @classmethod
+    def from_blocks(cls, blocks: list[list[MazeBlock]]) -> "MazeProfile":
+        """Profile a maze created by MazeFactory."""
+        cell_count = 0
+        open_count = 0
+        exit_count = 0
+        corridor_count = 0
+        weighted = False
+        for row in blocks:
+            cell_count += len(row)
+            for block in row:
+                if block.type_ == BlockType.SOLID:
+                    continue
+                open_count += 1
+                exit_count += block.type_ == BlockType.EXIT
+                corridor_count += len(block.adjacent_blocks()) == 2
+                weighted = weighted or block.cost != 1
+        return cls(
+            rows=len(blocks),
+            columns=max((len(row) for row in blocks), default=0),
+            open_density=open_count / cell_count if cell_count else 0,
+            exit_count=exit_count,
+            corridor_ratio=corridor_count / open_count if open_count else 0,
+            weighted=weighted,
+        )
+
+    def features(self) -> tuple[float, ...]:
+        """Get the profile as comparable features of similar scale."""
+        return (
+            math.log2(max(1, self.rows * self.columns)) / 4,
+            self.open_density,
+            math.log2(1 + self.exit_count) / 4,
+            self.corridor_ratio,
+        )
+
+
+@dataclass
+class _RegisteredSolver:
+    solver: MazeSolver
+    supports_costs: bool
+
+
+class SolverRegistry:
+    """Class representing a registry of named maze solvers."""
+
+    def __init__(self, calibration: list[dict[str, Any]] | None = None) -> None:
+        """Initialize registry.
+
+        Args:
+            calibration: Calibration entries, each containing a maze profile ("profile") and the
+                solve times in seconds of the solvers by name ("seconds"). Without calibration,
+                auto selects the first registered solver supporting the maze.
+        """
+        self._solvers: dict[str, _RegisteredSolver] = {}
+        self._calibration = calibration or []
+
+    def register(self, name: str, solver: MazeSolver, supports_costs: bool = False) -> None:
+        """Register a solver.
+
+        Args:
+            name: Name of the solver.
+            solver: The solver.
+            supports_costs: Whether the solver finds the cheapest route when blocks have costs.
+        Raises:
+            ValueError: Name is reserved or already registered.
+        """
+        if name == AUTO_SOLVER or name in self._solvers:
+            raise ValueError(f"Solver name '{name}' is already in use.")
+        self._solvers[name] = _RegisteredSolver(solver, supports_costs)
+
+    def names(self) -> list[str]:
+        """Get names of the solvers starting with auto."""
+        return [AUTO_SOLVER, *self._solvers]
+
+    def get(self, name: str) -> MazeSolver:
+        """Get a registered solver.
+
+        Raises:
+            KeyError: Solver is not registered.
+        """
+        if name not in self._solvers:
+            raise KeyError(f"Solver '{name}' is not registered.")
+        return self._solvers[name].solver
+
+    def resolve(self, name: str, profile: MazeProfile) -> str:
+        """Get name of the solver to use for a maze. Auto is resolved to a registered solver.
+
+        Raises:
+            KeyError: Solver is not registered.
+        """
+        if name != AUTO_SOLVER:
+            self.get(name)
+            return name
+        return self.choose(profile)
+
+    def choose(self, profile: MazeProfile) -> str:
+        """Choose the fastest solver for the maze according to the calibration data.
+
+        Solvers not supporting the costs are not considered for mazes with costs.
+
+        Raises:
+            ValueError: No solver is registered.
+        """
+        candidates = [
+            name for name, registered in self._solvers.items()
+            if registered.supports_costs or not profile.weighted
+        ]
+        if not candidates:
+            raise ValueError("No solver registered for the maze.")
+
+        entries = [
+            entry for entry in self._calibration
+            if any(name in entry["seconds"] for name in candidates)
+        ]
+        if not entries:
+            return candidates[0]
+        features = profile.features()
+        nearest_entry = min(
+            entries,
+            key=lambda entry: math.dist(features, MazeProfile(**entry["profile"]).features()),
+        )
+        return min(
+            (name for name in candidates if name in nearest_entry["seconds"]),
+            key=lambda name: nearest_entry["seconds"][name],
+        )
+
+
+def load_calibration(path: str = CALIBRATION_PATH) -> list[dict[str, Any]]:
+    """Load calibration entries. Missing file has no entries."""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as calibration_file:
+        return list(json.load(calibration_file)["entries"])
+
+
+def save_calibration(
+    entries: list[tuple[MazeProfile, dict[str, float]]], path: str = CALIBRATION_PATH
+) -> None:
+    """Save maze profiles and the solve times in seconds of the solvers by name."""
+    with open(path, "w", encoding="utf-8") as calibration_file:
+        json.dump(
+            {
+                "entries": [
+                    {"profile": asdict(profile), "seconds": seconds}
+                    for profile, seconds in entries
+                ]
+            },
+            calibration_file,
+            indent=2,
+        )
+        calibration_file.write("\n")
+
+
+def create_default_registry(calibration_path: str = CALIBRATION_PATH) -> SolverRegistry:
+    """Create registry with the solvers of this package."""
+    registry = SolverRegistry(load_calibration(calibration_path))
+    registry.register("bfs", bfs_search)
+    registry.register("dial", dial_search, supports_costs=True)
+    registry.register("corridor", CorridorGraphSolver(), supports_costs=True)
+    return registry
@@ -0,0 +1,421 @@
+"""Tiled maze storage for mazes larger than memory.
+
+The maze file is memory mapped and decoded into fixed-size square tiles of single byte cell codes
+only when the tiles are needed. Only a limited amount of decoded tiles are kept resident at a time
+(least recently used tile is dropped first), so the memory used for the maze structure stays
+constant regardless of the maze size.
+
+Two file formats are supported:
+- Text mazes (same format as the other maze files in data dir).
+- Binary mazes starting with BINARY_MAZE_MAGIC, the row and column counts, and then one cell code
+  per cell row by row. These can be created from text mazes with convert_text_maze_to_binary.
+"""
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from types import TracebackType
+from typing import BinaryIO, Self
+
+from fileparsing import INVALID_CELL_CODE, create_translation_table, get_maze_file_path
+from maze.mazeblock import BLOCK_TYPE_CODES, CODE_BLOCK_TYPES, BlockIndex, BlockSpec, BlockType
+
+BINARY_MAZE_MAGIC: bytes = b"PENAMAZE"
+_BINARY_HEADER = struct.Struct("<8sQQ")
+
+_SOLID = BLOCK_TYPE_CODES[BlockType.SOLID]
+_START = BLOCK_TYPE_CODES[BlockType.START]
+_EXIT = BLOCK_TYPE_CODES[BlockType.EXIT]
+
+# Parent direction codes stored in search state. Zero means the cell has not been visited.
+_UNVISITED = 0
+_PARENT_IS_START = 5
+_NEIGHBOURS: tuple[tuple[int, int, int], ...] = (
+    # (row offset, column offset, parent code of the neighbour), same order as in MazeBlock.
+    (0, -1, 2),  # Left, the parent of the neighbour is on its right.
+    (0, 1, 1),  # Right, the parent of the neighbour is on its left.
+    (-1, 0, 4),  # Above, the parent of the neighbour is below it.
+    (1, 0, 3),  # Below, the parent of the neighbour is above it.
+)
+_PARENT_OFFSETS: dict[int, tuple[int, int]] = {1: (0, -1), 2: (0, 1), 3: (-1, 0), 4: (1, 0)}
+
+
+class TiledMaze:
+    """Class representing a maze stored in a file and paged in tile by tile."""
+
+    def __init__(
+        self,
+        file_name: str,
+        data_to_block_type_map: dict[str, BlockSpec],
+        tile_size: int = 256,
+        max_resident_tiles: int = 64,
+    ) -> None:
+        """Open a maze file from data dir.
+
+        Args:
+            file_name: Name of the text or binary maze file in data folder.
+            data_to_block_type_map: Map used for decoding text mazes (see BlockFactory). Tiles
+                store only the block types, so the blocks must not have costs.
+            tile_size: Width and height of a tile in cells.
+            max_resident_tiles: Max amount of decoded tiles kept in memory.
+
+        Raises:
+            FileNotFoundError: Specified file not found.
+            ValueError: Invalid tile parameters, blocks with costs, empty maze, or maze without a
+                start block.
+        """
+        if tile_size < 1 or max_resident_tiles < 1:
+            raise ValueError("Tile size and max resident tile count must be positive.")
+
+        self.tile_size = tile_size
+        self._max_resident_tiles = max_resident_tiles
+        self._tiles: OrderedDict[tuple[int, int], bytes] = OrderedDict()
+        self._translation_table = create_translation_table(
+            _block_type_codes(data_to_block_type_map)
+        )
+        self._start_data = bytes(
+            byte for byte in range(256) if self._translation_table[byte] == _START
+        )
+
+        with open(get_maze_file_path(file_name), "rb") as file_object:
+            self._mmap = mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._binary = self._mmap[:len(BINARY_MAZE_MAGIC)] == BINARY_MAZE_MAGIC
+        # Row start offsets and row lengths for text mazes.
+        self._row_offsets = array("Q")
+        self._row_lengths = array("Q")
+        if self._binary:
+            _, self.rows, self.columns = _BINARY_HEADER.unpack_from(self._mmap)
+        else:
+            self._index_rows()
+            self.rows = len(self._row_offsets)
+            self.columns = max(self._row_lengths, default=0)
+
+        if self.rows == 0 or self.columns == 0:
+            self.close()
+            raise ValueError("Could not open the maze. Empty maze is not valid.")
+
+        start = self._find_start()
+        if start is None:
+            self.close()
+            raise ValueError("Invalid start block type 'None'.")
+        self.start = start
+
+    def __enter__(self) -> Self:
+        """Enter the context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context and close the file."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the maze file and drop resident tiles."""
+        self._tiles.clear()
+        self._mmap.close()
+
+    @property
+    def resident_tiles(self) -> int:
+        """Get the amount of decoded tiles currently in memory."""
+        return len(self._tiles)
+
+    def cell(self, row: int, column: int) -> int:
+        """Get cell code of a cell. Cells outside of the maze are solid."""
+        if not (0 <= row < self.rows and 0 <= column < self.columns):
+            return _SOLID
+        tile_size = self.tile_size
+        tile = self._tile(row // tile_size, column // tile_size)
+        return tile[(row % tile_size) * tile_size + column % tile_size]
+
+    def block_type(self, row: int, column: int) -> BlockType:
+        """Get block type of a cell. Cells outside of the maze are solid."""
+        return CODE_BLOCK_TYPES[self.cell(row, column)]
+
+    def row_codes(self, row: int) -> bytes:
+        """Get cell codes of a whole row without storing it as a resident tile."""
+        return self._row_segment(row, 0, self.columns)
+
+    def _tile(self, tile_row: int, tile_column: int) -> bytes:
+        """Get a tile, loading it and evicting the least recently used tile if needed."""
+        key = (tile_row, tile_column)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+
+        tile = self._load_tile(tile_row, tile_column)
+        self._tiles[key] = tile
+        if len(self._tiles) > self._max_resident_tiles:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def _load_tile(self, tile_row: int, tile_column: int) -> bytes:
+        tile_size = self.tile_size
+        first_column = tile_column * tile_size
+        last_column = min(first_column + tile_size, self.columns)
+        tile = bytearray([_SOLID]) * (tile_size * tile_size)
+        first_row = tile_row * tile_size
+        last_row = min(first_row + tile_size, self.rows)
+        for tile_row_index, row in enumerate(range(first_row, last_row)):
+            segment = self._row_segment(row, first_column, last_column)
+            position = tile_row_index * tile_size
+            tile[position:position + len(segment)] = segment
+        return bytes(tile)
+
+    def _row_segment(self, row: int, first_column: int, last_column: int) -> bytes:
+        """Get cell codes of row between the columns padded with solid cells."""
+        if self._binary:
+            position = _BINARY_HEADER.size + row * self.columns
+            return self._mmap[position + first_column:position + last_column]
+
+        row_offset = self._row_offsets[row]
+        data_end = min(last_column, self._row_lengths[row])
+        segment = self._mmap[row_offset + first_column:row_offset + data_end].translate(
+            self._translation_table
+        )
+        if INVALID_CELL_CODE in segment:
+            invalid_data = self._mmap[row_offset + first_column + segment.index(INVALID_CELL_CODE)]
+            raise KeyError(
+                f"Invalid block data '{chr(invalid_data)}'. Block could not be created."
+            )
+        padding = last_column - first_column - len(segment)
+        return segment + bytes([_SOLID]) * padding if padding > 0 else segment
+
+    def _index_rows(self) -> None:
+        """Store the start offset and the length without trailing whitespace of each text row."""
+        position = 0
+        file_size = len(self._mmap)
+        while position < file_size:
+            line_end = self._mmap.find(b"\n", position)
+            if line_end == -1:
+                line_end = file_size
+            self._row_offsets.append(position)
+            self._row_lengths.append(len(self._mmap[position:line_end].rstrip()))
+            position = line_end + 1
+
+    def _find_start(self) -> BlockIndex | None:
+        if self._binary:
+            position = self._mmap.find(bytes([_START]), _BINARY_HEADER.size)
+            if position == -1:
+                return None
+            row, column = divmod(position - _BINARY_HEADER.size, self.columns)
+            return BlockIndex(row, column)
+
+        positions = [
+            position for data in self._start_data
+            if (position := self._mmap.find(bytes([data]))) != -1
+        ]
+        if not positions:
+            return None
+        position = min(positions)
+        row = bisect_right(self._row_offsets, position) - 1
+        return BlockIndex(row, position - self._row_offsets[row])
+
+
+class TiledSearchState:
+    """Class storing per-search solver state of a tiled maze tile by tile.
+
+    Each cell stores a single byte telling the direction of its parent. Tiles of state are allocated
+    only for the tiles the search reaches, and only a limited amount of them are kept in memory at a
+    time. The least recently used tile is spilled to a temporary file and read back when needed
+    again, so the memory used for the state stays constant regardless of the explored area (apart
+    from the file position of each spilled tile).
+    """
+
+    def __init__(self, tile_size: int, max_resident_tiles: int = 64) -> None:
+        """Initialize empty search state.
+
+        Raises:
+            ValueError: Invalid tile parameters.
+        """
+        if tile_size < 1 or max_resident_tiles < 1:
+            raise ValueError("Tile size and max resident tile count must be positive.")
+
+        self._tile_size = tile_size
+        self._max_resident_tiles = max_resident_tiles
+        self._tiles: OrderedDict[tuple[int, int], bytearray] = OrderedDict()
+        self._spill_file: BinaryIO | None = None
+        self._spill_slots: dict[tuple[int, int], int] = {}
+
+    def __enter__(self) -> Self:
+        """Enter the context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the context and remove the spill file."""
+        self.close()
+
+    def close(self) -> None:
+        """Drop resident tiles and remove the spill file."""
+        self._tiles.clear()
+        self._spill_slots.clear()
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    @property
+    def allocated_tiles(self) -> int:
+        """Get the amount of allocated state tiles, both resident and spilled."""
+        return len(self._tiles.keys() | self._spill_slots.keys())
+
+    @property
+    def resident_tiles(self) -> int:
+        """Get the amount of state tiles currently in memory."""
+        return len(self._tiles)
+
+    def get(self, row: int, column: int) -> int:
+        """Get parent code of a cell. Zero means not visited."""
+        tile_size = self._tile_size
+        tile = self._tile((row // tile_size, column // tile_size), allocate=False)
+        if tile is None:
+            return _UNVISITED
+        return tile[(row % tile_size) * tile_size + column % tile_size]
+
+    def set(self, row: int, column: int, parent_code: int) -> None:
+        """Set parent code of a cell."""
+        tile_size = self._tile_size
+        tile = self._tile((row // tile_size, column // tile_size), allocate=True)
+        if tile is None:
+            raise ValueError("Could not allocate state tile.")
+        tile[(row % tile_size) * tile_size + column % tile_size] = parent_code
+
+    def _tile(self, key: tuple[int, int], allocate: bool) -> bytearray | None:
+        """Get a resident tile, reading it back from the spill file or allocating it if needed.
+
+        Returns:
+            The tile or None if the tile has never been allocated and allocate is not set.
+        """
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+
+        tile_bytes = self._tile_size * self._tile_size
+        if key in self._spill_slots and self._spill_file is not None:
+            self._spill_file.seek(self._spill_slots[key] * tile_bytes)
+            tile = bytearray(self._spill_file.read(tile_bytes))
+        elif allocate:
+            tile = bytearray(tile_bytes)
+        else:
+            return None
+
+        self._tiles[key] = tile
+        if len(self._tiles) > self._max_resident_tiles:
+            self._spill(*self._tiles.popitem(last=False))
+        return tile
+
+    def _spill(self, key: tuple[int, int], tile: bytearray) -> None:
+        """Write a tile to its slot in the spill file."""
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile()
+        slot = self._spill_slots.setdefault(key, len(self._spill_slots))
+        self._spill_file.seek(slot * len(tile))
+        self._spill_file.write(tile)
+
+
+def tiled_bfs_search(
+    maze: TiledMaze, max_length: int = 0, max_resident_state_tiles: int = 64
+) -> list[BlockIndex] | None:
+    """Breadth-first search for finding shortest route to exit in a tiled maze.
+
+    The search state is kept within max_resident_state_tiles (see TiledSearchState). The frontier
+    is stored as one 8-byte cell number per cell, so it grows with the width of the search layer
+    rather than with the explored area.
+
+    Args:
+        maze: Maze to search.
+        max_length: Max length of the route to find. If 0 (default), find any length.
+        max_resident_state_tiles: Max amount of search state tiles kept in memory.
+    Returns:
+        Indices of the route blocks from start block to the block before the exit (same as
+        bfs_search) or None if no route was found.
+    """
+    columns = maze.columns
+    with TiledSearchState(maze.tile_size, max_resident_state_tiles) as state:
+        state.set(maze.start.row, maze.start.column, _PARENT_IS_START)
+        frontier = array("Q", [maze.start.row * columns + maze.start.column])
+        depth = 0
+        while frontier and (max_length == 0 or depth <= max_length):
+            next_frontier = array("Q")
+            for cell_number in frontier:
+                row, column = divmod(cell_number, columns)
+                if maze.cell(row, column) == _EXIT:
+                    return _route_to_start(state, row, column)
+                for row_offset, column_offset, parent_code in _NEIGHBOURS:
+                    next_row = row + row_offset
+                    next_column = column + column_offset
+                    if (
+                        maze.cell(next_row, next_column) != _SOLID
+                        and state.get(next_row, next_column) == _UNVISITED
+                    ):
+                        state.set(next_row, next_column, parent_code)
+                        next_frontier.append(next_row * columns + next_column)
+            frontier = next_frontier
+            depth += 1
+
+    # No solution within step limits found.
+    return None
+
+
+def _route_to_start(state: TiledSearchState, row: int, column: int) -> list[BlockIndex]:
+    route: list[BlockIndex] = []
+    while (parent_code := state.get(row, column)) != _PARENT_IS_START:
+        row_offset, column_offset = _PARENT_OFFSETS[parent_code]
+        row += row_offset
+        column += column_offset
+        route.append(BlockIndex(row, column))
+    route.reverse()
+    return route
+
+
+def _block_type_codes(data_to_block_type_map: dict[str, BlockSpec]) -> dict[str, int]:
+    """Get cell codes of block data.
+
+    Raises:
+        ValueError: A block has a cost other than 1.
+    """
+    block_type_codes: dict[str, int] = {}
+    for data, block_spec in data_to_block_type_map.items():
+        type_, cost = block_spec if isinstance(block_spec, tuple) else (block_spec, 1)
+        if cost != 1:
+            raise ValueError(
+                f"Invalid cost '{cost}' for block data '{data}'. Tiled mazes do not support block "
+                "costs."
+            )
+        block_type_codes[data] = BLOCK_TYPE_CODES[type_]
+    return block_type_codes
+
+
+def convert_text_maze_to_binary(
+    source_file_name: str,
+    target_file_name: str,
+    data_to_block_type_map: dict[str, BlockSpec],
+) -> None:
+    """Convert a text maze in data dir into a binary maze in data dir row by row.
+
+    Raises:
+        FileNotFoundError: Source file not found.
+        KeyError: Source file contains invalid block data.
+        ValueError: A block has a cost other than 1.
+    """
+    with TiledMaze(source_file_name, data_to_block_type_map, max_resident_tiles=1) as maze:
+        target_path = os.path.join(
+            os.path.dirname(get_maze_file_path(source_file_name)), target_file_name
+        )
+        with open(target_path, "wb") as target_file:
+            target_file.write(_BINARY_HEADER.pack(BINARY_MAZE_MAGIC, maze.rows, maze.columns))
+            for row in range(maze.rows):
+                target_file.write(maze.row_codes(row))
@@ -0,0 +1,196 @@
+"""Catalogue of the maze files in data dir.
+
+The catalogue stores the dimensions, start and exit counts, content hash, modification time, and
+size of each maze file to an index file in data dir, so the mazes can be listed, filtered, and
+sorted without opening the files. Refreshing the catalogue stats the files and rescans only the
+files whose modification time or size has changed. Listing the names refreshes the catalogue only
+if the modification time of data dir has changed, i.e. files have been added, removed, or renamed.
+"""
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+
+import fileparsing
+from fileparsing import create_translation_table
+from maze.mazeblock import BLOCK_TYPE_CODES, BlockType
+
+INDEX_FILE_NAME: str = ".catalogue.json"
+"""Name of the index file in data dir. Files starting with a dot are not mazes."""
+
+_READ_CHUNK_SIZE: int = 1024 * 1024
+_MTIME_RESOLUTION_NS: int = 2_000_000_000
+"""Coarsest modification time resolution of the supported file systems (FAT) in nanoseconds.
+
+Changes within this time from the previous refresh may not change the modification time of data
+dir, so data dir modified that recently is always refreshed.
+"""
+
+
+@dataclass(frozen=True)
+class MazeInfo:
+    """Class representing the catalogued information of a maze file."""
+
+    name: str
+    rows: int
+    columns: int
+    start_count: int
+    exit_count: int
+    sha256: str
+    mtime_ns: int
+    size: int
+
+
+class MazeCatalogue:
+    """Class representing an index of the maze files in data dir."""
+
+    def __init__(self, block_type_codes: dict[str, int]) -> None:
+        """Initialize catalogue. The index file is loaded on the first refresh.
+
+        Args:
+            block_type_codes: Block data and cell codes (see BlockFactory.block_type_codes).
+        """
+        self._translation_table = create_translation_table(block_type_codes)
+        self._entries: dict[str, MazeInfo] = {}
+        self._loaded = False
+        self._data_dir_mtime_ns: int | None = None
+        """Modification time of data dir when the catalogue was refreshed or None if not known."""
+
+    def refresh(self) -> None:
+        """Update the catalogue and its index file to match the files in data dir.
+
+        Raises:
+            FileNotFoundError: Data dir not found.
+        """
+        data_dir_mtime_ns = os.stat(fileparsing.get_data_dir()).st_mtime_ns
+        if not self._loaded:
+            self._entries = self._load_index()
+            self._loaded = True
+
+        entries: dict[str, MazeInfo] = {}
+        with os.scandir(fileparsing.get_data_dir()) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.name.startswith(".") or not dir_entry.is_file():
+                    continue
+                stat = dir_entry.stat()
+                entry = self._entries.get(dir_entry.name)
+                if entry is None or (entry.mtime_ns, entry.size) != (
+                    stat.st_mtime_ns, stat.st_size
+                ):
+                    entry = self._scan(
+                        dir_entry.path, dir_entry.name, stat.st_mtime_ns, stat.st_size
+                    )
+                entries[dir_entry.name] = entry
+
+        if entries != self._entries:
+            self._entries = entries
+            if self._save_index():
+                # Saving the index modifies data dir.
+                data_dir_mtime_ns = os.stat(fileparsing.get_data_dir()).st_mtime_ns
+        self._data_dir_mtime_ns = data_dir_mtime_ns
+
+    def names(self) -> list[str]:
+        """Get names of the maze files in alphabetical order.
+
+        The catalogue is refreshed only if data dir has been modified since the previous refresh,
+        so the files are not stated on every call.
+
+        Raises:
+            FileNotFoundError: Data dir not found.
+        """
+        data_dir_mtime_ns = os.stat(fileparsing.get_data_dir()).st_mtime_ns
+        if (
+            data_dir_mtime_ns != self._data_dir_mtime_ns
+            or time.time_ns() - data_dir_mtime_ns < _MTIME_RESOLUTION_NS
+        ):
+            self.refresh()
+        return sorted(self._entries)
+
+    def entries(
+        self, name_contains: str = "", min_size: int = 0, max_size: int | None = None
+    ) -> list[MazeInfo]:
+        """Get catalogued information of the maze files (without refreshing) sorted by name.
+
+        Args:
+            name_contains: Get only the files whose name contains this (case-insensitive).
+            min_size: Get only the files of at least this size in bytes.
+            max_size: Get only the files of at most this size in bytes. If None (default), get
+                files of any size.
+        """
+        name_contains = name_contains.casefold()
+        return [
+            entry
+            for entry in (self._entries[name] for name in sorted(self._entries))
+            if name_contains in entry.name.casefold()
+            and entry.size >= min_size
+            and (max_size is None or entry.size <= max_size)
+        ]
+
+    def get(self, name: str) -> MazeInfo | None:
+        """Get catalogued information of a maze file (without refreshing) or None if not found."""
+        return self._entries.get(name)
+
+    def _scan(self, path: str, name: str, mtime_ns: int, size: int) -> MazeInfo:
+        """Read maze file once, measuring its dimensions and counting its start and exit blocks.
+
+        Modification time and size are the ones the file was found with, so a file changed while
+        being read is rescanned on the next refresh.
+
+        Trailing whitespace of the rows is ignored, i.e. the same way as MazeFactory reads files.
+        """
+        digest = hashlib.sha256()
+        rows = columns = start_count = exit_count = 0
+        remainder = b""
+        with open(path, "rb") as file_object:
+            while chunk := file_object.read(_READ_CHUNK_SIZE):
+                digest.update(chunk)
+                lines = (remainder + chunk).split(b"\n")
+                remainder = lines.pop()
+                for line in lines:
+                    rows += 1
+                    columns = max(columns, len(line.rstrip()))
+                codes = chunk.translate(self._translation_table)
+                start_count += codes.count(BLOCK_TYPE_CODES[BlockType.START])
+                exit_count += codes.count(BLOCK_TYPE_CODES[BlockType.EXIT])
+        if remainder:
+            rows += 1
+            columns = max(columns, len(remainder.rstrip()))
+        return MazeInfo(
+            name,
+            rows,
+            columns,
+            start_count,
+            exit_count,
+            digest.hexdigest(),
+            mtime_ns,
+            size,
+        )
+
+    @staticmethod
+    def _index_path() -> str:
+        return os.path.join(fileparsing.get_data_dir(), INDEX_FILE_NAME)
+
+    def _load_index(self) -> dict[str, MazeInfo]:
+        """Load index file. Missing or invalid index file is the same as an empty index."""
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as index_file:
+                return {
+                    entry["name"]: MazeInfo(**entry) for entry in json.load(index_file)["mazes"]
+                }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save_index(self) -> bool:
+        """Save index file. Returns whether the index file was saved.
+
+        The catalogue works without the index file if data dir is read-only.
+        """
+        temporary_path = f"{self._index_path()}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as index_file:
+                json.dump({"mazes": [asdict(entry) for entry in self.entries()]}, index_file)
+            os.replace(temporary_path, self._index_path())
+        except OSError:
+            return False
+        return True
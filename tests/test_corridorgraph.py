@@ -0,0 +1,70 @@
+"""Corridor graph solver related tests."""
+from benchmarks.solvers import create_corridor_rows, create_random_rows
+from maze.corridorgraph import CorridorGraphSolver
+from maze.maze import MazeFactory, SolvedRoute
+from maze.mazeblock import BlockFactory, BlockSpec, BlockType, MazeBlock
+from maze.routefinder import bfs_search, dial_search
+
+_DATA_TO_BLOCK_TYPE_MAP: dict[str, BlockSpec] = {
+    "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN,
+    "~": (BlockType.OPEN, 5),
+}
+
+
+def _create_maze(rows: list[str]) -> MazeBlock:
+    maze_factory = MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP))
+    _, start_block = maze_factory.create_maze_from_rows(rows)
+    return start_block
+
+
+def _assert_valid_route(route: list[MazeBlock], start_block: MazeBlock) -> None:
+    assert route[0] is start_block
+    for block, next_block in zip(route, route[1:] + [None]):
+        adjacent_blocks = block.adjacent_blocks()
+        if next_block is None:
+            assert any(adjacent.type_ == BlockType.EXIT for adjacent in adjacent_blocks)
+        else:
+            assert any(adjacent is next_block for adjacent in adjacent_blocks)
+
+
+def test_corridor_graph_solver_matches_bfs_search() -> None:
+    solver = CorridorGraphSolver()
+    mazes = [create_corridor_rows(31, exit_count, seed) for exit_count in (1, 4) for seed in (0, 1)]
+    mazes += [create_random_rows(30, 0.3, 1, seed) for seed in range(4)]
+    for rows in mazes:
+        start_block = _create_maze(rows)
+        bfs_route = SolvedRoute([])
+        bfs_search(start_block, bfs_route)
+        for max_length in (0, 10, 50):
+            start_block.epoch.advance()
+            expected_route = SolvedRoute([])
+            bfs_search(start_block, expected_route, max_length)
+            solved_route = SolvedRoute([])
+            solver(start_block, solved_route, max_length)
+            if expected_route.blocks is None:
+                assert solved_route.blocks is None
+                continue
+            assert solved_route.blocks is not None
+            assert len(solved_route.blocks) == len(expected_route.blocks)
+            _assert_valid_route(solved_route.blocks, start_block)
+
+
+def test_corridor_graph_solver_finds_cheapest_route_and_reuses_graph() -> None:
+    start_block = _create_maze(["#######", "#^~~~E#", "# ### #", "#     #", "#######"])
+    solver = CorridorGraphSolver()
+    solved_route = SolvedRoute([])
+    solver(start_block, solved_route)
+    expected_route = SolvedRoute([])
+    dial_search(start_block, expected_route)
+    assert solved_route.blocks is not None and expected_route.blocks is not None
+    assert [block.index for block in solved_route.blocks] == [
+        block.index for block in expected_route.blocks
+    ]
+    graph = solver.graph(start_block)
+
+    # Cheapest route costs 8 (the detour), so a budget of 7 is not enough.
+    solver(start_block, solved_route, 7)
+    assert solved_route.blocks is None
+    solver(start_block, solved_route, 8)
+    assert solved_route.blocks is not None
+    assert solver.graph(start_block) is graph
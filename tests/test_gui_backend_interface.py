@@ -0,0 +1,165 @@
+"""GUI backend interface related tests."""
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gui.gui_backend_interface import (
+    PROCESS_SOLVER_NAME,
+    GUIBackendEvent,
+    GUIBackendInterface,
+    GUIMazeBlockIndex,
+    GUIMazeBlockType,
+    GUIMazeView,
+)
+from maze.maze import Maze, MazeFactory
+from maze.mazeblock import BlockFactory, BlockIndex, BlockType
+from maze.routefinder import bfs_search, dial_search
+from maze.solvers import SolverRegistry
+
+
+def test_progress_events_are_coalesced_until_visited_blocks_are_read() -> None:
+    gui_backend_interface = GUIBackendInterface(lambda: [], MagicMock())
+    events: list[GUIBackendEvent] = []
+    gui_backend_interface.set_event_listener(events.append)
+
+    gui_backend_interface.set_new_visited_blocks([BlockIndex(0, 0)])
+    gui_backend_interface.set_new_visited_blocks([BlockIndex(0, 1)])
+    assert events == [GUIBackendEvent.PROGRESS]
+
+    assert gui_backend_interface.get_new_visited_blocks() == [
+        GUIMazeBlockIndex(0, 0), GUIMazeBlockIndex(0, 1)
+    ]
+    gui_backend_interface.set_new_visited_blocks([BlockIndex(1, 1)])
+    assert events == [GUIBackendEvent.PROGRESS, GUIBackendEvent.PROGRESS]
+
+
+def test_solved_event_is_sent_when_solver_finishes() -> None:
+    backend_maze = MagicMock()
+    gui_backend_interface = GUIBackendInterface(lambda: [], backend_maze)
+    events: list[GUIBackendEvent] = []
+    gui_backend_interface.set_event_listener(events.append)
+
+    gui_backend_interface.solve_maze(20)
+    max_route_length, slow_down, on_finished = backend_maze.solve_maze.call_args.args
+    assert (max_route_length, slow_down) == (20, False)
+    on_finished()
+    assert events == [GUIBackendEvent.SOLVED]
+
+
+def test_shortest_routes_are_counted_in_background() -> None:
+    maze = Maze(MazeFactory(BlockFactory[str]({
+        "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+    })))
+    gui_backend_interface = GUIBackendInterface(lambda: [], maze)
+    routes_counted = threading.Event()
+    gui_backend_interface.set_event_listener(
+        lambda event: routes_counted.set() if event == GUIBackendEvent.ROUTES_COUNTED else None
+    )
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        gui_backend_interface.get_maze("dummy_maze.txt")
+    assert gui_backend_interface.get_shortest_route_count() is None
+
+    gui_backend_interface.count_shortest_routes()
+    assert routes_counted.wait(10)
+    assert gui_backend_interface.get_shortest_route_count() == 1
+
+    routes_counted.clear()
+    gui_backend_interface.count_shortest_routes(1)
+    assert routes_counted.wait(10)
+    assert gui_backend_interface.get_shortest_route_count() == 0
+
+
+def test_solve_maze_uses_selected_solver() -> None:
+    backend_maze = MagicMock()
+    backend_maze.get_maze.return_value = []
+    solver_registry = SolverRegistry()
+    solver_registry.register("bfs", bfs_search)
+    solver_registry.register("dial", dial_search, supports_costs=True)
+    gui_backend_interface = GUIBackendInterface(lambda: [], backend_maze, solver_registry)
+    assert gui_backend_interface.get_solver_names() == ["auto", "bfs", "dial"]
+
+    gui_backend_interface.solve_maze()
+    assert gui_backend_interface.get_active_solver_name() == "bfs"
+    gui_backend_interface.set_solver("dial")
+    gui_backend_interface.solve_maze()
+    assert gui_backend_interface.get_active_solver_name() == "dial"
+    assert backend_maze.solver.func is dial_search
+
+
+def test_maze_view_shares_cells_with_backend_maze() -> None:
+    maze = Maze(MazeFactory(BlockFactory[str]({
+        "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+    })))
+    gui_backend_interface = GUIBackendInterface(lambda: [], maze)
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        maze_view = gui_backend_interface.get_maze("dummy_maze.txt")
+
+    assert (maze_view.rows, maze_view.columns) == (3, 3)
+    assert maze_view.cell_type(0, 1) == GUIMazeBlockType.EXIT
+    assert maze_view.cell_type(1, 0) == GUIMazeBlockType.START
+    assert maze_view.cell_type(2, 1) == GUIMazeBlockType.OPEN
+    assert maze_view.cell_type(2, 2) == GUIMazeBlockType.SOLID
+    assert list(maze_view) == [b"\x00\x03\x00", b"\x02\x01\x00", b"\x00\x01\x00"]
+    assert all(
+        view_row is backend_row for view_row, backend_row in zip(maze_view, maze.get_cell_rows())
+    )
+
+
+def test_maze_view_rejects_unknown_cell_codes() -> None:
+    maze_view = GUIMazeView([bytes([0, 9])])
+    assert maze_view.cell_type(0, 0) == GUIMazeBlockType.SOLID
+    with pytest.raises(ValueError):
+        maze_view.cell_type(0, 1)
+    with pytest.raises(IndexError):
+        maze_view.cell_type(0, 2)
+
+
+def test_solved_route_is_encoded() -> None:
+    backend_maze = MagicMock()
+    backend_maze.shortest_route.blocks = None
+    gui_backend_interface = GUIBackendInterface(lambda: [], backend_maze)
+    assert not gui_backend_interface.is_solved()
+    with pytest.raises(ValueError):
+        gui_backend_interface.get_solved_route()
+
+    gui_backend_interface.solve_maze()
+    _, _, on_finished = backend_maze.solve_maze.call_args.args
+    on_finished()
+    assert gui_backend_interface.is_solved()
+    assert gui_backend_interface.get_solved_route() is None
+
+    backend_maze.shortest_route.blocks = [
+        MagicMock(index=BlockIndex(1, 1)), MagicMock(index=BlockIndex(1, 2))
+    ]
+    solved_route = gui_backend_interface.get_solved_route()
+    assert solved_route is not None
+    assert solved_route.to_rle() == "R"
+    assert list(solved_route.blocks()) == [BlockIndex(1, 1), BlockIndex(1, 2)]
+
+
+def test_maze_is_solved_in_separate_process() -> None:
+    maze = Maze(MazeFactory(BlockFactory[str]({
+        "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+    })))
+    gui_backend_interface = GUIBackendInterface(lambda: [], maze, out_of_process=True)
+    events: list[GUIBackendEvent] = []
+    gui_backend_interface.set_event_listener(events.append)
+    try:
+        with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+            gui_backend_interface.get_maze("maze-task-first.txt")
+        gui_backend_interface.solve_maze()
+        assert gui_backend_interface.get_active_solver_name() == PROCESS_SOLVER_NAME
+        deadline = time.monotonic() + 30
+        while gui_backend_interface.is_polling_progress() and time.monotonic() < deadline:
+            gui_backend_interface.poll_progress()
+            time.sleep(0.01)
+
+        assert events[0] == GUIBackendEvent.PROGRESS and events[-1] == GUIBackendEvent.SOLVED
+        assert gui_backend_interface.get_new_visited_blocks()
+        solved_route = gui_backend_interface.get_solved_route()
+        assert solved_route is not None and len(solved_route) == 39
+    finally:
+        gui_backend_interface.close()
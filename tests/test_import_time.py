@@ -0,0 +1,40 @@
+"""Import time related tests."""
+import os
+
+import pytest
+
+from benchmarks.import_time import (
+    IMPORT_TIME_BUDGETS_US,
+    LOOSE_BUDGET_FACTOR,
+    find_forbidden_modules,
+    headless_solve_modules,
+    measure_import_time,
+)
+
+
+def test_headless_modules_do_not_import_heavy_modules() -> None:
+    for module in IMPORT_TIME_BUDGETS_US:
+        import_time = measure_import_time(module)
+        assert not import_time.forbidden_modules(), module
+
+
+def test_headless_solve_does_not_import_heavy_modules() -> None:
+    loaded_modules = headless_solve_modules("maze-task-first.txt")
+    assert "maze.routefinder" in loaded_modules
+    assert not find_forbidden_modules(loaded_modules)
+
+
+def test_headless_modules_stay_within_loose_import_time_budget() -> None:
+    for module, budget_us in IMPORT_TIME_BUDGETS_US.items():
+        import_time = measure_import_time(module)
+        assert 0 < import_time.cumulative_us <= LOOSE_BUDGET_FACTOR * budget_us, module
+
+
+@pytest.mark.skipif(
+    not os.environ.get("CHECK_IMPORT_TIME"),
+    reason="wall-clock budgets are machine dependent, set CHECK_IMPORT_TIME=1 to check them",
+)
+def test_headless_modules_stay_within_import_time_budget() -> None:
+    for module, budget_us in IMPORT_TIME_BUDGETS_US.items():
+        import_time = measure_import_time(module)
+        assert 0 < import_time.cumulative_us <= budget_us, module
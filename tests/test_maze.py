@@ -1,9 +1,10 @@
 """Maze related tests."""
 import os
+from typing import Any
 from unittest.mock import patch
 
-from maze.maze import MazeFactory
-from maze.mazeblock import BlockFactory, BlockIndex, BlockType
+from maze.maze import CellRows, MazeFactory
+from maze.mazeblock import BlockFactory, BlockIndex, BlockType, MazeBlock
 
 
 def test_maze_factory_creates_correct_maze_structure() -> None:
@@ -28,3 +29,32 @@ def test_maze_factory_creates_correct_maze_structure() -> None:
                 assert c.type_ == e.type_
                 assert c.index == e.index
 
+
+
+class _ReadRows(list[list[MazeBlock]]):
+    """Rows of blocks recording which rows have been read."""
+
+    def __init__(self, rows: list[list[MazeBlock]]) -> None:
+        super().__init__(rows)
+        self.read_rows: set[int] = set()
+
+    def __getitem__(self, index: Any) -> Any:
+        self.read_rows.add(index)
+        return super().__getitem__(index)
+
+
+def test_cell_rows_are_created_on_first_access() -> None:
+    maze_factory = MazeFactory(BlockFactory[str]({
+        "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+    }))
+    blocks, _ = maze_factory.create_maze_from_rows(["#^#", "  E", "##"])
+    read_blocks = _ReadRows(blocks)
+    cell_rows = CellRows(read_blocks)
+    assert (len(cell_rows), cell_rows.columns) == (3, 3)
+    assert cell_rows[-1] == bytes([0, 0, 0])
+    assert read_blocks.read_rows == {2}
+
+    assert cell_rows[1] is cell_rows[1]
+    assert list(cell_rows) == [bytes([0, 2, 0]), bytes([1, 1, 3]), bytes([0, 0, 0])]
+    assert cell_rows[:2] == [bytes([0, 2, 0]), bytes([1, 1, 3])]
+    assert read_blocks.read_rows == {0, 1, 2}
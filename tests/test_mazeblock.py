@@ -69,3 +69,27 @@ def test_maze_block_returns_correct_next_blocks_when_some_visited() -> None:
     block4.left = block1
     block2.visited = True
     assert block1.next_available_blocks() == [block3]
+
+
+def test_advancing_search_epoch_clears_visited_blocks() -> None:
+    data_to_block_type_map = {
+        "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+    }
+    factory = BlockFactory[str](data_to_block_type_map)
+    block1 = factory.create_block(" ", BlockIndex(0, 0))
+    block2 = factory.create_block(" ", BlockIndex(0, 1))
+    block1.right = block2
+    block2.left = block1
+    block2.visited = True
+    assert block1.next_available_blocks() == []
+    factory.search_epoch.advance()
+    assert not block2.visited
+    assert block1.next_available_blocks() == [block2]
+
+
+def test_maze_block_factory_creates_blocks_with_costs() -> None:
+    factory = BlockFactory[str]({" ": BlockType.OPEN, "~": (BlockType.OPEN, 5)})
+    assert factory.create_block(" ", BlockIndex(0, 0)).cost == 1
+    assert factory.create_block("~", BlockIndex(0, 0)).cost == 5
+    with pytest.raises(ValueError):
+        BlockFactory[str]({"~": (BlockType.OPEN, 0)})
@@ -0,0 +1,97 @@
+"""Maze catalogue related tests."""
+import os
+from unittest.mock import patch
+
+from fileparsing import get_maze_file_names
+from mazecatalogue import INDEX_FILE_NAME, MazeCatalogue
+
+_BLOCK_TYPE_CODES = {"#": 0, " ": 1, "^": 2, "E": 3}
+
+
+def _write_maze(tmp_path: str, name: str, rows: list[str]) -> None:
+    with open(os.path.join(tmp_path, name), "w", encoding="utf-8") as maze_file:
+        maze_file.write("\n".join(rows))
+
+
+def test_catalogue_describes_mazes_and_stores_index(tmp_path: str) -> None:
+    _write_maze(tmp_path, "b.txt", ["#E#  ", "#^ E#", "###"])
+    _write_maze(tmp_path, "a.txt", ["^E"])
+    with patch("fileparsing._DATA_DIR", str(tmp_path)):
+        catalogue = MazeCatalogue(_BLOCK_TYPE_CODES)
+        assert catalogue.names() == ["a.txt", "b.txt"]
+        maze_info = catalogue.get("b.txt")
+        assert maze_info is not None
+        # Trailing whitespace is not part of the maze.
+        assert (maze_info.rows, maze_info.columns) == (3, 5)
+        assert (maze_info.start_count, maze_info.exit_count) == (1, 2)
+        assert maze_info.size == os.path.getsize(os.path.join(tmp_path, "b.txt"))
+        assert os.path.isfile(os.path.join(tmp_path, INDEX_FILE_NAME))
+        # Index file is not a maze.
+        assert get_maze_file_names() == ["a.txt", "b.txt"]
+
+        # New catalogue uses the index instead of reading unchanged files.
+        catalogue = MazeCatalogue(_BLOCK_TYPE_CODES)
+        with patch.object(MazeCatalogue, "_scan", side_effect=AssertionError):
+            catalogue.refresh()
+        assert catalogue.get("b.txt") == maze_info
+
+
+def test_catalogue_rescans_only_changed_files(tmp_path: str) -> None:
+    _write_maze(tmp_path, "a.txt", ["^E"])
+    _write_maze(tmp_path, "b.txt", ["^ E"])
+    with patch("fileparsing._DATA_DIR", str(tmp_path)):
+        catalogue = MazeCatalogue(_BLOCK_TYPE_CODES)
+        catalogue.refresh()
+        _write_maze(tmp_path, "b.txt", ["^ EE", "####"])
+        os.remove(os.path.join(tmp_path, "a.txt"))
+        _write_maze(tmp_path, "c.txt", ["^"])
+
+        scanned_names: list[str] = []
+        scan = MazeCatalogue._scan  # pylint: disable=protected-access
+
+        def record_scan(*args: object) -> object:
+            scanned_names.append(str(args[2]))
+            return scan(*args)  # type: ignore[arg-type]
+
+        with patch.object(MazeCatalogue, "_scan", record_scan):
+            catalogue.refresh()
+        assert sorted(scanned_names) == ["b.txt", "c.txt"]
+        assert [entry.name for entry in catalogue.entries()] == ["b.txt", "c.txt"]
+        maze_info = catalogue.get("b.txt")
+        assert maze_info is not None
+        assert (maze_info.rows, maze_info.exit_count) == (2, 2)
+
+
+def test_catalogue_lists_names_again_only_when_data_dir_changes(tmp_path: str) -> None:
+    _write_maze(tmp_path, "a.txt", ["^E"])
+    # Data dir modified just now is refreshed anyway unless the resolution is ignored.
+    with (
+        patch("fileparsing._DATA_DIR", str(tmp_path)),
+        patch("mazecatalogue._MTIME_RESOLUTION_NS", 0),
+    ):
+        catalogue = MazeCatalogue(_BLOCK_TYPE_CODES)
+        assert catalogue.names() == ["a.txt"]
+        with patch.object(MazeCatalogue, "refresh", side_effect=AssertionError):
+            assert catalogue.names() == ["a.txt"]
+
+        _write_maze(tmp_path, "b.txt", ["^ E"])
+        assert catalogue.names() == ["a.txt", "b.txt"]
+
+
+def test_catalogue_entries_are_filtered_by_name_and_size(tmp_path: str) -> None:
+    _write_maze(tmp_path, "small.txt", ["^E"])
+    _write_maze(tmp_path, "Large.txt", ["^" + " " * 98 + "E"])
+    _write_maze(tmp_path, "medium-large.txt", ["^" + " " * 8 + "E"])
+    with patch("fileparsing._DATA_DIR", str(tmp_path)):
+        catalogue = MazeCatalogue(_BLOCK_TYPE_CODES)
+        catalogue.refresh()
+        assert [entry.name for entry in catalogue.entries(name_contains="large")] == [
+            "Large.txt", "medium-large.txt"
+        ]
+        assert [entry.name for entry in catalogue.entries(min_size=10)] == [
+            "Large.txt", "medium-large.txt"
+        ]
+        assert [entry.name for entry in catalogue.entries(max_size=10)] == [
+            "medium-large.txt", "small.txt"
+        ]
+        assert catalogue.entries(name_contains="small", min_size=3) == []
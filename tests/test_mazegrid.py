@@ -0,0 +1,41 @@
+"""Maze grid related tests."""
+import os
+from unittest.mock import patch
+
+import pytest
+
+from maze.maze import MazeFactory
+from maze.mazeblock import BlockFactory, BlockIndex, BlockType
+
+_DATA_TO_BLOCK_TYPE_MAP = {
+    "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+}
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_maze_factory_creates_grid_matching_maze_structure(workers: int) -> None:
+    maze_factory = MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP))
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        blocks, start_block = maze_factory.create_maze("maze-task-first.txt")
+        with maze_factory.create_grid("maze-task-first.txt", workers) as grid:
+            assert (grid.rows, grid.columns) == (19, 37)
+            assert grid.start == start_block.index
+            assert grid.exits == [BlockIndex(0, 7), BlockIndex(0, 16), BlockIndex(1, 36)]
+            for row in blocks:
+                for block in row:
+                    assert grid.block_type(block.index.row, block.index.column) == block.type_
+
+
+def test_maze_factory_grid_raises_for_invalid_block_data(tmp_path: str) -> None:
+    with open(os.path.join(tmp_path, "maze.txt"), "w", encoding="utf-8") as maze_file:
+        maze_file.write("\n".join(["#^#", "# #", "#A#", "#E#"]))
+    maze_factory = MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP))
+    with patch("fileparsing._DATA_DIR", str(tmp_path)):
+        with pytest.raises(KeyError, match="row 2 column 1"):
+            maze_factory.create_grid("maze.txt", 2)
+
+    # Grids are decoded byte by byte, so block data must be single byte strings.
+    maze_factory = MazeFactory(BlockFactory[int]({0: BlockType.SOLID, 1: BlockType.OPEN}))
+    with patch("fileparsing._DATA_DIR", str(tmp_path)):
+        with pytest.raises(ValueError, match="byte by byte"):
+            maze_factory.create_grid("maze.txt")
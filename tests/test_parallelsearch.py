@@ -0,0 +1,37 @@
+"""Parallel search related tests."""
+import pytest
+
+from maze.maze import MazeFactory
+from maze.mazeblock import BlockFactory, BlockType
+from maze.parallelsearch import ParallelBFS
+from maze.tiledmaze import TiledMaze, tiled_bfs_search
+
+_DATA_TO_BLOCK_TYPE_MAP = {
+    "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+}
+
+
+@pytest.mark.parametrize("maze_name", ["maze-task-first.txt", "maze-task-second.txt"])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_bfs_finds_shortest_route_within_step_limit(maze_name: str, workers: int) -> None:
+    maze_factory = MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP))
+    with (
+        maze_factory.create_grid(maze_name) as grid,
+        TiledMaze(maze_name, _DATA_TO_BLOCK_TYPE_MAP) as tiled_maze,
+        ParallelBFS(grid, workers) as search,
+    ):
+        for max_length in (0, 20, 150, 200):
+            expected_route = tiled_bfs_search(tiled_maze, max_length)
+            route = search.search(max_length)
+            if expected_route is None:
+                assert route is None
+                continue
+            assert route is not None
+            assert len(route) == len(expected_route)
+            assert route[0] == grid.start
+            # Route moves one step at a time through non-solid blocks.
+            for block, next_block in zip(route, route[1:]):
+                assert abs(block.row - next_block.row) + abs(
+                    block.column - next_block.column
+                ) == 1
+                assert grid.block_type(next_block.row, next_block.column) != BlockType.SOLID
@@ -0,0 +1,119 @@
+"""Out-of-process solver related tests."""
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.solvers import create_random_rows
+from maze.maze import Maze, MazeFactory, SolvedRoute
+from maze.mazeblock import BlockFactory, BlockType
+from maze.processsolver import STATUS_NO_ROUTE, STATUS_RUNNING, STATUS_SOLVED, ProcessSolve
+from maze.routefinder import bfs_search
+
+_DATA_TO_BLOCK_TYPE_MAP = {
+    "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+}
+
+
+def test_process_solve_finds_same_route_length_as_bfs_search() -> None:
+    maze = Maze(MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP)))
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        maze.create_maze("maze-task-first.txt")
+    with maze.create_grid() as grid:
+        for max_length, expected_status in ((0, STATUS_SOLVED), (38, STATUS_NO_ROUTE)):
+            process_solve = ProcessSolve(grid, max_length)
+            try:
+                assert process_solve.wait(30)
+                assert process_solve.status() == expected_status
+                visited_cells = process_solve.new_visited_cells()
+                assert visited_cells
+                assert process_solve.new_visited_cells() == []
+                route = process_solve.route()
+                if expected_status == STATUS_NO_ROUTE:
+                    assert route is None
+                    continue
+                assert route is not None
+                assert len(route) == 39
+                blocks = maze.get_maze()
+                assert all(
+                    blocks[index.row][index.column].type_ != BlockType.SOLID
+                    for index in route.blocks()
+                )
+            finally:
+                process_solve.close()
+
+
+def test_process_solve_matches_bfs_search_on_random_mazes() -> None:
+    maze_factory = MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP))
+    for seed in range(3):
+        rows = create_random_rows(40, 0.3, 2, seed)
+        blocks, start_block = maze_factory.create_maze_from_rows(rows)
+        solved_route = SolvedRoute([])
+        bfs_search(start_block, solved_route)
+
+        maze = Maze(maze_factory)
+        maze._blocks = blocks  # pylint: disable=protected-access
+        with maze.create_grid() as grid:
+            process_solve = ProcessSolve(grid)
+            try:
+                assert process_solve.wait(30)
+                route = process_solve.route()
+            finally:
+                process_solve.close()
+        if solved_route.blocks is None:
+            assert route is None
+        else:
+            assert route is not None
+            assert [index for index in route.blocks()] == [
+                block.index for block in solved_route.blocks
+            ]
+
+
+def _reachable_open_cells(rows: list[str]) -> set[tuple[int, int]]:
+    start = next((row, cells.index("^")) for row, cells in enumerate(rows) if "^" in cells)
+    found = {start}
+    cells_to_check = [start]
+    while cells_to_check:
+        row, column = cells_to_check.pop()
+        for neighbour_row, neighbour_column in (
+            (row - 1, column), (row + 1, column), (row, column - 1), (row, column + 1)
+        ):
+            neighbour = (neighbour_row, neighbour_column)
+            if (
+                0 <= neighbour_row < len(rows) and 0 <= neighbour_column < len(rows[neighbour_row])
+                and rows[neighbour_row][neighbour_column] != "#" and neighbour not in found
+            ):
+                found.add(neighbour)
+                cells_to_check.append(neighbour)
+    return {(row, column) for row, column in found if rows[row][column] == " "}
+
+
+@pytest.mark.parametrize("ring_size", [4096, 65])
+def test_visited_cells_polled_while_solving_are_read_once_each(ring_size: int) -> None:
+    maze_factory = MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP))
+    # No exits, so all the reachable cells are visited.
+    rows = create_random_rows(300, 0.3, 0)
+    maze = Maze(maze_factory)
+    maze._blocks, _ = maze_factory.create_maze_from_rows(rows)  # pylint: disable=protected-access
+    visited_cells: list[tuple[int, int]] = []
+    polls_with_cells = 0
+    # Small ring is overwritten between the polls, so the whole bitmap is read instead.
+    with maze.create_grid() as grid, patch("maze.processsolver.DIRTY_RING_SIZE", ring_size):
+        process_solve = ProcessSolve(grid)
+        try:
+            while True:
+                finished = process_solve.status() != STATUS_RUNNING
+                if new_visited_cells := process_solve.new_visited_cells():
+                    polls_with_cells += 1
+                    visited_cells += [(index.row, index.column) for index in new_visited_cells]
+                if finished:
+                    break
+                time.sleep(0.001)
+            assert process_solve.status() == STATUS_NO_ROUTE
+        finally:
+            process_solve.close()
+
+    assert polls_with_cells > 1
+    assert len(visited_cells) == len(set(visited_cells))
+    assert set(visited_cells) == _reachable_open_cells(rows)
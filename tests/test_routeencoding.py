@@ -0,0 +1,59 @@
+"""Route encoding related tests."""
+import io
+
+import pytest
+
+from maze.mazeblock import BlockIndex
+from maze.routeencoding import (
+    EncodedRoute,
+    decode_rle,
+    moves_to_route,
+    pack_moves,
+    read_route,
+    route_to_moves,
+    unpack_moves,
+    write_route,
+)
+
+_ROUTE = [
+    BlockIndex(4, 2), BlockIndex(3, 2), BlockIndex(2, 2), BlockIndex(1, 2), BlockIndex(1, 3),
+    BlockIndex(1, 4), BlockIndex(2, 4),
+]
+
+
+def test_moves_round_trip() -> None:
+    moves = route_to_moves(_ROUTE)
+    assert len(moves) == 6
+    assert len(pack_moves(moves)) == 2
+    assert moves_to_route(_ROUTE[0], unpack_moves(pack_moves(moves), len(moves))) == _ROUTE
+
+
+def test_encoded_route_round_trip() -> None:
+    encoded_route = EncodedRoute.from_route(iter(_ROUTE))
+    assert len(encoded_route) == len(_ROUTE)
+    assert list(encoded_route.blocks()) == _ROUTE
+    assert encoded_route.to_rle() == "U3R2D"
+    assert EncodedRoute.from_rle(_ROUTE[0], "U3R2D") == encoded_route
+    assert list(EncodedRoute.from_route([_ROUTE[0]]).blocks()) == [_ROUTE[0]]
+
+
+def test_routes_are_written_and_read_as_lines() -> None:
+    stream = io.StringIO()
+    assert write_route(iter(_ROUTE), stream) == 6
+    write_route(iter(_ROUTE[:2]), stream)
+    assert stream.getvalue() == "4,2 U3R2D\n4,2 U\n"
+
+    stream.seek(0)
+    assert list(read_route(stream)) == _ROUTE
+    assert list(read_route(stream)) == _ROUTE[:2]
+
+
+def test_invalid_routes_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        write_route([], io.StringIO())
+    with pytest.raises(ValueError):
+        EncodedRoute.from_route([BlockIndex(0, 0), BlockIndex(1, 1)])
+    with pytest.raises(ValueError):
+        list(decode_rle("3U"))
+    with pytest.raises(ValueError):
+        list(read_route(io.StringIO("4;2 U\n")))
@@ -0,0 +1,132 @@
+"""Route finder related tests."""
+import math
+import os
+import random
+from unittest.mock import patch
+
+from maze.maze import MazeFactory, SolvedRoute
+from maze.mazeblock import BlockFactory, BlockType, MazeBlock
+from maze.routefinder import bfs_search, count_shortest_routes, dial_search
+
+_DATA_TO_BLOCK_TYPE_MAP = {
+    "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+}
+
+
+def test_bfs_search_finds_shortest_route_within_step_limit() -> None:
+    maze_factory = MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP))
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        _, start_block = maze_factory.create_maze("maze-task-first.txt")
+
+    solved_route = SolvedRoute([])
+    bfs_search(start_block, solved_route)
+    assert solved_route.blocks is not None
+    assert solved_route.blocks[0] is start_block
+    assert len(solved_route.blocks) == 39
+
+    start_block.epoch.advance()
+    bfs_search(start_block, solved_route, 38)
+    assert solved_route.blocks is None
+
+    start_block.epoch.advance()
+    bfs_search(start_block, solved_route, 39)
+    assert solved_route.blocks is not None
+    assert len(solved_route.blocks) == 39
+
+
+def _create_maze(tmp_path: str, rows: list[str]) -> MazeBlock:
+    with open(os.path.join(tmp_path, "maze.txt"), "w", encoding="utf-8") as maze_file:
+        maze_file.write("\n".join(rows))
+    maze_factory = MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP))
+    with patch("fileparsing._DATA_DIR", str(tmp_path)):
+        _, start_block = maze_factory.create_maze("maze.txt")
+    return start_block
+
+
+def test_count_shortest_routes_counts_and_enumerates_routes(tmp_path: str) -> None:
+    start_block = _create_maze(tmp_path, ["^  #", "   #", "  E#"])
+    shortest_routes = count_shortest_routes(start_block)
+    assert shortest_routes is not None
+    assert shortest_routes.length == 4
+    assert shortest_routes.count == 6
+
+    routes = [
+        tuple((block.index.row, block.index.column) for block in route)
+        for route in shortest_routes.routes()
+    ]
+    assert len(set(routes)) == 6
+    assert all(route[0] == (0, 0) and route[-1] == (2, 2) for route in routes)
+
+    for route in shortest_routes.random_routes(10, random.Random(0)):
+        assert tuple((block.index.row, block.index.column) for block in route) in routes
+
+    assert count_shortest_routes(start_block, 3) is None
+
+
+def test_count_shortest_routes_counts_routes_to_all_nearest_exits(tmp_path: str) -> None:
+    start_block = _create_maze(tmp_path, ["E^E", "# #", "  E"])
+    shortest_routes = count_shortest_routes(start_block)
+    assert shortest_routes is not None
+    assert shortest_routes.length == 1
+    assert shortest_routes.count == 2
+    assert len(list(shortest_routes.routes())) == 2
+
+
+def test_count_shortest_routes_is_exact_for_huge_counts(tmp_path: str) -> None:
+    start_block = _create_maze(
+        tmp_path, ["^" + " " * 39 + "#"] + [" " * 40 + "#"] * 38 + [" " * 39 + "E#"]
+    )
+    shortest_routes = count_shortest_routes(start_block)
+    assert shortest_routes is not None
+    assert shortest_routes.count == math.comb(78, 39)
+    assert len(shortest_routes.random_routes(1)[0]) == 79
+    assert len(next(shortest_routes.routes())) == 79
+
+
+def test_count_shortest_routes_counts_cheapest_routes_with_block_costs(tmp_path: str) -> None:
+    with open(os.path.join(tmp_path, "maze.txt"), "w", encoding="utf-8") as maze_file:
+        maze_file.write("\n".join(["#####", "^ ~E#", "#   #", "#####"]))
+    data_to_block_type_map = _DATA_TO_BLOCK_TYPE_MAP | {"~": (BlockType.OPEN, 3)}
+    maze_factory = MazeFactory(BlockFactory[str](data_to_block_type_map))
+    with patch("fileparsing._DATA_DIR", str(tmp_path)):
+        _, start_block = maze_factory.create_maze("maze.txt")
+
+    # Route through water (3 moves) and route around it (5 moves) both cost 5.
+    shortest_routes = count_shortest_routes(start_block)
+    assert shortest_routes is not None
+    assert shortest_routes.length == 5
+    assert shortest_routes.count == 2
+    assert sorted(len(route) for route in shortest_routes.routes()) == [4, 6]
+    assert count_shortest_routes(start_block, 4) is None
+
+
+def test_dial_search_finds_cheapest_route_within_cost_budget(tmp_path: str) -> None:
+    with open(os.path.join(tmp_path, "maze.txt"), "w", encoding="utf-8") as maze_file:
+        maze_file.write("\n".join(["#####", "^ ~E#", "#   #", "#####"]))
+    data_to_block_type_map = _DATA_TO_BLOCK_TYPE_MAP | {"~": (BlockType.OPEN, 5)}
+    maze_factory = MazeFactory(BlockFactory[str](data_to_block_type_map))
+    with patch("fileparsing._DATA_DIR", str(tmp_path)):
+        _, start_block = maze_factory.create_maze("maze.txt")
+
+    # Route through water costs 7, route around it costs 5.
+    solved_route = SolvedRoute([])
+    dial_search(start_block, solved_route)
+    assert solved_route.blocks is not None
+    assert [(block.index.row, block.index.column) for block in solved_route.blocks] == [
+        (1, 0), (1, 1), (2, 1), (2, 2), (2, 3)
+    ]
+
+    start_block.epoch.advance()
+    dial_search(start_block, solved_route, 4)
+    assert solved_route.blocks is None
+
+
+def test_dial_search_matches_bfs_search_with_equal_costs() -> None:
+    maze_factory = MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP))
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        _, start_block = maze_factory.create_maze("maze-task-first.txt")
+
+    solved_route = SolvedRoute([])
+    dial_search(start_block, solved_route)
+    assert solved_route.blocks is not None
+    assert len(solved_route.blocks) == 39
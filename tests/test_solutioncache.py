@@ -0,0 +1,115 @@
+"""Solution cache related tests."""
+import functools
+import os
+import threading
+from unittest.mock import patch
+
+from maze.maze import Maze, MazeFactory
+from maze.mazeblock import BlockFactory, BlockIndex, BlockType
+from maze.routefinder import bfs_search
+from maze.solutioncache import SolutionCache, SolutionKey, block_map_digest, solver_identity
+
+_ROUTE = [BlockIndex(1, 1), BlockIndex(1, 2), BlockIndex(2, 2), BlockIndex(2, 1), BlockIndex(1, 1)]
+
+
+def test_solution_cache_stores_routes_and_missing_solutions(tmp_path: str) -> None:
+    path = os.path.join(tmp_path, "cache", "solutions.sqlite3")
+    key = SolutionKey("hash", "digest", _ROUTE[0], 0, "solver")
+    no_route_key = SolutionKey("hash", "digest", _ROUTE[0], 3, "solver")
+    cache = SolutionCache(path)
+    assert cache.get(key) is None
+    cache.put(key, _ROUTE)
+    cache.put(no_route_key, None)
+    cache.close()
+
+    # Solutions persist between the cache instances.
+    cache = SolutionCache(path)
+    cached_solution = cache.get(key)
+    assert cached_solution is not None
+    assert cached_solution.route == _ROUTE
+    cached_solution = cache.get(no_route_key)
+    assert cached_solution is not None
+    assert cached_solution.route is None
+    cache.close()
+
+
+def test_solution_cache_evicts_least_recently_used(tmp_path: str) -> None:
+    keys = [
+        SolutionKey("hash", "digest", _ROUTE[0], max_length, "solver") for max_length in range(4)
+    ]
+    path = os.path.join(tmp_path, "solutions.sqlite3")
+    # Room for two solutions.
+    cache = SolutionCache(path, max_bytes=2 * 65)
+    cache.put(keys[0], _ROUTE)
+    cache.put(keys[1], _ROUTE)
+    # Replacing a solution does not grow the total size.
+    cache.put(keys[1], _ROUTE)
+    assert cache.get(keys[0]) is not None
+    cache.put(keys[2], _ROUTE)
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+    cache.close()
+
+    # Total size and use order persist between the cache instances.
+    cache = SolutionCache(path, max_bytes=2 * 65)
+    cache.put(keys[3], _ROUTE)
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) is not None
+    assert cache.get(keys[3]) is not None
+    cache.close()
+
+
+def test_block_map_digest_depends_on_types_and_costs() -> None:
+    block_specs = {"#": (BlockType.SOLID, 1), " ": (BlockType.OPEN, 1)}
+    assert block_map_digest(block_specs) == block_map_digest(dict(reversed(block_specs.items())))
+    assert block_map_digest(block_specs) != block_map_digest(
+        {**block_specs, " ": (BlockType.OPEN, 2)}
+    )
+    assert block_map_digest(block_specs) != block_map_digest(
+        {**block_specs, "#": (BlockType.OPEN, 1)}
+    )
+
+
+def test_solver_identity_unwraps_partials() -> None:
+    assert solver_identity(functools.partial(bfs_search, slow_down=False)) == (
+        "maze.routefinder.bfs_search"
+    )
+
+
+def test_maze_uses_cached_solution(tmp_path: str) -> None:
+    data_to_block_type_map = {
+        "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+    }
+    cache = SolutionCache(os.path.join(tmp_path, "solutions.sqlite3"))
+    solver_calls: list[int] = []
+
+    def solver(*args: object) -> None:
+        solver_calls.append(1)
+        bfs_search(*args)  # type: ignore[arg-type]
+
+    maze = Maze(MazeFactory(BlockFactory[str](data_to_block_type_map)), solver, cache)
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        maze.create_maze("maze-task-first.txt")
+    for _ in range(2):
+        finished = threading.Event()
+        maze.solve_maze(on_finished=finished.set)
+        assert finished.wait(10)
+        assert maze.shortest_route.blocks is not None
+        assert len(maze.shortest_route.blocks) == 39
+
+    assert len(solver_calls) == 1
+
+    # Same maze file read with other block costs is another maze.
+    maze = Maze(
+        MazeFactory(BlockFactory[str]({**data_to_block_type_map, " ": (BlockType.OPEN, 2)})),
+        solver,
+        cache,
+    )
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        maze.create_maze("maze-task-first.txt")
+    finished = threading.Event()
+    maze.solve_maze(on_finished=finished.set)
+    assert finished.wait(10)
+    assert len(solver_calls) == 2
+    cache.close()
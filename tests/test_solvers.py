@@ -0,0 +1,78 @@
+"""Solver registry related tests."""
+import os
+
+import pytest
+
+from maze.maze import MazeFactory
+from maze.mazeblock import BlockFactory, BlockSpec, BlockType
+from maze.routefinder import bfs_search, dial_search
+from maze.solvers import (
+    AUTO_SOLVER,
+    MazeProfile,
+    SolverRegistry,
+    load_calibration,
+    save_calibration,
+)
+
+_DATA_TO_BLOCK_TYPE_MAP: dict[str, BlockSpec] = {
+    "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN,
+    "~": (BlockType.OPEN, 5),
+}
+
+
+def _create_profile(rows: list[str]) -> MazeProfile:
+    maze_factory = MazeFactory(BlockFactory[str](_DATA_TO_BLOCK_TYPE_MAP))
+    blocks, _ = maze_factory.create_maze_from_rows(rows)
+    return MazeProfile.from_blocks(blocks)
+
+
+def _create_registry(calibration: list[dict[str, object]] | None = None) -> SolverRegistry:
+    registry = SolverRegistry(calibration)  # type: ignore[arg-type]
+    registry.register("bfs", bfs_search)
+    registry.register("dial", dial_search, supports_costs=True)
+    return registry
+
+
+def test_maze_profile_describes_maze() -> None:
+    profile = _create_profile(["#####", "#^ E#", "#####"])
+    assert (profile.rows, profile.columns, profile.exit_count) == (3, 5, 1)
+    assert profile.open_density == pytest.approx(3 / 15)
+    # Only the middle block of the corridor has two open neighbours.
+    assert profile.corridor_ratio == pytest.approx(1 / 3)
+    assert not profile.weighted
+    assert _create_profile(["#####", "#^~E#", "#####"]).weighted
+
+
+def test_auto_picks_fastest_solver_of_the_most_similar_maze(tmp_path: str) -> None:
+    small_profile = _create_profile(["#####", "#^ E#", "#####"])
+    large_profile = _create_profile(["#" * 40] + ["#^" + " " * 36 + "E#"] * 20 + ["#" * 40])
+    calibration_path = os.path.join(tmp_path, "calibration.json")
+    save_calibration(
+        [
+            (small_profile, {"bfs": 2.0, "dial": 1.0}),
+            (large_profile, {"bfs": 1.0, "dial": 2.0}),
+        ],
+        calibration_path,
+    )
+    registry = _create_registry(load_calibration(calibration_path))
+
+    assert registry.names() == [AUTO_SOLVER, "bfs", "dial"]
+    assert registry.resolve(AUTO_SOLVER, small_profile) == "dial"
+    assert registry.resolve(AUTO_SOLVER, large_profile) == "bfs"
+    assert registry.resolve("dial", large_profile) == "dial"
+
+
+def test_auto_picks_only_solvers_supporting_costs_for_weighted_mazes() -> None:
+    registry = _create_registry()
+    assert registry.choose(_create_profile(["#####", "#^ E#", "#####"])) == "bfs"
+    assert registry.choose(_create_profile(["#####", "#^~E#", "#####"])) == "dial"
+
+
+def test_registry_rejects_reserved_and_unknown_names() -> None:
+    registry = _create_registry()
+    with pytest.raises(ValueError):
+        registry.register(AUTO_SOLVER, bfs_search)
+    with pytest.raises(ValueError):
+        registry.register("bfs", bfs_search)
+    with pytest.raises(KeyError):
+        registry.get("unknown")
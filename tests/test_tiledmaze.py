@@ -0,0 +1,96 @@
+"""Tiled maze related tests."""
+import os
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from maze.mazeblock import BlockIndex, BlockType
+from maze.tiledmaze import (
+    TiledMaze,
+    TiledSearchState,
+    convert_text_maze_to_binary,
+    tiled_bfs_search,
+)
+
+_DATA_TO_BLOCK_TYPE_MAP = {
+    "#": BlockType.SOLID, "E": BlockType.EXIT, "^": BlockType.START, " ": BlockType.OPEN
+}
+
+
+def test_tiled_maze_reads_cells_with_limited_resident_tiles() -> None:
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        with TiledMaze(
+            "dummy_maze.txt", _DATA_TO_BLOCK_TYPE_MAP, tile_size=2, max_resident_tiles=1
+        ) as maze:
+            assert (maze.rows, maze.columns) == (3, 3)
+            assert maze.start == BlockIndex(1, 0)
+            assert maze.block_type(0, 1) == BlockType.EXIT
+            assert maze.block_type(2, 1) == BlockType.OPEN
+            assert maze.block_type(2, 2) == BlockType.SOLID
+            assert maze.block_type(-1, 0) == BlockType.SOLID
+            assert maze.resident_tiles == 1
+
+
+def test_tiled_bfs_search_finds_shortest_route() -> None:
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        with TiledMaze(
+            "maze-task-first.txt", _DATA_TO_BLOCK_TYPE_MAP, tile_size=4, max_resident_tiles=4
+        ) as maze:
+            route = tiled_bfs_search(maze)
+            assert route is not None
+            assert route[0] == maze.start
+            assert len(route) == 39
+            assert tiled_bfs_search(maze, 38) is None
+            assert maze.resident_tiles <= 4
+
+
+def test_tiled_bfs_search_keeps_route_with_spilled_state_tiles() -> None:
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        with TiledMaze("maze-task-first.txt", _DATA_TO_BLOCK_TYPE_MAP, tile_size=4) as maze:
+            route = tiled_bfs_search(maze, max_resident_state_tiles=1)
+            assert route == tiled_bfs_search(maze)
+
+
+def test_tiled_search_state_spills_least_recently_used_tiles() -> None:
+    with TiledSearchState(2, max_resident_tiles=2) as state:
+        for tile in range(5):
+            state.set(0, tile * 2, tile + 1)
+        assert state.resident_tiles == 2
+        assert state.allocated_tiles == 5
+        assert [state.get(0, tile * 2) for tile in range(5)] == [1, 2, 3, 4, 5]
+        assert state.get(1, 1) == 0
+        assert state.get(5, 5) == 0
+        assert state.resident_tiles == 2
+
+
+def test_tiled_maze_rejects_block_costs() -> None:
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        with pytest.raises(ValueError):
+            TiledMaze("dummy_maze.txt", _DATA_TO_BLOCK_TYPE_MAP | {"~": (BlockType.OPEN, 5)})
+        with TiledMaze(
+            "dummy_maze.txt", _DATA_TO_BLOCK_TYPE_MAP | {" ": (BlockType.OPEN, 1)}
+        ) as maze:
+            assert maze.block_type(2, 1) == BlockType.OPEN
+
+
+def test_binary_maze_matches_text_maze(tmp_path: str) -> None:
+    shutil.copy(os.path.join("tests", "data", "maze-task-first.txt"), tmp_path)
+    with patch("fileparsing._DATA_DIR", str(tmp_path)):
+        convert_text_maze_to_binary("maze-task-first.txt", "maze.bin", _DATA_TO_BLOCK_TYPE_MAP)
+        with (
+            TiledMaze("maze-task-first.txt", _DATA_TO_BLOCK_TYPE_MAP, tile_size=8) as text_maze,
+            TiledMaze("maze.bin", _DATA_TO_BLOCK_TYPE_MAP, tile_size=8) as binary_maze,
+        ):
+            assert (binary_maze.rows, binary_maze.columns) == (text_maze.rows, text_maze.columns)
+            assert binary_maze.start == text_maze.start
+            for row in range(text_maze.rows):
+                assert binary_maze.row_codes(row) == text_maze.row_codes(row)
+            assert tiled_bfs_search(binary_maze) == tiled_bfs_search(text_maze)
+
+
+def test_tiled_maze_raises_for_invalid_block_data() -> None:
+    with patch("fileparsing._DATA_DIR", os.path.join("tests", "data")):
+        with TiledMaze("dummy_maze.txt", {"#": BlockType.SOLID, "^": BlockType.START}) as maze:
+            with pytest.raises(KeyError):
+                maze.cell(0, 1)
@@ -0,0 +1,75 @@
+"""Viewport related tests."""
+import base64
+import struct
+import zlib
+
+from gui.viewport import (
+    CELL_COLORS,
+    OVERLAY_COLORS,
+    OVERLAY_ROUTE,
+    OVERLAY_VISITED,
+    Viewport,
+    render_overview,
+)
+
+
+def test_viewport_fits_maze_and_limits_visible_cells() -> None:
+    viewport = Viewport(2000, 2000, 800, 600)
+    assert not viewport.is_detailed
+    assert viewport.cell_size * 2000 <= 600
+    assert len(viewport.visible_rows) == 2000
+
+    while not viewport.is_detailed:
+        viewport.zoom_in()
+    assert len(viewport.visible_rows) * viewport.cell_size < 600 + viewport.cell_size
+    assert len(viewport.visible_columns) * viewport.cell_size < 800 + viewport.cell_size
+
+    viewport.scroll(10_000, 10_000)
+    assert viewport.visible_rows.stop == 2000
+    assert viewport.visible_columns.stop == 2000
+    viewport.scroll(-10_000, -10_000)
+    assert (viewport.top_row, viewport.left_column) == (0, 0)
+
+
+def test_viewport_uses_default_cell_size_for_small_mazes() -> None:
+    viewport = Viewport(19, 37, 800, 600)
+    assert viewport.cell_size == 20
+    assert viewport.is_detailed
+
+
+def _decode_png(data: bytes) -> tuple[int, int, bytes]:
+    png = base64.b64decode(data)
+    width, height = struct.unpack(">II", png[16:24])
+    idat_length = struct.unpack(">I", png[33:37])[0]
+    return width, height, zlib.decompress(png[41:41 + idat_length])
+
+
+def test_render_overview_downsamples_cells_and_overlays() -> None:
+    viewport = Viewport(4, 4, 2, 2)
+    assert viewport.cell_size == 0.5
+    # Top left quarter open, top right solid, bottom left start, bottom right open and visited.
+    cell_rows = [bytes([1, 1, 0, 0]), bytes([1, 1, 0, 0]), bytes([2, 0, 1, 1]), bytes([0, 0, 1, 1])]
+    overlay = bytearray(16)
+    overlay[10] = overlay[11] = overlay[14] = overlay[15] = OVERLAY_VISITED
+    width, height, raw_data = _decode_png(render_overview(viewport, cell_rows, overlay))
+    assert (width, height) == (2, 2)
+    assert raw_data == b"\x00" + bytes([255, 255, 255, 0, 0, 0]) + b"\x00" + bytes(
+        [255, 0, 0, 255, 255, 0]
+    )
+
+    # Route cell over open cells.
+    overlay[5] = OVERLAY_ROUTE
+    _, _, raw_data = _decode_png(render_overview(viewport, cell_rows, overlay))
+    assert raw_data[1:4] == bytes(OVERLAY_COLORS[OVERLAY_ROUTE])
+    # Start cell stays visible under route cells.
+    overlay[8] = OVERLAY_ROUTE
+    _, _, raw_data = _decode_png(render_overview(viewport, cell_rows, overlay))
+    assert raw_data[8:11] == bytes(CELL_COLORS[2])
+
+
+def test_render_overview_averages_colors() -> None:
+    viewport = Viewport(2, 2, 1, 1)
+    cell_rows = [bytes([1, 1]), bytes([1, 0])]
+    overlay = bytearray([OVERLAY_VISITED, 0, 0, 0])
+    _, _, raw_data = _decode_png(render_overview(viewport, cell_rows, overlay))
+    assert raw_data == b"\x00" + bytes([(2 * 255 + 255) // 4, (2 * 255 + 255) // 4, 2 * 255 // 4])